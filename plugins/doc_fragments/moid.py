@@ -13,6 +13,31 @@ class ModuleDocFragment(object):
         _terms:
             description: Path to query.
             required: true
+        vcenter_ca_bundle:
+            description:
+                - The path of a PEM file with the certificate authorities trusted to validate
+                  the certificate of vCenter, instead of the ones of the system.
+                - If the value is not specified in the task, the value of environment variable
+                  C(VMWARE_CA_BUNDLE) will be used instead.
+            type: path
+            version_added: 4.0.0
+        vcenter_client_cert:
+            description:
+                - The path of a PEM file with a client certificate, sent during the TLS handshake
+                  with vCenter or with the proxy in front of it.
+                - The file can also contain the private key of the certificate.
+                - If the value is not specified in the task, the value of environment variable
+                  C(VMWARE_CLIENT_CERT) will be used instead.
+            type: path
+            version_added: 4.0.0
+        vcenter_client_key:
+            description:
+                - The path of the private key of I(vcenter_client_cert), when it is not in
+                  the same file.
+                - If the value is not specified in the task, the value of environment variable
+                  C(VMWARE_CLIENT_KEY) will be used instead.
+            type: path
+            version_added: 4.0.0
         vcenter_hostname:
             description:
                 - The hostname or IP address of the vSphere vCenter.
@@ -34,6 +59,9 @@ class ModuleDocFragment(object):
                 - The file will be stored on the host that run the module.
                 - If the value is not specified in the task, the value of environment variable
                   C(VMWARE_REST_LOG_FILE) will be used instead.
+                - With a C(.jsonl) extension, each request and its answer are recorded as a JSON
+                  document per line, with the headers and the bodies. The credentials and the
+                  session id are masked.
             type: str
         vcenter_username:
             description:
@@ -28,15 +28,368 @@
 # USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 #
 
+import asyncio
+import collections
+import contextvars
 import hashlib
 import importlib
 import json
+import os
 import re
+import ssl
+import time
 import urllib.parse
+import weakref
 
 from ansible.module_utils.basic import missing_required_lib
 from ansible.module_utils.parsing.convert_bool import boolean
 
+TURBO_EXCEPTIONS = (
+    "ansible_collections.cloud.common.plugins.module_utils.turbo.exceptions"
+)
+
+
+def lazy_import(name):
+    """Import a module on its first use, then return it from a cache.
+
+    importlib.import_module() resolves the parent packages and takes the
+    import lock on each call, and it was called for each request.
+    """
+    try:
+        return lazy_import._cache[name]
+    except KeyError:
+        module = lazy_import._cache[name] = importlib.import_module(name)
+        return module
+
+
+lazy_import._cache = {}
+
+
+def get_aiohttp():
+    try:
+        return lazy_import("aiohttp")
+    except ImportError:
+        exceptions = lazy_import(TURBO_EXCEPTIONS)
+        raise exceptions.EmbeddedModuleFailure(msg=missing_required_lib("aiohttp"))
+
+
+# By order of preference, VMWARE_JSON_CODEC forces one of them
+JSON_CODECS = ["orjson", "ujson", "json"]
+
+
+def _orjson_codec(orjson):
+    # aiohttp expects the serializer to return a str
+    return orjson.loads, lambda obj: orjson.dumps(obj).decode()
+
+
+def get_json_codec(name=None):
+    """Return the (name, loads, dumps) of the fastest JSON library available."""
+    name = name or os.environ.get("VMWARE_JSON_CODEC")
+    if name in get_json_codec._cache:
+        return get_json_codec._cache[name]
+    if name and name not in JSON_CODECS:
+        raise ValueError(f"Unknown JSON codec {name}, use one of {JSON_CODECS}")
+    for candidate in [name] if name else JSON_CODECS:
+        try:
+            lib = importlib.import_module(candidate)
+        except ImportError:
+            continue
+        if candidate == "orjson":
+            loads, dumps = _orjson_codec(lib)
+        else:
+            loads, dumps = lib.loads, lib.dumps
+        codec = get_json_codec._cache[name] = (candidate, loads, dumps)
+        return codec
+    raise ValueError(f"Cannot import the JSON codec {name}")
+
+
+get_json_codec._cache = {}
+
+
+def get_response_class(aiohttp, loads):
+    """Return a ClientResponse class that decodes the JSON bodies with loads."""
+    if loads not in get_response_class._cache:
+
+        class ClientResponse(aiohttp.ClientResponse):
+            async def json(self, *args, **kwargs):
+                kwargs.setdefault("loads", loads)
+                return await super().json(*args, **kwargs)
+
+        get_response_class._cache[loads] = ClientResponse
+    return get_response_class._cache[loads]
+
+
+get_response_class._cache = {}
+
+
+READ_METHODS = ["GET", "HEAD", "OPTIONS"]
+
+
+class TokenBucket:
+    """Allow `rate` requests per second, with bursts of up to `burst` requests.
+
+    The tokens are reserved in the order of arrival, a request waits until its
+    token is available.
+    """
+
+    def __init__(self, rate, burst=None):
+        self.rate = rate
+        self.burst = burst or max(rate, 1)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self.stats = {"requests": 0, "queued": 0, "wait_total": 0.0, "wait_max": 0.0}
+
+    def reserve(self):
+        """Take a token and return the time to wait before it is available."""
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate) - 1
+        self._updated = now
+        return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self):
+        wait = self.reserve()
+        self.stats["requests"] += 1
+        if wait:
+            self.stats["queued"] += 1
+            self.stats["wait_total"] += wait
+            self.stats["wait_max"] = max(self.stats["wait_max"], wait)
+            await asyncio.sleep(wait)
+        return wait
+
+
+def parse_host_setting(value, hostname):
+    """Read a setting for a vCenter, either "20" or "vc1=20,vc2=5,*=10"."""
+    if not value:
+        return None
+    limits = {}
+    for item in value.split(","):
+        host, _sep, limit = item.strip().rpartition("=")
+        limits[host or "*"] = float(limit)
+        if limits[host or "*"] < 0:
+            raise ValueError(f"{item} is negative")
+    return limits.get(hostname, limits.get("*"))
+
+
+def get_rate_limiters(hostname):
+    """Return the (reads, writes) TokenBucket of a vCenter, or None.
+
+    The buckets are shared by all the sessions to the vCenter. They are
+    configured on first use with VMWARE_RATE_LIMIT, VMWARE_RATE_LIMIT_WRITES and
+    VMWARE_RATE_LIMIT_BURST. Without VMWARE_RATE_LIMIT_WRITES, the reads and the
+    writes share the same bucket.
+    """
+    if hostname not in get_rate_limiters._registry:
+        rate = parse_host_setting(os.environ.get("VMWARE_RATE_LIMIT"), hostname)
+        write_rate = parse_host_setting(
+            os.environ.get("VMWARE_RATE_LIMIT_WRITES"), hostname
+        )
+        burst = parse_host_setting(os.environ.get("VMWARE_RATE_LIMIT_BURST"), hostname)
+        reads = TokenBucket(rate, burst) if rate else None
+        writes = TokenBucket(write_rate, burst) if write_rate else reads
+        get_rate_limiters._registry[hostname] = (reads, writes)
+    return get_rate_limiters._registry[hostname]
+
+
+get_rate_limiters._registry = {}
+
+
+# Answers of an unavailable vCenter. The vAPI errors come with a JSON body
+# and are not counted: a guest operation answers 503 when the VMware Tools
+# are not running.
+UNAVAILABLE_STATUSES = [500, 502, 503, 504]
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+class CircuitBreaker:
+    """Fail fast once a vCenter had `threshold` consecutive failures.
+
+    After `cooldown` seconds, a single request is let through as a probe, the
+    circuit is closed again if it succeeds.
+    """
+
+    def __init__(self, hostname, threshold, cooldown):
+        self.hostname = hostname
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at = None
+        self.probe_started_at = None
+
+    def before_request(self):
+        """Return True if the request is the probe, raise if it is refused."""
+        if self.opened_at is None:
+            return False
+        now = time.monotonic()
+        remaining = self.opened_at + self.cooldown - now
+        if remaining <= 0 and (
+            self.probe_started_at is None
+            # The probe never reported back, e.g. it has been cancelled
+            or self.probe_started_at + self.cooldown < now
+        ):
+            self.probe_started_at = now
+            return True
+        if remaining > 0:
+            retry = f"the next attempt is in {remaining:.0f}s"
+        else:
+            retry = "a new attempt is in progress"
+        raise CircuitOpenError(
+            f"vCenter {self.hostname} is unavailable:"
+            f" {self.failures} consecutive failures, {retry}"
+        )
+
+    def record(self, success, probe=False):
+        if probe:
+            self.probe_started_at = None
+        if success:
+            self.failures = 0
+            self.opened_at = None
+            return
+        self.failures += 1
+        if probe or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()
+
+
+def get_circuit_breaker(hostname):
+    """Return the CircuitBreaker of a vCenter, or None.
+
+    VMWARE_CIRCUIT_BREAKER_THRESHOLD is the number of consecutive failures,
+    the circuit breaker is disabled when it is not set, and
+    VMWARE_CIRCUIT_BREAKER_COOLDOWN the time before a new attempt (30s by
+    default).
+    """
+    if hostname not in get_circuit_breaker._registry:
+        threshold = parse_host_setting(
+            os.environ.get("VMWARE_CIRCUIT_BREAKER_THRESHOLD"), hostname
+        )
+        cooldown = parse_host_setting(
+            os.environ.get("VMWARE_CIRCUIT_BREAKER_COOLDOWN", "30"), hostname
+        )
+        breaker = None
+        if threshold:
+            breaker = CircuitBreaker(hostname, threshold, cooldown or 0)
+        get_circuit_breaker._registry[hostname] = breaker
+    return get_circuit_breaker._registry[hostname]
+
+
+get_circuit_breaker._registry = {}
+
+
+def get_ssl_context(
+    hostname, validate_certs, ca_bundle=None, client_cert=None, client_key=None
+):
+    """Return the SSLContext of a vCenter, or False to skip the verification.
+
+    The context is built once per vCenter and shared by all the sessions and
+    connectors of the process, the CA bundle is not loaded again for each one.
+    """
+    key = (hostname, validate_certs, ca_bundle, client_cert, client_key)
+    if key not in get_ssl_context._registry:
+        if not validate_certs and not client_cert:
+            context = False
+        else:
+            context = ssl.create_default_context(cafile=ca_bundle)
+            if not validate_certs:
+                context.check_hostname = False
+                context.verify_mode = ssl.CERT_NONE
+            if client_cert:
+                context.load_cert_chain(client_cert, client_key)
+        get_ssl_context._registry[key] = context
+    return get_ssl_context._registry[key]
+
+
+get_ssl_context._registry = {}
+
+
+# Never written in the REST records
+REDACTED_HEADERS = ["authorization", "vmware-api-session-id", "set-cookie"]
+
+
+def record_headers(headers):
+    return {
+        k: "********" if k.lower() in REDACTED_HEADERS else v
+        for k, v in headers.items()
+    }
+
+
+# The keys of the JSON bodies whose value is masked in the REST records
+REDACTED_KEYS = ["credential", "password", "secret"]
+# The larger request bodies, e.g: an upload, are not kept for the REST records
+RECORD_BODY_LIMIT = 64 * 1024
+
+
+def redact(data):
+    if isinstance(data, dict):
+        return {
+            k: "********" if any(i in k.lower() for i in REDACTED_KEYS) else redact(v)
+            for k, v in data.items()
+        }
+    if isinstance(data, list):
+        return [redact(i) for i in data]
+    return data
+
+
+def is_json(content_type):
+    return (content_type or "").split(";")[0].strip() == "application/json"
+
+
+def record_body(body, content_type, size):
+    """Return the fields of a REST record that hold a request or answer body.
+
+    Only the JSON bodies are written, the other ones, e.g: a file transfer,
+    are reduced to their size.
+    """
+    if body and is_json(content_type):
+        try:
+            return {"json": redact(json.loads(body))}
+        except ValueError:
+            pass
+    return {"size": size} if size else {}
+
+
+async def build_rest_record(trace_config_ctx, params):
+    """Describe a request and its answer, as written in a .jsonl REST log."""
+    response = params.response
+    request_body = None
+    if trace_config_ctx.size <= RECORD_BODY_LIMIT:
+        request_body = b"".join(trace_config_ctx.chunks)
+    # A JSON answer is read by the module anyway, the other ones, e.g: a
+    # download, are not read here to still be streamed
+    answer_body = None
+    size = response.content_length
+    if is_json(response.content_type):
+        answer_body = await response.read()
+        size = len(answer_body)
+    answer = record_body(answer_body, response.content_type, size)
+    if params.url.path == "/rest/com/vmware/cis/session" and "json" in answer:
+        answer = {"json": {"value": "********"}}  # the session id
+    record = {
+        "time": trace_config_ctx.time,
+        "duration": round(time.monotonic() - trace_config_ctx.started, 6),
+        "request": dict(
+            method=params.method,
+            url=str(params.url),
+            headers=record_headers(params.headers),
+            **record_body(
+                request_body,
+                params.headers.get("content-type"),
+                trace_config_ctx.size,
+            ),
+        ),
+        "response": dict(
+            status=response.status,
+            headers=record_headers(response.headers),
+            **answer,
+        ),
+    }
+    if hasattr(trace_config_ctx, "bucket"):
+        # The time waited for the rate limit, not included in the duration
+        record["queued"] = round(trace_config_ctx.queued, 6)
+    return record
+
 
 async def open_session(
     vcenter_hostname=None,
@@ -44,6 +397,9 @@ async def open_session(
     vcenter_password=None,
     validate_certs=True,
     log_file=None,
+    ca_bundle=None,
+    client_cert=None,
+    client_key=None,
 ):
     validate_certs = boolean(validate_certs)
     m = hashlib.sha256()
@@ -53,47 +409,184 @@ async def open_session(
     if log_file:
         m.update(log_file.encode())
     m.update(b"yes" if validate_certs else b"no")
+    for path in [ca_bundle, client_cert, client_key]:
+        m.update(b"\0" + (path or "").encode())
     digest = m.hexdigest()
     # TODO: Handle session timeout
     if digest in open_session._pool:
         return open_session._pool[digest]
 
-    exceptions = importlib.import_module(
-        "ansible_collections.cloud.common.plugins.module_utils.turbo.exceptions"
-    )
+    # The tasks of the daemon that start at the same time with the same
+    # credentials must share one login, or the extra sessions are leaked
+    lock = open_session._locks.setdefault(digest, asyncio.Lock())
+    async with lock:
+        if digest not in open_session._pool:
+            open_session._pool[digest] = await _login(
+                vcenter_hostname,
+                vcenter_username,
+                vcenter_password,
+                validate_certs,
+                log_file,
+                ca_bundle,
+                client_cert,
+                client_key,
+            )
+    return open_session._pool[digest]
+
+
+async def _login(
+    vcenter_hostname,
+    vcenter_username,
+    vcenter_password,
+    validate_certs,
+    log_file,
+    ca_bundle,
+    client_cert,
+    client_key,
+):
+    exceptions = lazy_import(TURBO_EXCEPTIONS)
+    aiohttp = get_aiohttp()
+
     try:
-        aiohttp = importlib.import_module("aiohttp")
-    except ImportError:
-        raise exceptions.EmbeddedModuleFailure(msg=missing_required_lib("aiohttp"))
+        reads, writes = get_rate_limiters(vcenter_hostname)
+        breaker = get_circuit_breaker(vcenter_hostname)
+    except ValueError as e:
+        raise exceptions.EmbeddedModuleFailure(msg=f"Invalid setting: {e}")
+    trace_config = aiohttp.TraceConfig()
 
-    if not aiohttp:
-        raise exceptions.EmbeddedModuleFailure(msg="Failed to import aiohttp")
+    async def start_step(session, trace_config_ctx, params):
+        deadline = current_deadline.get()
+        if deadline:
+            trace_config_ctx.step = f"{params.method} {params.url}"
+            deadline.start(trace_config_ctx.step)
 
-    if log_file:
-        trace_config = aiohttp.TraceConfig()
+    async def end_step(session, trace_config_ctx, params):
+        deadline = current_deadline.get()
+        if deadline and hasattr(trace_config_ctx, "step"):
+            deadline.end(trace_config_ctx.step)
+            # Not a failure of vCenter, the task ran out of time
+            trace_config_ctx.deadline_expired = deadline.expired()
+
+    async def drop_plan_cache(session, trace_config_ctx, params):
+        # The GET answers cached for check mode may be outdated
+        action = params.url.query.get("action")
+        if params.method not in READ_METHODS and action not in READ_ONLY_ACTIONS:
+            PlanningSession._caches.pop(session, None)
+
+    trace_config.on_request_start.append(start_step)
+    trace_config.on_request_end.append(end_step)
+    trace_config.on_request_end.append(drop_plan_cache)
+    trace_config.on_request_exception.append(end_step)
+
+    if breaker:
 
-        async def on_request_end(session, trace_config_ctx, params):
+        async def check_circuit(session, trace_config_ctx, params):
+            try:
+                trace_config_ctx.probe = breaker.before_request()
+            except CircuitOpenError as e:
+                raise exceptions.EmbeddedModuleFailure(msg=str(e))
+
+        async def record_answer(session, trace_config_ctx, params):
+            failed = params.response.status in UNAVAILABLE_STATUSES and (
+                params.response.content_type != "application/json"
+            )
+            breaker.record(not failed, trace_config_ctx.probe)
+
+        async def record_exception(session, trace_config_ctx, params):
+            if not hasattr(trace_config_ctx, "probe"):
+                return  # refused by the circuit breaker
+            if isinstance(
+                params.exception, (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+            ) and not getattr(trace_config_ctx, "deadline_expired", False):
+                breaker.record(False, trace_config_ctx.probe)
+            elif trace_config_ctx.probe:
+                breaker.probe_started_at = None
+
+        trace_config.on_request_start.append(check_circuit)
+        trace_config.on_request_end.append(record_answer)
+        trace_config.on_request_exception.append(record_exception)
+
+    if reads or writes:
+
+        async def wait_for_token(session, trace_config_ctx, params):
+            bucket = reads if params.method in READ_METHODS else writes
+            if bucket:
+                trace_config_ctx.bucket = bucket
+                trace_config_ctx.queued = await bucket.acquire()
+
+        trace_config.on_request_start.append(wait_for_token)
+
+    if log_file and log_file.endswith(".jsonl"):
+
+        async def start_record(session, trace_config_ctx, params):
+            trace_config_ctx.time = time.time()
+            trace_config_ctx.started = time.monotonic()
+            trace_config_ctx.chunks = []
+            trace_config_ctx.size = 0
+
+        async def record_chunk(session, trace_config_ctx, params):
+            trace_config_ctx.size += len(params.chunk)
+            if trace_config_ctx.size <= RECORD_BODY_LIMIT:
+                trace_config_ctx.chunks.append(params.chunk)
+
+        async def record_request(session, trace_config_ctx, params):
+            record = await build_rest_record(trace_config_ctx, params)
+            with open(log_file, "a+", encoding="utf-8") as fd:
+                fd.write(json.dumps(record) + "\n")
+
+        trace_config.on_request_start.append(start_record)
+        trace_config.on_request_chunk_sent.append(record_chunk)
+        trace_config.on_request_end.append(record_request)
+
+    elif log_file:
+
+        async def log_request(session, trace_config_ctx, params):
             with open(log_file, "a+", encoding="utf-8") as fd:
                 answer = await params.response.text()
+                queued = ""
+                if getattr(trace_config_ctx, "queued", 0):
+                    # The wait of this request, then the totals of its bucket
+                    stats = trace_config_ctx.bucket.stats
+                    queued = (
+                        f"  queued: {trace_config_ctx.queued:.3f}s"
+                        f" ({stats['queued']}/{stats['requests']} requests queued,"
+                        f" {stats['wait_total']:.3f}s in total)\n"
+                    )
                 fd.write(
                     f"{params.method}: {params.url}\n"
                     f"headers: {params.headers}\n"
                     f"  status: {params.response.status}\n"
+                    f"{queued}"
                     f"  answer: {answer}\n\n"
                 )
 
-        trace_config.on_request_end.append(on_request_end)
-        trace_configs = [trace_config]
-    else:
-        trace_configs = []
+        trace_config.on_request_end.append(log_request)
+
+    trace_configs = [trace_config]
+
+    try:
+        _codec, loads, dumps = get_json_codec()
+    except ValueError as e:
+        raise exceptions.EmbeddedModuleFailure(msg=str(e))
+    codec_args = {
+        "json_serialize": dumps,
+        "response_class": get_response_class(aiohttp, loads),
+    }
+
+    try:
+        ssl_context = get_ssl_context(
+            vcenter_hostname, validate_certs, ca_bundle, client_cert, client_key
+        )
+    except (OSError, ssl.SSLError) as e:
+        raise exceptions.EmbeddedModuleFailure(msg=f"Invalid TLS setting: {e}")
 
     auth = aiohttp.BasicAuth(vcenter_username, vcenter_password)
-    if validate_certs:
-        connector = aiohttp.TCPConnector(limit=20)
-    else:
-        connector = aiohttp.TCPConnector(limit=20, ssl=False)
+    connector = aiohttp.TCPConnector(limit=20, ssl=ssl_context)
     async with aiohttp.ClientSession(
-        connector=connector, connector_owner=False, trace_configs=trace_configs
+        connector=connector,
+        connector_owner=False,
+        trace_configs=trace_configs,
+        **codec_args,
     ) as session:
         try:
             async with session.post(
@@ -108,11 +601,11 @@ async def open_session(
                             resp.status, await resp.text()
                         )
                     )
-                json = await resp.json()
+                _json = await resp.json()
         except aiohttp.client_exceptions.ClientConnectorError as e:
             raise exceptions.EmbeddedModuleFailure(f"Authentication failure: {e}")
 
-    session_id = json["value"]
+    session_id = _json["value"]
     session = aiohttp.ClientSession(
         connector=connector,
         headers={
@@ -121,12 +614,50 @@ async def open_session(
         },
         connector_owner=False,
         trace_configs=trace_configs,
+        **codec_args,
     )
-    open_session._pool[digest] = session
     return session
 
 
 open_session._pool = {}
+open_session._locks = {}
+
+
+def _cache_path(key, cache_dir):
+    return os.path.join(cache_dir, hashlib.sha256(key.encode()).hexdigest() + ".json")
+
+
+def load_cache(key, cache_dir=None):
+    """Return the value stored with store_cache(), or None.
+
+    The values are kept in memory for the lifetime of the process, and
+    optionally as JSON files in `cache_dir`.
+    """
+    if key in load_cache._memory:
+        return load_cache._memory[key]
+    if not cache_dir:
+        return None
+    try:
+        with open(_cache_path(key, cache_dir), encoding="utf-8") as fd:
+            value = json.load(fd)
+    except (OSError, ValueError):
+        return None
+    load_cache._memory[key] = value
+    return value
+
+
+load_cache._memory = {}
+
+
+def store_cache(key, value, cache_dir=None):
+    load_cache._memory[key] = value
+    if not cache_dir:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    path = _cache_path(key, cache_dir)
+    with open(path + ".tmp", "w", encoding="utf-8") as fd:
+        json.dump(value, fd)
+    os.replace(path + ".tmp", path)
 
 
 def gen_args(params, in_query_parameter):
@@ -150,21 +681,110 @@ def gen_args(params, in_query_parameter):
     return "?" + urllib.parse.urlencode(elements, quote_via=urllib.parse.quote)
 
 
-def session_timeout(params):
-    exceptions = importlib.import_module(
-        "ansible_collections.cloud.common.plugins.module_utils.turbo.exceptions"
-    )
+class Deadline:
+    """The time left to a task, shared by all its requests and sub-tasks.
+
+    The requests in flight are tracked to report which step ran out of time.
+    """
+
+    def __init__(self, timeout):
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+        self.in_flight = []
+        self.completed = 0
+        self.last = None
+
+    def remaining(self):
+        return self.expires_at - time.monotonic()
+
+    def expired(self):
+        return self.remaining() <= 0
+
+    def start(self, step):
+        self.in_flight.append(step)
+
+    def end(self, step):
+        self.in_flight.remove(step)
+        self.completed += 1
+        self.last = step
+
+    def report(self):
+        msg = f"The task did not complete within task_timeout ({self.timeout}s)"
+        if self.in_flight:
+            msg += f", it was waiting for {self.in_flight[0]}"
+            if len(self.in_flight) > 1:
+                msg += f" and {len(self.in_flight) - 1} other requests"
+        elif self.last:
+            msg += f", its last request was {self.last}"
+        return msg + f". Requests completed: {self.completed}."
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+current_deadline = contextvars.ContextVar("vmware_rest_deadline", default=None)
+
+
+async def run_with_deadline(coro, timeout):
+    """Await coro, but return a failure once timeout seconds have elapsed.
+
+    The deadline is visible to all the requests of coro through
+    current_deadline. When it expires, coro is cancelled with its
+    outstanding requests and sub-tasks.
+    """
+    if not timeout:
+        return await coro
+    deadline = Deadline(timeout)
+    # The task, and the tasks it starts, inherit a copy of the context
+    token = current_deadline.set(deadline)
     try:
-        aiohttp = importlib.import_module("aiohttp")
-    except ImportError:
-        raise exceptions.EmbeddedModuleFailure(msg=missing_required_lib("aiohttp"))
+        task = asyncio.ensure_future(coro)
+    finally:
+        current_deadline.reset(token)
+    try:
+        done, _pending = await asyncio.wait([task], timeout=timeout)
+    except asyncio.CancelledError:
+        task.cancel()
+        raise
+    if not done:
+        msg = deadline.report()  # before the cancellation empties in_flight
+        task.cancel()
+        await asyncio.wait([task])
+        if not task.cancelled():
+            task.exception()  # it failed before the cancellation, it is reported
+        return {"failed": True, "msg": msg}
+    try:
+        return task.result()
+    except DeadlineExceeded:
+        return {"failed": True, "msg": deadline.report()}
+    except asyncio.TimeoutError:
+        # A request timeout cut to the remaining time
+        if not deadline.expired():
+            raise
+        return {"failed": True, "msg": deadline.report()}
+
+
+def session_timeout(params):
+    timeout = params.get("session_timeout")
+    deadline = current_deadline.get()
+    if deadline:
+        remaining = deadline.remaining()
+        if remaining <= 0:
+            raise DeadlineExceeded(deadline.report())
+        if not timeout or remaining < timeout:
+            aiohttp = get_aiohttp()
+            return {"timeout": aiohttp.ClientTimeout(total=remaining)}
+    if not timeout:
+        return {}
+    # ClientTimeout is immutable, the same one is shared by the requests
+    if timeout not in session_timeout._cache:
+        aiohttp = get_aiohttp()
+        session_timeout._cache[timeout] = aiohttp.ClientTimeout(total=timeout)
+    return {"timeout": session_timeout._cache[timeout]}
 
-    if not aiohttp:
-        raise exceptions.EmbeddedModuleFailure(msg="Failed to import aiohttp")
-    out = {}
-    if params.get("session_timeout"):
-        out["timeout"] = aiohttp.ClientTimeout(total=params.get("session_timeout"))
-    return out
+
+session_timeout._cache = {}
 
 
 async def update_changed_flag(data, status, operation):
@@ -179,16 +799,14 @@ async def update_changed_flag(data, status, operation):
     elif isinstance(data, bool):
         data = {"value": data}
 
-    if isinstance(data["value"], str) and data["value"][0] in [
-        "{",
-        "]",
-    ]:  # e.g: appliance_infraprofile_configs
-        data["value"] == json.loads(data["value"])
-
     if status == 500:
         data["failed"] = True
         data["changed"] = False
-    elif operation in ["create", "clone", "instant_clone"] and status in [200, 201]:
+    elif operation in ["create", "clone", "instant_clone"] and status in [
+        200,
+        201,
+        204,
+    ]:
         data["failed"] = False
         data["changed"] = True
     elif operation == "update" and status in [200, 204]:
@@ -269,6 +887,43 @@ async def update_changed_flag(data, status, operation):
     return data
 
 
+def compact(data):
+    """Recursively drop the null and empty fields."""
+    if isinstance(data, dict):
+        items = ((k, compact(v)) for k, v in data.items())
+        return {k: v for k, v in items if v is not None and v != [] and v != {}}
+    if isinstance(data, list):
+        return [compact(i) for i in data]
+    return data
+
+
+def _compact_result(result, flatten):
+    if "endpoints" in result:
+        endpoints = {
+            k: _compact_result(v, flatten) for k, v in result["endpoints"].items()
+        }
+        return dict(result, endpoints=endpoints)
+    if "value" not in result:
+        return result
+    result = dict(result, value=compact(result["value"]))
+    if flatten and isinstance(result["value"], dict):
+        value = result.pop("value")
+        result = dict(value, **result)
+    return result
+
+
+def compact_result(result, flatten=False):
+    """Compact the value of a result, and report the size before and after.
+
+    With flatten, the keys of a dictionary value are moved to the top level.
+    """
+    dumps = get_json_codec()[2]
+    size = len(dumps(result))
+    result = _compact_result(result, flatten)
+    result["compact"] = {"size_before": size, "size_after": len(dumps(result))}
+    return result
+
+
 async def list_devices(session, url):
     pass
 
@@ -277,9 +932,141 @@ async def list_devices(session, url):
         return _json
 
 
-async def build_full_device_list(session, url, device_list):
-    import asyncio
+async def gather_bounded(coros, concurrency=None):
+    """Like asyncio.gather(), but with at most `concurrency` coroutines running."""
+    if not concurrency:
+        return await asyncio.gather(*coros)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _run(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*[_run(coro) for coro in coros])
+
+
+async def gather_bounded_by_key(items, concurrency=None, key_concurrency=None):
+    """Like gather_bounded(), for a list of (key, coroutine) pairs.
+
+    At most `key_concurrency` coroutines with the same key run at once.
+    """
+    size = len(items) or 1
+    semaphore = asyncio.Semaphore(concurrency or size)
+    semaphores = collections.defaultdict(
+        lambda: asyncio.Semaphore(key_concurrency or size)
+    )
+
+    async def _run(key, coro):
+        # Take the slot of the key first, to not hold a global slot idle
+        async with semaphores[key]:
+            async with semaphore:
+                return await coro
+
+    return await asyncio.gather(*[_run(key, coro) for key, coro in items])
+
+
+async def get_vm_hosts(params, session):
+    """Return the identifier of the ESXi host of each virtual machine."""
+    url = "https://{vcenter_hostname}/api/vcenter/host".format(**params)
+    async with session.get(url, **session_timeout(params)) as resp:
+        hosts = [h["host"] for h in await resp.json()]
+
+    async def _list_vms(host):
+        url = "https://{vcenter_hostname}/api/vcenter/vm".format(**params)
+        url += gen_args({"hosts": host}, ["hosts"])
+        async with session.get(url, **session_timeout(params)) as resp:
+            return [vm["vm"] for vm in await resp.json()]
+
+    vm_hosts = {}
+    for host, vms in zip(hosts, await asyncio.gather(*map(_list_vms, hosts))):
+        vm_hosts.update(dict.fromkeys(vms, host))
+    return vm_hosts
+
+
+async def iter_bounded(coros, concurrency):
+    """Yield the results of the coroutines as they complete.
+
+    The coroutines are consumed lazily, so at most `concurrency` of them
+    exist at any time.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    pending = set()
+    try:
+        for coro in coros:
+            if len(pending) >= concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.ensure_future(coro))
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def iter_ordered(coros, concurrency):
+    """Yield the results of the coroutines in order.
+
+    At most `concurrency` coroutines run ahead of the one being consumed.
+    """
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+    pending = collections.deque()
+    try:
+        for coro in coros:
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+            pending.append(asyncio.ensure_future(coro))
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+async def wait_for(predicate, timeout, interval=1.0, max_interval=30.0):
+    """Call predicate() until it returns a truthy value or the timeout expires.
+
+    The delay between two calls grows from `interval` to `max_interval`.
+    Returns the last value of predicate().
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        result = await predicate()
+        remaining = deadline - time.monotonic()
+        if result or remaining <= 0:
+            return result
+        await asyncio.sleep(min(interval, remaining))
+        interval = min(interval * 1.5, max_interval)
+
 
+def select_fields(value, fields):
+    """Only keep the given keys of a resource, "id" is always preserved."""
+    if not fields or not isinstance(value, dict):
+        return value
+    return {k: v for k, v in value.items() if k in fields or k == "id"}
+
+
+async def dump_jsonl(path, items):
+    """Write each item of an async iterable as a JSON line."""
+    count = 0
+    with open(path, "w", encoding="utf-8") as fd:
+        async for item in items:
+            fd.write(json.dumps(item) + "\n")
+            count += 1
+        size = fd.tell()
+    return {"path": path, "count": count, "bytes": size}
+
+
+async def build_full_device_list(session, url, device_list, concurrency=None):
     device_ids = []
 
     if isinstance(device_list, list):
@@ -297,11 +1084,9 @@ async def build_full_device_list(session, url, device_list):
             return device_list
         device_ids.append(fields[0])
 
-    tasks = [
-        asyncio.ensure_future(get_device_info(session, url, _id)) for _id in device_ids
-    ]
-
-    return [await i for i in tasks]
+    return await gather_bounded(
+        [get_device_info(session, url, _id) for _id in device_ids], concurrency
+    )
 
 
 async def get_device_info(session, url, _id):
@@ -343,9 +1128,7 @@ async def exists(
             elif isinstance(device, list):
                 v = device
             else:
-                exceptions = importlib.import_module(
-                    "ansible_collections.cloud.common.plugins.module_utils.turbo.exceptions"
-                )
+                exceptions = lazy_import(TURBO_EXCEPTIONS)
                 raise exceptions.EmbeddedModuleFailure(msg="Unexpect type")
 
             if isinstance(k, int) or isinstance(v, str):
@@ -367,6 +1150,236 @@ async def exists(
             return device
 
 
+# POST actions that only read data, they are sent even in check mode
+READ_ONLY_ACTIONS = ["filter", "find"]
+PLAN_CACHE_TTL = 120
+
+
+class _StoredResponse:
+    """Minimal stand-in for aiohttp's ClientResponse, served from memory."""
+
+    def __init__(self, status, headers=None, body=b""):
+        self.status = status
+        self.headers = headers if headers is not None else {}
+        self._body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        pass
+
+    async def read(self):
+        return self._body
+
+    async def text(self, encoding="utf-8"):
+        return self._body.decode(encoding)
+
+    async def json(self, loads=None, **kwargs):
+        if not self._body:
+            return None
+        return (loads or get_json_codec()[1])(self._body)
+
+
+class _PendingResponse:
+    def __init__(self, coro):
+        self._coro = coro
+
+    async def __aenter__(self):
+        return await self._coro
+
+    async def __aexit__(self, *exc):
+        pass
+
+
+def _is_noop(body, state):
+    """Tell if writing body would leave the state read by a GET unchanged."""
+    if isinstance(state, dict) and list(state) == ["value"]:  # 7.0.2
+        state = state["value"]
+    if isinstance(body, dict) and isinstance(state, dict):
+        return all(k in state and _is_noop(v, state[k]) for k, v in body.items())
+    if isinstance(body, dict) and len(body) == 1:
+        # e.g: {"servers": [...]} sets the list returned by the GET
+        return _is_noop(next(iter(body.values())), state)
+    return body == state
+
+
+class PlanningSession:
+    """Proxy of a vCenter session used in check mode.
+
+    The GET requests are sent to vCenter, the results are shared between all
+    the tasks planning against the same session, until the session sends a
+    write request or is closed. The write requests are only recorded in the
+    plan, a DELETE only if the GET of its URL finds the resource.
+    """
+
+    def __init__(self, session):
+        self._session = session
+        self._cache = PlanningSession._caches.setdefault(session, {})
+        self.plan = []
+        self.changes = 0
+
+    async def _read(self, url, kwargs):
+        async with self._session.get(url, **kwargs) as resp:
+            return _StoredResponse(resp.status, resp.headers.copy(), await resp.read())
+
+    async def _cached_read(self, url, kwargs):
+        key = str(url)
+        now = time.monotonic()
+        expiration, future = self._cache.get(key, (0, None))
+        if expiration < now:
+            for cached_key, (cached_until, _future) in list(self._cache.items()):
+                if cached_until < now:
+                    del self._cache[cached_key]
+            future = asyncio.ensure_future(self._read(url, kwargs))
+            self._cache[key] = (now + PLAN_CACHE_TTL, future)
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            self._cache.pop(key, None)
+            raise
+
+    def _current_state(self, url):
+        _expiration, future = self._cache.get(str(url), (0, None))
+        if not future or not future.done() or future.exception():
+            return None
+        resp = future.result()
+        if resp.status != 200 or not resp._body:
+            return None
+        return get_json_codec()[1](resp._body)
+
+    def _record(self, method, url, kwargs):
+        body = kwargs.get("json")
+        self.plan.append({"method": method, "url": str(url), "body": body})
+        state = self._current_state(url) if method in ["PATCH", "PUT"] else None
+        if state is None or not _is_noop(body, state):
+            self.changes += 1
+        return _StoredResponse(204)
+
+    def get(self, url, **kwargs):
+        return _PendingResponse(self._cached_read(url, kwargs))
+
+    def post(self, url, **kwargs):
+        m = re.search("action=([-a-z]+)", str(url))
+        if m and m.group(1) in READ_ONLY_ACTIONS:
+            return self._session.post(url, **kwargs)
+        return self._record("POST", url, kwargs)
+
+    def put(self, url, **kwargs):
+        return self._record("PUT", url, kwargs)
+
+    def patch(self, url, **kwargs):
+        return self._record("PATCH", url, kwargs)
+
+    async def _planned_delete(self, url, kwargs):
+        read_kwargs = {k: v for k, v in kwargs.items() if k != "json"}
+        resp = await self._cached_read(url, read_kwargs)
+        if resp.status == 404:
+            # Nothing to delete, vCenter would answer the same
+            return _StoredResponse(404)
+        return self._record("DELETE", url, kwargs)
+
+    def delete(self, url, **kwargs):
+        return _PendingResponse(self._planned_delete(url, kwargs))
+
+
+PlanningSession._caches = weakref.WeakKeyDictionary()
+
+
+def is_planning(session):
+    return isinstance(session, PlanningSession)
+
+
+async def plan(entry_point, module, session):
+    planning_session = PlanningSession(session)
+    result = await entry_point(module, planning_session)
+    result["plan"] = planning_session.plan
+    # A write of the values read by the GET would not change anything
+    result["changed"] = bool(result.get("changed")) or planning_session.changes > 0
+    return result
+
+
+class EndpointModule:
+    """Give entry_point() the parameters of one of the vcenter_endpoints."""
+
+    def __init__(self, module, params):
+        self._module = module
+        self.params = params
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+
+def endpoint_params(params, endpoint):
+    return dict(
+        params,
+        vcenter_hostname=endpoint["hostname"],
+        vcenter_username=endpoint.get("username") or params["vcenter_username"],
+        vcenter_password=endpoint.get("password") or params["vcenter_password"],
+        vcenter_validate_certs=(
+            params["vcenter_validate_certs"]
+            if endpoint.get("validate_certs") is None
+            else endpoint["validate_certs"]
+        ),
+        vcenter_endpoints=None,
+    )
+
+
+async def fan_out(entry_point, module):
+    """Run entry_point() concurrently against each of the vcenter_endpoints."""
+    exceptions = lazy_import(TURBO_EXCEPTIONS)
+
+    async def _run(params):
+        for key in ["vcenter_username", "vcenter_password"]:
+            if not params[key]:
+                return {"failed": True, "msg": f"{key} cannot be empty"}
+        try:
+            session = await open_session(
+                vcenter_hostname=params["vcenter_hostname"],
+                vcenter_username=params["vcenter_username"],
+                vcenter_password=params["vcenter_password"],
+                validate_certs=params["vcenter_validate_certs"],
+                log_file=params["vcenter_rest_log_file"],
+                ca_bundle=params["vcenter_ca_bundle"],
+                client_cert=params["vcenter_client_cert"],
+                client_key=params["vcenter_client_key"],
+            )
+        except exceptions.EmbeddedModuleFailure as err:
+            return {"failed": True, "msg": err.get_message()}
+        endpoint_module = EndpointModule(module, params)
+        try:
+            if module.check_mode:
+                return await plan(entry_point, endpoint_module, session)
+            return await entry_point(endpoint_module, session)
+        except Exception as err:  # pylint: disable=broad-except
+            deadline = current_deadline.get()
+            if deadline and deadline.expired():
+                raise  # reported by run_with_deadline()
+            # One unreachable vCenter should not hide the result of the others
+            return {"failed": True, "msg": f"{type(err).__name__}: {err}"}
+
+    all_params = [
+        endpoint_params(module.params, endpoint)
+        for endpoint in module.params["vcenter_endpoints"]
+    ]
+    results = await asyncio.gather(
+        *[
+            run_with_deadline(_run(params), params["task_timeout"])
+            for params in all_params
+        ]
+    )
+    endpoints = {p["vcenter_hostname"]: r for p, r in zip(all_params, results)}
+    failed = [k for k, v in endpoints.items() if v.get("failed")]
+    result = {
+        "endpoints": endpoints,
+        "changed": any(v.get("changed") for v in endpoints.values()),
+        "failed": bool(failed),
+    }
+    if failed:
+        result["msg"] = "Failed on: {0}".format(", ".join(failed))
+    return result
+
+
 def set_subkey(root, path, value):
     cur_loc = root
     splitted = path.split("/")
@@ -7,93 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: appliance_access_dcui
-short_description: Set enabled state of Direct Console User Interface (DCUI TTY2).
-description: Set enabled state of Direct Console User Interface (DCUI TTY2).
-options:
-    enabled:
-        description:
-        - DCUI is enabled. This parameter is mandatory.
-        required: true
-        type: bool
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    state:
-        choices:
-        - set
-        default: set
-        description: []
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 2.0.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Disable the Direct Console User Interface
-  vmware.vmware_rest.appliance_access_dcui:
-    enabled: false
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Disable the Direct Console User Interface
-value:
-  description: Disable the Direct Console User Interface
-  returned: On success
-  sample: {}
-  type: dict
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "set": {"query": {}, "body": {"enabled": "enabled"}, "path": {}}
@@ -115,10 +28,13 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
     gen_args,
     get_subdevice_type,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -128,17 +44,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -148,6 +64,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -158,6 +90,22 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
     argument_spec["enabled"] = {"required": True, "type": "bool"}
@@ -173,23 +121,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
@@ -0,0 +1,277 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2021, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import json
+
+from ansible.module_utils.basic import env_fallback
+
+try:
+    from ansible_collections.cloud.common.plugins.module_utils.turbo.exceptions import (
+        EmbeddedModuleFailure,
+    )
+    from ansible_collections.cloud.common.plugins.module_utils.turbo.module import (
+        AnsibleTurboModule as AnsibleModule,
+    )
+
+    AnsibleModule.collection_name = "vmware.vmware_rest"
+except ImportError:
+    from ansible.module_utils.basic import AnsibleModule
+
+from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
+    compact_result,
+    fan_out,
+    gather_bounded,
+    open_session,
+    run_with_deadline,
+    session_timeout,
+)
+
+
+def prepare_argument_spec():
+    argument_spec = {
+        "vcenter_hostname": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_HOST"]),
+        ),
+        "vcenter_username": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_USER"]),
+        ),
+        "vcenter_password": dict(
+            type="str",
+            required=False,
+            no_log=True,
+            fallback=(env_fallback, ["VMWARE_PASSWORD"]),
+        ),
+        "vcenter_validate_certs": dict(
+            type="bool",
+            required=False,
+            default=True,
+            fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
+        ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
+        "vcenter_rest_log_file": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_REST_LOG_FILE"]),
+        ),
+        "session_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
+        ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
+    }
+
+    argument_spec["baseline_file"] = {"type": "path"}
+    argument_spec["compact"] = {"type": "bool", "default": False}
+    argument_spec["concurrency"] = {"type": "int", "default": 10}
+    argument_spec["flatten_value"] = {"type": "bool", "default": False}
+    argument_spec["sections"] = {
+        "type": "list",
+        "elements": "str",
+        "choices": list(SECTIONS),
+    }
+    argument_spec["snapshot_file"] = {"type": "path"}
+
+    return argument_spec
+
+
+async def main():
+    required_if = list([])
+
+    module_args = prepare_argument_spec()
+    module = AnsibleModule(
+        argument_spec=module_args, required_if=required_if, supports_check_mode=True
+    )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        if module.params["compact"]:
+            result = compact_result(result, module.params["flatten_value"])
+        module.exit_json(**result)
+    if not module.params["vcenter_hostname"]:
+        module.fail_json("vcenter_hostname cannot be empty")
+    if not module.params["vcenter_username"]:
+        module.fail_json("vcenter_username cannot be empty")
+    if not module.params["vcenter_password"]:
+        module.fail_json("vcenter_password cannot be empty")
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
+    if module.params["compact"]:
+        result = compact_result(result, module.params["flatten_value"])
+    module.exit_json(**result)
+
+
+SECTIONS = {
+    "access_consolecli": "/api/appliance/access/consolecli",
+    "access_dcui": "/api/appliance/access/dcui",
+    "access_shell": "/api/appliance/access/shell",
+    "access_ssh": "/api/appliance/access/ssh",
+    "localaccounts": "/api/appliance/local-accounts",
+    "localaccounts_globalpolicy": "/api/appliance/local-accounts/global-policy",
+    "networking": "/api/appliance/networking",
+    "networking_dns_domains": "/api/appliance/networking/dns/domains",
+    "networking_dns_hostname": "/api/appliance/networking/dns/hostname",
+    "networking_dns_servers": "/api/appliance/networking/dns/servers",
+    "networking_firewall_inbound": "/api/appliance/networking/firewall/inbound",
+    "networking_interfaces": "/api/appliance/networking/interfaces",
+    "networking_noproxy": "/api/appliance/networking/noproxy",
+    "networking_proxy": "/api/appliance/networking/proxy",
+    "ntp": "/api/appliance/ntp",
+    "services": "/api/appliance/services",
+    "system_globalfips": "/api/appliance/system/global-fips",
+    "system_time_timezone": "/api/appliance/system/time/timezone",
+    "system_version": "/api/appliance/system/version",
+    "timesync": "/api/appliance/timesync",
+}
+
+# The order of the elements of these sections is not significant
+UNORDERED_SECTIONS = ["localaccounts", "networking_dns_domains", "networking_noproxy"]
+
+
+def build_url(params, section):
+    return ("https://{vcenter_hostname}" + SECTIONS[section]).format(**params)
+
+
+def normalize(section, value):
+    # vSphere < 7.0.2 wraps the result in a value key
+    if isinstance(value, dict) and list(value) == ["value"]:
+        value = value["value"]
+    if section in UNORDERED_SECTIONS and isinstance(value, list):
+        value = sorted(value, key=json.dumps)
+    return value
+
+
+def get_drift(before, after, path=""):
+    if isinstance(before, dict) and isinstance(after, dict):
+        drift = []
+        for key in sorted(set(before) | set(after)):
+            sub_path = "{0}.{1}".format(path, key) if path else key
+            drift += get_drift(before.get(key), after.get(key), sub_path)
+        return drift
+    if before != after:
+        return [{"path": path, "before": before, "after": after}]
+    return []
+
+
+async def read_section(params, session, section):
+    async with session.get(
+        build_url(params, section), **session_timeout(params)
+    ) as resp:
+        _json = None
+        if resp.headers.get("Content-Type") == "application/json":
+            _json = await resp.json()
+        return resp.status, _json
+
+
+async def entry_point(module, session):
+    result = await _info(module.params, session, module.check_mode)
+    if "baseline" in result:
+        baseline = result.pop("baseline")
+        if getattr(module, "_diff", False):
+            result["diff"] = {"before": baseline, "after": result["value"]["sections"]}
+    return result
+
+
+def load_baseline(path):
+    with open(path, encoding="utf-8") as fd:
+        baseline = json.load(fd)["sections"]
+    if not isinstance(baseline, dict):
+        raise ValueError("sections is not a dictionary")
+    return baseline
+
+
+async def _info(params, session, check_mode=False):
+    baseline = None
+    if params.get("baseline_file"):
+        try:
+            baseline = load_baseline(params["baseline_file"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            return {
+                "failed": True,
+                "changed": False,
+                "msg": "Cannot load the baseline {0}: {1!r}".format(
+                    params["baseline_file"], e
+                ),
+            }
+    sections = params.get("sections") or list(SECTIONS)
+    responses = await gather_bounded(
+        [read_section(params, session, section) for section in sections],
+        params.get("concurrency"),
+    )
+    value = {"errors": {}, "sections": {}}
+    for section, (status, _json) in zip(sections, responses):
+        if status == 200:
+            value["sections"][section] = normalize(section, _json)
+        else:
+            value["errors"][section] = {"status": status, "value": _json}
+    result = {"value": value, "changed": False, "failed": False}
+
+    if params.get("snapshot_file") and not check_mode:
+        with open(params["snapshot_file"], "w", encoding="utf-8") as fd:
+            json.dump(value, fd, indent=2, sort_keys=True)
+    if baseline is not None:
+        # Only compare the sections that have been read
+        baseline = {k: v for k, v in baseline.items() if k in value["sections"]}
+        result["baseline"] = baseline
+        result["drift"] = get_drift(baseline, value["sections"])
+    return result
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    current_loop = asyncio.get_event_loop_policy().get_event_loop()
+    current_loop.run_until_complete(main())
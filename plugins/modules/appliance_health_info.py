@@ -0,0 +1,240 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2021, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import asyncio
+import time
+
+from ansible.module_utils.basic import env_fallback
+
+try:
+    from ansible_collections.cloud.common.plugins.module_utils.turbo.exceptions import (
+        EmbeddedModuleFailure,
+    )
+    from ansible_collections.cloud.common.plugins.module_utils.turbo.module import (
+        AnsibleTurboModule as AnsibleModule,
+    )
+
+    AnsibleModule.collection_name = "vmware.vmware_rest"
+except ImportError:
+    from ansible.module_utils.basic import AnsibleModule
+
+from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
+    compact_result,
+    current_deadline,
+    fan_out,
+    get_aiohttp,
+    open_session,
+    run_with_deadline,
+    session_timeout,
+)
+
+
+def prepare_argument_spec():
+    argument_spec = {
+        "vcenter_hostname": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_HOST"]),
+        ),
+        "vcenter_username": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_USER"]),
+        ),
+        "vcenter_password": dict(
+            type="str",
+            required=False,
+            no_log=True,
+            fallback=(env_fallback, ["VMWARE_PASSWORD"]),
+        ),
+        "vcenter_validate_certs": dict(
+            type="bool",
+            required=False,
+            default=True,
+            fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
+        ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
+        "vcenter_rest_log_file": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_REST_LOG_FILE"]),
+        ),
+        "session_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
+        ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
+    }
+
+    argument_spec["checks"] = {
+        "type": "list",
+        "elements": "str",
+        "choices": list(HEALTH_CHECKS),
+    }
+    argument_spec["compact"] = {"type": "bool", "default": False}
+    argument_spec["flatten_value"] = {"type": "bool", "default": False}
+
+    return argument_spec
+
+
+async def main():
+    required_if = list([])
+
+    module_args = prepare_argument_spec()
+    module = AnsibleModule(
+        argument_spec=module_args, required_if=required_if, supports_check_mode=True
+    )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        if module.params["compact"]:
+            result = compact_result(result, module.params["flatten_value"])
+        module.exit_json(**result)
+    if not module.params["vcenter_hostname"]:
+        module.fail_json("vcenter_hostname cannot be empty")
+    if not module.params["vcenter_username"]:
+        module.fail_json("vcenter_username cannot be empty")
+    if not module.params["vcenter_password"]:
+        module.fail_json("vcenter_password cannot be empty")
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
+    if module.params["compact"]:
+        result = compact_result(result, module.params["flatten_value"])
+    module.exit_json(**result)
+
+
+HEALTH_CHECKS = {
+    "applmgmt": "/api/appliance/health/applmgmt",
+    "database": "/api/appliance/health/database",
+    "databasestorage": "/api/appliance/health/database-storage",
+    "load": "/api/appliance/health/load",
+    "mem": "/api/appliance/health/mem",
+    "softwarepackages": "/api/appliance/health/software-packages",
+    "storage": "/api/appliance/health/storage",
+    "swap": "/api/appliance/health/swap",
+    "system": "/api/appliance/health/system",
+}
+
+# From the best to the worst, gray means the status is unknown
+SEVERITY = ["green", "gray", "yellow", "orange", "red"]
+
+
+def build_url(params, check):
+    return ("https://{vcenter_hostname}" + HEALTH_CHECKS[check]).format(**params)
+
+
+def overall_status(statuses):
+    known = [s for s in statuses if s in SEVERITY]
+    if len(known) < len(statuses):
+        known.append("gray")
+    return max(known, key=SEVERITY.index) if known else "gray"
+
+
+async def run_check(params, session, check):
+    aiohttp = get_aiohttp()
+    start = time.monotonic()
+    _json = None
+    try:
+        async with session.get(
+            build_url(params, check), **session_timeout(params)
+        ) as resp:
+            if resp.headers.get("Content-Type") == "application/json":
+                _json = await resp.json()
+            status = resp.status
+    except asyncio.TimeoutError:
+        deadline = current_deadline.get()
+        if deadline and deadline.expired():
+            raise  # reported by run_with_deadline()
+        return {
+            "error": "timeout",
+            "latency": round(time.monotonic() - start, 3),
+            "status": None,
+        }
+    except (aiohttp.ClientError, ValueError) as e:
+        # e.g: the connection was reset, or the answer is not valid JSON
+        return {
+            "error": "{0}: {1}".format(type(e).__name__, e),
+            "latency": round(time.monotonic() - start, 3),
+            "status": None,
+        }
+    result = {"latency": round(time.monotonic() - start, 3)}
+    if status == 200:
+        result["status"] = _json
+    else:
+        result["error"] = _json
+        result["status"] = None
+        result["status_code"] = status
+    return result
+
+
+async def entry_point(module, session):
+    return await _info(module.params, session)
+
+
+async def _info(params, session):
+    checks = params.get("checks") or list(HEALTH_CHECKS)
+    start = time.monotonic()
+    results = await asyncio.gather(
+        *[run_check(params, session, check) for check in checks]
+    )
+    value = {
+        "checks": dict(zip(checks, results)),
+        "duration": round(time.monotonic() - start, 3),
+        "status": overall_status([r["status"] for r in results]),
+    }
+    return {"value": value, "changed": False, "failed": False}
+
+
+if __name__ == "__main__":
+    current_loop = asyncio.get_event_loop_policy().get_event_loop()
+    current_loop.run_until_complete(main())
@@ -7,120 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: appliance_infraprofile_configs
-short_description: Exports the desired profile specification.
-description: Exports the desired profile specification.
-options:
-    description:
-        description:
-        - Custom description provided by the user.
-        - If unset description will be empty.
-        type: str
-    encryption_key:
-        description:
-        - Encryption Key to encrypt/decrypt profiles.
-        - If unset encryption will not be used for the profile.
-        type: str
-    profiles:
-        description:
-        - Profiles to be exported/imported.
-        - If unset or empty, all profiles will be returned.
-        - When clients pass a value of this structure as a parameter, the field must
-            contain the id of resources returned by M(vmware.vmware_rest.appliance_infraprofile_configs).
-        elements: str
-        type: list
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    state:
-        choices:
-        - export
-        description: []
-        required: true
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 2.0.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Export the ApplianceManagement profile
-  vmware.vmware_rest.appliance_infraprofile_configs:
-    state: export
-    profiles:
-    - ApplianceManagement
-  register: result
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Export the ApplianceManagement profile
-value:
-  description: Export the ApplianceManagement profile
-  returned: On success
-  sample: '{"action":"RESTART_SERVICE","productName":"VMware vCenter Server","creationTime":"2022-11-23T20:11:00+0000","version":"7.0.3.00800","profiles":{"ApplianceManagement":{"action":"RESTART_SERVICE","actionOn":{"VC_SERVICES":["applmgmt"],"SYSTEMD":["sendmail","rsyslog"]},"description":"Appliance
-    Mangment Service","version":"7.0","config":{"/etc/applmgmt/appliance/appliance.conf":{"Is
-    shell Enabled":true,"Shell Expiration Time":9,"TimeSync Mode (Host/NTP)":"NTP"},"/etc/ntp.conf":{"Time
-    servers":"time.nist.gov"},"/etc/shadow":{"root":{"maximumDays":"90","warningDays":"7"},"bin":{"maximumDays":"90","warningDays":"7"},"daemon":{"maximumDays":"90","warningDays":"7"},"messagebus":{"maximumDays":"90","warningDays":"7"},"systemd-bus-proxy":{"maximumDays":"90","warningDays":"7"},"systemd-journal-gateway":{"maximumDays":"90","warningDays":"7"},"systemd-journal-remote":{"maximumDays":"90","warningDays":"7"},"systemd-journal-upload":{"maximumDays":"90","warningDays":"7"},"systemd-network":{"maximumDays":"90","warningDays":"7"},"systemd-resolve":{"maximumDays":"90","warningDays":"7"},"systemd-timesync":{"maximumDays":"90","warningDays":"7"},"nobody":{"maximumDays":"90","warningDays":"7"},"rpc":{"maximumDays":"90","warningDays":"7"},"sshd":{"maximumDays":"90","warningDays":"7"},"ntp":{"maximumDays":"90","warningDays":"7"},"smmsp":{"maximumDays":"90","warningDays":"7"},"apache":{"maximumDays":"90","warningDays":"7"},"tftp":{"maximumDays":"","warningDays":""},"named":{"maximumDays":"","warningDays":""},"vmdird":{"maximumDays":"90","warningDays":"7"},"sso-user":{"maximumDays":"90","warningDays":"7"},"dnsmasq":{"maximumDays":"","warningDays":""},"observability":{"maximumDays":"","warningDays":""},"vdtc":{"maximumDays":"","warningDays":""},"vmafdd-user":{"maximumDays":"90","warningDays":"7"},"vmcad-user":{"maximumDays":"90","warningDays":"7"},"pod":{"maximumDays":"","warningDays":""},"vmonapi":{"maximumDays":"","warningDays":""},"envoy":{"maximumDays":"","warningDays":""},"vpostgres":{"maximumDays":"","warningDays":"7"},"lookupsvc":{"maximumDays":"","warningDays":""},"cis-license":{"maximumDays":"","warningDays":""},"pschealth":{"maximumDays":"","warningDays":""},"netdumper":{"maximumDays":"","warningDays":""},"vapiEndpoint":{"maximumDays":"90","warningDays":"7"},"vpxd-svcs":{"maximumDays":"","warningDays":""},"certauth":{"maximumDays":"90","warningDays":"7"},"certmgr":{"maximumDays":"90","warningDays":"7"},"infraprofile":{"maximumDays":"","warningDays":""},"topologysvc":{"maximumDays":"90","warningDays":"7"},"trustmanagement":{"maximumDays":"","warningDays":""},"vpxd":{"maximumDays":"","warningDays":""},"analytics":{"maximumDays":"","warningDays":""},"eam":{"maximumDays":"90","warningDays":"7"},"sps":{"maximumDays":"","warningDays":""},"deploy":{"maximumDays":"","warningDays":""},"updatemgr":{"maximumDays":"","warningDays":""},"vlcm":{"maximumDays":"90","warningDays":"7"},"vmcam":{"maximumDays":"90","warningDays":"7"},"vsan-health":{"maximumDays":"90","warningDays":"7"},"vsm":{"maximumDays":"90","warningDays":"7"},"vsphere-ui":{"maximumDays":"90","warningDays":"7"},"vtsdbuser":{"maximumDays":"","warningDays":""},"vstatsuser":{"maximumDays":"","warningDays":""},"wcp":{"maximumDays":"","warningDays":"7"},"content-library":{"maximumDays":"90","warningDays":"7"},"imagebuilder":{"maximumDays":"90","warningDays":"7"},"perfcharts":{"maximumDays":"90","warningDays":"7"},"vpgmonusr":{"maximumDays":"","warningDays":"7"},"vtsdbmonusr":{"maximumDays":"","warningDays":"7"},"zuul":{"maximumDays":"90","warningDays":"7"},"Send
-    Waring before this No of Days.":null,"Password validity (days)":null},"/etc/sysconfig/clock":{"Time
-    zone":"\"Etc/UTC\"","UTC":"1"},"/usr/bin/systemctl/sshd.service":{"Enable SSH":"true"},"/etc/mail/sendmail.cf":{"SMTP
-    Port":null,"Mail server":null},"/etc/vmware-syslog/syslog.conf":{"Port [2]":null,"Port
-    [1]":null,"Port [0]":null,"Protocol [2]":null,"Remote Syslog Host [1]":null,"Protocol
-    [1]":null,"Remote Syslog Host [0]":null,"Protocol [0]":null,"Remote Syslog Host
-    [2]":null},"/etc/pam.d/system-auth":{"Deny Login after these many Unsuccessful
-    Attempts.":null,"Unlock root after (seconds)":null,"On Error Login will be.":null,"Include
-    Root user for SSH lockout.":null,"Unlock user after (seconds)":null}},"name":"ApplianceManagement"}}}'
-  type: str
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "export": {
@@ -131,9 +17,36 @@ PAYLOAD_FORMAT = {
             "profiles": "profiles",
         },
         "path": {},
-    }
+    },
+    "import": {
+        "query": {},
+        "body": {
+            "config_spec": "config_spec",
+            "description": "description",
+            "encryption_key": "encryption_key",
+            "profiles": "profiles",
+        },
+        "path": {},
+    },
+    "validate": {
+        "query": {},
+        "body": {
+            "config_spec": "config_spec",
+            "description": "description",
+            "encryption_key": "encryption_key",
+            "profiles": "profiles",
+        },
+        "path": {},
+    },
 }  # pylint: disable=line-too-long
 
+import codecs
+import gzip
+import hashlib
+import json
+import os
+import re
+
 from ansible.module_utils.basic import env_fallback
 
 try:
@@ -150,12 +63,17 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
     gen_args,
     get_subdevice_type,
+    is_planning,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
+    wait_for,
 )
 
 
@@ -163,17 +81,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -183,6 +101,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -193,40 +127,85 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
+    argument_spec["checksum"] = {"type": "str"}
+    argument_spec["compress"] = {"type": "bool", "default": False}
+    argument_spec["config_spec"] = {"type": "str"}
     argument_spec["description"] = {"type": "str"}
+    argument_spec["dest"] = {"type": "path"}
     argument_spec["encryption_key"] = {"no_log": True, "type": "str"}
     argument_spec["profiles"] = {"type": "list", "elements": "str"}
-    argument_spec["state"] = {"required": True, "type": "str", "choices": ["export"]}
+    argument_spec["src"] = {"type": "path"}
+    argument_spec["state"] = {
+        "required": True,
+        "type": "str",
+        "choices": ["export", "import", "validate"],
+    }
+    argument_spec["wait"] = {"type": "bool", "default": False}
+    argument_spec["wait_timeout"] = {"type": "float", "default": 3600}
 
     return argument_spec
 
 
 async def main():
-    required_if = list([])
+    required_if = list(
+        [
+            ["state", "import", ["config_spec", "src"], True],
+            ["state", "validate", ["config_spec", "src"], True],
+        ]
+    )
 
     module_args = prepare_argument_spec()
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
@@ -253,7 +232,212 @@ async def entry_point(module, session):
     return await func(module.params, session)
 
 
+# Size of the blocks read from the files and from the vCenter answers
+CHUNK_SIZE = 64 * 1024
+
+
+class ProfileDecoder:
+    """Incrementally extract the profile from the answer of the export.
+
+    vCenter returns the profile as a JSON string, it is unescaped block per
+    block so the whole profile is never in memory. The older {"value": "..."}
+    answers are decoded in one go.
+    """
+
+    # An incomplete escape sequence, the high half of a surrogate pair or
+    # the closing quote, they are kept for the next block.
+    _INCOMPLETE = re.compile(
+        r"(?<!\\)(?:\\\\)*"
+        r'(\\(?:u[dD][89abAB][0-9a-fA-F]{2}\\?)?(?:u[0-9a-fA-F]{0,3})?|"\s*)$'
+    )
+
+    def __init__(self):
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._pending = ""
+        self._wrapped = None
+
+    def decode(self, data, final=False):
+        text = self._pending + self._utf8.decode(data, final)
+        self._pending = ""
+        if self._wrapped is None:
+            text = text.lstrip()
+            if not text and not final:
+                return ""
+            self._wrapped = text.startswith("{")
+            if not self._wrapped:
+                text = text[1:]
+        if self._wrapped:
+            if final:
+                return json.loads(text)["value"]
+            self._pending = text
+            return ""
+        if final:
+            return json.loads('"' + text.rstrip())
+        m = self._INCOMPLETE.search(text)
+        if m:
+            text, self._pending = text[: m.start(1)], text[m.start(1) :]
+        return json.loads('"' + text + '"')
+
+
+def is_compressed(path):
+    with open(path, "rb") as fd:
+        return fd.read(2) == b"\x1f\x8b"
+
+
+def open_file(path, mode="rb", compress=None):
+    if compress is None:
+        compress = is_compressed(path)
+    if compress:
+        return gzip.open(path, mode)
+    return open(path, mode)
+
+
+def get_checksum(path):
+    checksum = hashlib.sha256()
+    with open_file(path) as fd:
+        for block in iter(lambda: fd.read(CHUNK_SIZE), b""):
+            checksum.update(block)
+    return checksum.hexdigest()
+
+
+def build_action_url(params, action):
+    url = (
+        "https://{vcenter_hostname}/api/appliance/infraprofile/configs?action=" + action
+    )
+    if action in ["import", "validate"]:
+        url += "&vmw-task=true"
+    return url.format(**params)
+
+
+async def stream_payload(params, payload):
+    head = json.dumps(payload)[:-1]
+    yield (head + (", " if payload else "") + '"config_spec": "').encode()
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open_file(params["src"]) as fd:
+        for block in iter(lambda: fd.read(CHUNK_SIZE), b""):
+            yield json.dumps(decoder.decode(block))[1:-1].encode()
+    yield (json.dumps(decoder.decode(b"", True))[1:-1] + '"}').encode()
+
+
+async def get_task(params, session, task_id):
+    _url = "https://{vcenter_hostname}/api/cis/tasks/{task_id}".format(
+        task_id=task_id, **params
+    )
+    async with session.get(_url, **session_timeout(params)) as resp:
+        return await resp.json()
+
+
+async def _export_to_file(params, session):
+    payload = prepare_payload(params, PAYLOAD_FORMAT["export"])
+    dest = params["dest"]
+    async with session.post(
+        build_action_url(params, "export"), json=payload, **session_timeout(params)
+    ) as resp:
+        if resp.status != 200 or is_planning(session):
+            _json = None
+            if resp.headers.get("Content-Type") == "application/json":
+                _json = await resp.json()
+            return await update_changed_flag(_json, resp.status, "export")
+
+        checksum = hashlib.sha256()
+        size = 0
+        decoder = ProfileDecoder()
+        try:
+            with open_file(dest + ".part", "wb", params["compress"]) as fd:
+                async for block in resp.content.iter_chunked(CHUNK_SIZE):
+                    data = decoder.decode(block).encode()
+                    checksum.update(data)
+                    fd.write(data)
+                    size += len(data)
+                data = decoder.decode(b"", True).encode()
+                checksum.update(data)
+                fd.write(data)
+                size += len(data)
+        except BaseException:
+            os.remove(dest + ".part")
+            raise
+
+    changed = not (
+        os.path.exists(dest)
+        and is_compressed(dest) == params["compress"]
+        and get_checksum(dest) == checksum.hexdigest()
+    )
+    if changed:
+        os.replace(dest + ".part", dest)
+    else:
+        os.remove(dest + ".part")
+    value = {
+        "checksum": checksum.hexdigest(),
+        "compressed": params["compress"],
+        "dest": dest,
+        "size": size,
+    }
+    return {"value": value, "changed": changed, "failed": False}
+
+
+async def _import_or_validate(params, session, action):
+    payload = prepare_payload(params, PAYLOAD_FORMAT[action])
+    kwargs = {"json": payload}
+    if params["src"]:
+        if params["checksum"]:
+            checksum = get_checksum(params["src"])
+            if checksum != params["checksum"].split(":")[-1].lower():
+                return {
+                    "failed": True,
+                    "changed": False,
+                    "msg": "The checksum of {0} is {1}".format(params["src"], checksum),
+                }
+        if is_planning(session):
+            # The plan only refers to the file
+            payload["config_spec"] = "@" + params["src"]
+        else:
+            kwargs = {"data": stream_payload(params, payload)}
+
+    async with session.post(
+        build_action_url(params, action), **kwargs, **session_timeout(params)
+    ) as resp:
+        _json = None
+        if resp.headers.get("Content-Type") == "application/json":
+            _json = await resp.json()
+        result = await update_changed_flag(_json, resp.status, action)
+    if resp.status != 200:
+        return result
+    result["changed"] = action == "import"
+    result["failed"] = False
+    if not params["wait"]:
+        return result
+
+    task_id = result["value"]
+
+    async def is_done():
+        task = await get_task(params, session, task_id)
+        if task.get("status") in ["SUCCEEDED", "FAILED"]:
+            return task
+
+    task = await wait_for(is_done, params["wait_timeout"])
+    result["task_id"] = task_id
+    if not task:
+        result["failed"] = True
+        result["msg"] = "Timeout while waiting for the task {0}".format(task_id)
+    elif task["status"] == "FAILED":
+        result["failed"] = True
+        result["msg"] = task.get("error")
+    else:
+        result["value"] = task.get("result")
+    return result
+
+
+async def _import(params, session):
+    return await _import_or_validate(params, session, "import")
+
+
+async def _validate(params, session):
+    return await _import_or_validate(params, session, "validate")
+
+
 async def _export(params, session):
+    if params["dest"]:
+        return await _export_to_file(params, session)
     _in_query_parameters = PAYLOAD_FORMAT["export"]["query"].keys()
     payload = prepare_payload(params, PAYLOAD_FORMAT["export"])
     subdevice_type = get_subdevice_type(
@@ -7,148 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: appliance_monitoring_query
-short_description: Get monitoring data.
-description: Get monitoring data.
-options:
-    end_time:
-        description:
-        - End time in UTC This parameter is mandatory.
-        required: true
-        type: str
-    function:
-        choices:
-        - AVG
-        - COUNT
-        - MAX
-        - MIN
-        description:
-        - I(function_type) enumerated type Defines aggregation function This parameter
-            is mandatory.
-        required: true
-        type: str
-    interval:
-        choices:
-        - DAY1
-        - HOURS2
-        - HOURS6
-        - MINUTES30
-        - MINUTES5
-        description:
-        - I(interval_type) enumerated type Defines interval between the values in
-            hours and mins, for which aggregation will apply This parameter is mandatory.
-        required: true
-        type: str
-    names:
-        description:
-        - 'monitored item IDs Ex: CPU, MEMORY'
-        - When clients pass a value of this structure as a parameter, the field must
-            contain the id of resources returned by M(vmware.vmware_rest.appliance_monitoring_info).
-        elements: str
-        required: true
-        type: list
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    start_time:
-        description:
-        - Start time in UTC This parameter is mandatory.
-        required: true
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 2.0.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Query the monitoring backend
-  vmware.vmware_rest.appliance_monitoring_query:
-    end_time: 2021-04-14 09:34:56+00:00
-    start_time: 2021-04-14 08:34:56+00:00
-    names:
-    - mem.total
-    interval: MINUTES5
-    function: AVG
-  register: result
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Query the monitoring backend
-value:
-  description: Query the monitoring backend
-  returned: On success
-  sample:
-  - data:
-    - ''
-    - ''
-    - ''
-    - ''
-    - ''
-    - ''
-    - ''
-    - ''
-    - ''
-    - ''
-    - ''
-    - ''
-    - ''
-    end_time: '2021-04-14T09:34:56.000Z'
-    function: AVG
-    interval: MINUTES5
-    name: mem.total
-    start_time: '2021-04-14T08:34:56.000Z'
-  type: list
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "query": {
@@ -164,6 +22,12 @@ PAYLOAD_FORMAT = {
     }
 }  # pylint: disable=line-too-long
 
+import csv
+import datetime
+import gzip
+import json
+import os
+
 from ansible.module_utils.basic import env_fallback
 
 try:
@@ -180,10 +44,16 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
+    gather_bounded,
     gen_args,
     get_subdevice_type,
+    is_planning,
+    iter_ordered,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -193,17 +63,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -213,6 +83,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -223,9 +109,45 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
+    argument_spec["aggregates"] = {
+        "type": "list",
+        "elements": "str",
+        "choices": ["avg", "max", "min"],
+        "default": ["avg", "max", "min"],
+    }
+    argument_spec["bucket_interval"] = {
+        "type": "str",
+        "choices": ["DAY1", "HOURS2", "HOURS6", "MINUTES30", "MINUTES5"],
+    }
+    argument_spec["chunk_size"] = {"type": "int", "default": 1000}
+    argument_spec["concurrency"] = {"type": "int", "default": 4}
     argument_spec["end_time"] = {"required": True, "type": "str"}
+    argument_spec["export_file"] = {"type": "path"}
+    argument_spec["export_format"] = {
+        "type": "str",
+        "choices": ["csv", "ndjson"],
+        "default": "ndjson",
+    }
+    argument_spec["export_gzip"] = {"type": "bool", "default": False}
+    argument_spec["export_resume"] = {"type": "bool", "default": False}
     argument_spec["function"] = {
         "required": True,
         "type": "str",
@@ -237,6 +159,11 @@ def prepare_argument_spec():
         "choices": ["DAY1", "HOURS2", "HOURS6", "MINUTES30", "MINUTES5"],
     }
     argument_spec["names"] = {"required": True, "type": "list", "elements": "str"}
+    argument_spec["output_format"] = {
+        "type": "str",
+        "choices": ["columnar", "list"],
+        "default": "list",
+    }
     argument_spec["start_time"] = {"required": True, "type": "str"}
 
     return argument_spec
@@ -249,23 +176,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
@@ -276,10 +216,296 @@ def build_url(params):
     )
 
 
+INTERVALS = {
+    "MINUTES5": 300,
+    "MINUTES30": 1800,
+    "HOURS2": 7200,
+    "HOURS6": 21600,
+    "DAY1": 86400,
+}
+
+
+def parse_time(value):
+    date = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if not date.tzinfo:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    return date
+
+
+def format_time(date):
+    return date.astimezone(datetime.timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000Z")
+
+
+def align_time(date, interval):
+    """Return the start of the interval of the date, like the appliance does."""
+    timestamp = int(date.timestamp())
+    return datetime.datetime.fromtimestamp(
+        timestamp - timestamp % interval, datetime.timezone.utc
+    )
+
+
+def split_time_range(params):
+    """Split the query time range in chunks of at most chunk_size data points."""
+    step = datetime.timedelta(seconds=INTERVALS[params["interval"]])
+    start = align_time(parse_time(params["start_time"]), INTERVALS[params["interval"]])
+    end = parse_time(params["end_time"])
+    chunks = []
+    while start <= end:
+        chunk_end = min(start + step * (params["chunk_size"] - 1), end)
+        chunks.append((start, chunk_end))
+        start = chunk_end + step
+    return chunks
+
+
+def to_number(value):
+    if value in (None, ""):
+        return None
+    return float(value)
+
+
+def get_timestamps(params, start, item):
+    """Return the timestamps of the data points of an item of the answer.
+
+    The appliance returns the start_time of the first data point, start is
+    the start of the chunk and is only used if it is missing.
+    """
+    if item.get("start_time"):
+        start = parse_time(item["start_time"])
+    step = INTERVALS[params["interval"]]
+    return [int(start.timestamp()) + i * step for i in range(len(item["data"]))]
+
+
+def merge_chunks(params, chunks):
+    series = {}
+    timestamps = {}
+    for (start, end), value in chunks:
+        for item in value:
+            serie = series.get(item["name"])
+            if serie is None:
+                serie = series[item["name"]] = dict(
+                    item, start_time=item.get("start_time") or format_time(start)
+                )
+            else:
+                serie["data"] = serie["data"] + item["data"]
+            serie["end_time"] = item.get("end_time") or format_time(end)
+            timestamps.setdefault(item["name"], []).extend(
+                get_timestamps(params, start, item)
+            )
+    return list(series.values()), timestamps
+
+
+def aggregate(values, function):
+    values = [i for i in values if i is not None]
+    if not values:
+        return None
+    if function == "min":
+        return min(values)
+    if function == "max":
+        return max(values)
+    return sum(values) / len(values)
+
+
+def to_columnar(params, series, timestamps):
+    if not series:
+        return {"timestamps": [], "values": {}}
+    all_timestamps = timestamps[series[0]["name"]]
+    values = {i["name"]: [to_number(j) for j in i["data"]] for i in series}
+    if not params["bucket_interval"]:
+        return {"timestamps": all_timestamps, "values": values}
+
+    bucket = INTERVALS[params["bucket_interval"]]
+    buckets = {}
+    for index, timestamp in enumerate(all_timestamps):
+        buckets.setdefault(timestamp - timestamp % bucket, []).append(index)
+    return {
+        "timestamps": list(buckets.keys()),
+        "values": {
+            name: {
+                function: [
+                    aggregate([data[i] for i in indexes if i < len(data)], function)
+                    for indexes in buckets.values()
+                ]
+                for function in params["aggregates"]
+            }
+            for name, data in values.items()
+        },
+    }
+
+
+def chunk_rows(params, start, value):
+    rows = {}
+    for item in value:
+        for timestamp, point in zip(get_timestamps(params, start, item), item["data"]):
+            rows.setdefault(timestamp, {})[item["name"]] = to_number(point)
+    return sorted(rows.items())
+
+
+def open_export_file(params, mode):
+    if params["export_gzip"]:
+        return gzip.open(
+            params["export_file"], mode + "t", encoding="utf-8", newline=""
+        )
+    return open(params["export_file"], mode, encoding="utf-8", newline="")
+
+
+def get_last_exported_timestamp(params):
+    if not os.path.exists(params["export_file"]):
+        return None
+    last_timestamp = None
+    with open_export_file(params, "r") as fd:
+        try:
+            for line in fd:
+                if not line.endswith("\n"):
+                    break  # The last line was not completely written
+                if params["export_format"] == "csv":
+                    timestamp = line.split(",")[0]
+                else:
+                    timestamp = json.loads(line).get("timestamp")
+                if str(timestamp).isdigit():
+                    last_timestamp = int(timestamp)
+        except (ValueError, EOFError):
+            pass
+    return last_timestamp
+
+
+def truncate_export_file(params):
+    """Remove the last line of the file if it was not completely written."""
+    path = params["export_file"]
+    if params["export_gzip"]:
+        # A gzip file cannot be truncated, the complete lines are compressed again
+        with gzip.open(path, "rb") as src, gzip.open(path + ".part", "wb") as dst:
+            try:
+                for line in src:
+                    if not line.endswith(b"\n"):
+                        break
+                    dst.write(line)
+            except EOFError:
+                pass
+        os.replace(path + ".part", path)
+        return
+    with open(path, "rb+") as fd:
+        end = fd.seek(0, os.SEEK_END)
+        while end > 0:
+            start = max(0, end - 65536)
+            fd.seek(start)
+            index = fd.read(end - start).rfind(b"\n")
+            if index != -1:
+                fd.truncate(start + index + 1)
+                return
+            end = start
+        fd.truncate(0)
+
+
+async def _export(params, session):
+    step = INTERVALS[params["interval"]]
+    last_timestamp = None
+    if params["export_resume"]:
+        last_timestamp = get_last_exported_timestamp(params)
+    if last_timestamp is not None:
+        start = datetime.datetime.fromtimestamp(
+            last_timestamp + step, datetime.timezone.utc
+        )
+        params = dict(params, start_time=format_time(start))
+    chunks = split_time_range(params)
+
+    query_chunks = (
+        _query(
+            dict(params, start_time=format_time(start), end_time=format_time(end)),
+            session,
+        )
+        for start, end in chunks
+    )
+    rows = 0
+    failure = None
+    mode = "w" if last_timestamp is None else "a"
+    if is_planning(session):
+        # Check mode, the rows are counted but not written
+        export_file = open(os.devnull, "w", encoding="utf-8", newline="")
+    else:
+        if mode == "a":
+            truncate_export_file(params)
+        export_file = open_export_file(params, mode)
+    with export_file as fd:
+        writer = csv.writer(fd)
+        if mode == "w" and params["export_format"] == "csv":
+            writer.writerow(["timestamp"] + params["names"])
+        index = 0
+        async for result in iter_ordered(query_chunks, params["concurrency"]):
+            if result.get("failed"):
+                failure = result
+                break
+            for timestamp, values in chunk_rows(
+                params, chunks[index][0], result["value"]
+            ):
+                if params["export_format"] == "csv":
+                    writer.writerow(
+                        [timestamp]
+                        + [
+                            "" if values.get(i) is None else values[i]
+                            for i in params["names"]
+                        ]
+                    )
+                else:
+                    fd.write(json.dumps({"timestamp": timestamp, **values}) + "\n")
+                rows += 1
+            fd.flush()
+            index += 1
+
+    summary = {
+        "path": params["export_file"],
+        "rows": rows,
+        "start_time": params["start_time"],
+        "end_time": format_time(chunks[index - 1][1]) if index else None,
+    }
+    if not is_planning(session):
+        summary["bytes"] = os.path.getsize(params["export_file"])
+    if failure:
+        failure["export"] = summary
+        return failure
+    return {"value": summary, "changed": rows > 0, "failed": False}
+
+
 async def entry_point(module, session):
-    func = globals()["_query"]
+    params = module.params
+    for option in ["chunk_size", "concurrency"]:
+        if params[option] < 1:
+            module.fail_json(msg=f"{option} must be at least 1, got {params[option]}")
+    if params["export_file"]:
+        try:
+            return await _export(params, session)
+        except ValueError as e:
+            module.fail_json(msg=f"Cannot parse the time range: {e}")
+    try:
+        chunks = split_time_range(params)
+    except ValueError as e:
+        if params["output_format"] == "columnar":
+            module.fail_json(msg=f"Cannot parse the time range: {e}")
+        chunks = []
+    if not chunks or (len(chunks) == 1 and params["output_format"] == "list"):
+        return await _query(params, session)
+
+    results = await gather_bounded(
+        [
+            _query(
+                dict(params, start_time=format_time(start), end_time=format_time(end)),
+                session,
+            )
+            for start, end in chunks
+        ],
+        params["concurrency"],
+    )
+    for result in results:
+        if result.get("failed"):
+            return result
 
-    return await func(module.params, session)
+    series, timestamps = merge_chunks(
+        params, [(chunk, result["value"]) for chunk, result in zip(chunks, results)]
+    )
+    if params["output_format"] == "columnar":
+        value = to_columnar(params, series, timestamps)
+    else:
+        value = series
+    return {"value": value, "changed": False, "failed": False}
 
 
 async def _query(params, session):
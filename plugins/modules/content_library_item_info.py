@@ -7,174 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: content_library_item_info
-short_description: Returns the {@link ItemModel} with the given identifier.
-description: Returns the {@link ItemModel} with the given identifier.
-options:
-    library_id:
-        description:
-        - Identifier of the library whose items should be returned. Required with
-            I(state=['list'])
-        type: str
-    library_item_id:
-        description:
-        - Identifier of the library item to return. Required with I(state=['get'])
-        type: str
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 2.0.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Create a content library pointing on a NFS share
-  vmware.vmware_rest.content_locallibrary:
-    name: my_library_on_nfs
-    description: automated
-    publish_info:
-      published: true
-      authentication_method: NONE
-    storage_backings:
-    - storage_uri: nfs://datastore.test/srv/share/content-library
-      type: OTHER
-    state: present
-  register: nfs_lib
-
-- name: Get the list of items of the NFS library
-  vmware.vmware_rest.content_library_item_info:
-    library_id: '{{ nfs_lib.id }}'
-  register: lib_items
-
-- name: Get the list of items of the NFS library
-  vmware.vmware_rest.content_library_item_info:
-    library_id: '{{ nfs_lib.id }}'
-  register: result
-
-- name: Create a new local content library
-  vmware.vmware_rest.content_locallibrary:
-    name: local_library_001
-    description: automated
-    publish_info:
-      published: true
-      authentication_method: NONE
-    storage_backings:
-    - datastore_id: "{{ lookup('vmware.vmware_rest.datastore_moid', '/my_dc/datastore/rw_datastore') }}"
-      type: DATASTORE
-    state: present
-  register: ds_lib
-
-- name: Get the (empty) list of items of the library
-  vmware.vmware_rest.content_library_item_info:
-    library_id: '{{ ds_lib.id }}'
-  register: result
-
-- name: Create subscribed library
-  vmware.vmware_rest.content_subscribedlibrary:
-    name: sub_lib
-    subscription_info:
-      subscription_url: '{{ nfs_lib.value.publish_info.publish_url }}'
-      authentication_method: NONE
-      automatic_sync_enabled: false
-      on_demand: true
-    storage_backings:
-    - datastore_id: "{{ lookup('vmware.vmware_rest.datastore_moid', '/my_dc/datastore/rw_datastore') }}"
-      type: DATASTORE
-  register: sub_lib
-
-- name: Ensure the OVF is here
-  vmware.vmware_rest.content_library_item_info:
-    library_id: '{{ sub_lib.id }}'
-  register: result
-
-- name: Create a content library based on a DataStore
-  vmware.vmware_rest.content_locallibrary:
-    name: my_library_on_datastore
-    description: automated
-    publish_info:
-      published: true
-      authentication_method: NONE
-    storage_backings:
-    - datastore_id: "{{ lookup('vmware.vmware_rest.datastore_moid', '/my_dc/datastore/local') }}"
-      type: DATASTORE
-    state: present
-  register: nfs_lib
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Ensure the OVF is here
-value:
-  description: Ensure the OVF is here
-  returned: On success
-  sample:
-  - cached: 0
-    content_version: '2'
-    creation_time: '2022-11-23T20:06:05.707Z'
-    description: an OVF example
-    id: f6618d6b-301b-4202-aa9c-12eb0c7536b1
-    last_modified_time: '2022-11-23T20:06:06.062Z'
-    last_sync_time: '2022-11-23T20:06:06.061Z'
-    library_id: 8b4e355e-a463-44f1-9b04-d0786a49cc7d
-    metadata_version: '1'
-    name: golden_image
-    security_compliance: 1
-    size: 0
-    source_id: 636ef270-b556-4972-924f-0d21b0f3bfce
-    type: ovf
-    version: '1'
-  type: list
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "get": {"query": {}, "body": {}, "path": {"library_item_id": "library_item_id"}},
@@ -197,9 +29,16 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     build_full_device_list,
+    compact_result,
+    dump_jsonl,
     exists,
+    fan_out,
     gen_args,
+    get_device_info,
+    iter_bounded,
     open_session,
+    run_with_deadline,
+    select_fields,
     session_timeout,
     update_changed_flag,
 )
@@ -209,17 +48,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -229,6 +68,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -239,10 +94,33 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
+    argument_spec["compact"] = {"type": "bool", "default": False}
+    argument_spec["concurrency"] = {"type": "int", "default": 10}
+    argument_spec["fields"] = {"type": "list", "elements": "str"}
+    argument_spec["flatten_value"] = {"type": "bool", "default": False}
     argument_spec["library_id"] = {"type": "str"}
     argument_spec["library_item_id"] = {"type": "str"}
+    argument_spec["name"] = {"type": "str"}
+    argument_spec["output_file"] = {"type": "path"}
+    argument_spec["type"] = {"type": "str"}
 
     return argument_spec
 
@@ -254,23 +132,38 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        if module.params["compact"]:
+            result = compact_result(result, module.params["flatten_value"])
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
+    if module.params["compact"]:
+        result = compact_result(result, module.params["flatten_value"])
     module.exit_json(**result)
 
 
@@ -296,9 +189,52 @@ def build_url(params):
     )
 
 
+def build_find_url(params):
+    return (
+        "https://{vcenter_hostname}" "/api/content/library/item?action=find"
+    ).format(**params)
+
+
+def prepare_find_spec(params):
+    spec = {"library_id": params["library_id"]}
+    for k in ["name", "type"]:
+        if params.get(k):
+            spec[k] = params[k]
+    return spec
+
+
+def build_item_url(params):
+    return ("https://{vcenter_hostname}" "/api/content/library/item").format(**params)
+
+
+async def iter_items(params, session, item_ids):
+    per_id_url = build_item_url(params)
+    coros = (get_device_info(session, per_id_url, _id) for _id in item_ids)
+    async for item in iter_bounded(coros, params["concurrency"]):
+        if item:
+            yield select_fields(item["value"], params["fields"])
+
+
 async def entry_point(module, session):
-    url = build_url(module.params)
-    async with session.get(url, **session_timeout(module.params)) as resp:
+    if module.params["concurrency"] < 1:
+        module.fail_json(
+            msg="concurrency must be at least 1, got {0}".format(
+                module.params["concurrency"]
+            )
+        )
+    if module.params.get("library_id") and (
+        module.params.get("name") or module.params.get("type")
+    ):
+        # Let vCenter filter the items before we fetch their details
+        request = session.post(
+            build_find_url(module.params),
+            json=prepare_find_spec(module.params),
+            **session_timeout(module.params),
+        )
+    else:
+        url = build_url(module.params)
+        request = session.get(url, **session_timeout(module.params))
+    async with request as resp:
         _json = await resp.json()
 
         if "value" not in _json:  # 7.0.2+
@@ -306,16 +242,31 @@ async def entry_point(module, session):
 
         if module.params.get("library_item_id"):
             _json["id"] = module.params.get("library_item_id")
+            _json["value"] = select_fields(_json["value"], module.params["fields"])
         elif module.params.get("label"):  # TODO extend the list of filter
             _json = await exists(module.params, session, str(url))
+        elif module.params.get("output_file") and isinstance(_json["value"], list):
+            items = iter_items(module.params, session, _json["value"])
+            _json = {"value": await dump_jsonl(module.params["output_file"], items)}
         elif (
             isinstance(_json["value"], list)
             and len(_json["value"]) > 0
             and isinstance(_json["value"][0], str)
         ):
             # this is a list of id, we fetch the details
-            full_device_list = await build_full_device_list(session, str(url), _json)
-            _json = {"value": [i["value"] for i in full_device_list]}
+            full_device_list = await build_full_device_list(
+                session,
+                build_item_url(module.params),
+                _json,
+                concurrency=module.params["concurrency"],
+            )
+            _json = {
+                "value": [
+                    select_fields(i["value"], module.params["fields"])
+                    for i in full_device_list
+                    if i
+                ]
+            }
 
         return await update_changed_flag(_json, resp.status, "get")
 
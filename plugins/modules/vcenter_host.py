@@ -7,156 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: vcenter_host
-short_description: Add a new standalone host in the vCenter inventory
-description: Add a new standalone host in the vCenter inventory. The newly connected
-    host will be in connected state. The vCenter Server will verify the SSL certificate
-    before adding the host to its inventory. In the case where the SSL certificate
-    cannot be verified because the Certificate Authority is not recognized or the
-    certificate is self signed, the vCenter Server will fall back to thumbprint verification
-    mode as defined by Host.CreateSpec.ThumbprintVerification.
-options:
-    folder:
-        description:
-        - Host and cluster folder in which the new standalone host should be created.
-        - This field is currently required. In the future, if this field is unset,
-            the system will attempt to choose a suitable folder for the host; if a
-            folder cannot be chosen, the host creation operation will fail.
-        - 'When clients pass a value of this structure as a parameter, the field must
-            be the id of a resource returned by M(vmware.vmware_rest.vcenter_folder_info). '
-        type: str
-    force_add:
-        description:
-        - Whether host should be added to the vCenter Server even if it is being managed
-            by another vCenter Server. The original vCenterServer loses connection
-            to the host.
-        - If unset, forceAdd is default to false.
-        type: bool
-    host:
-        description:
-        - Identifier of the host to be disconnected.
-        - The parameter must be the id of a resource returned by M(vmware.vmware_rest.vcenter_host_info).
-            Required with I(state=['absent', 'connect', 'disconnect'])
-        type: str
-    hostname:
-        description:
-        - The IP address or DNS resolvable name of the host. Required with I(state=['present'])
-        type: str
-    password:
-        description:
-        - The password for the administrator account on the host. Required with I(state=['present'])
-        type: str
-    port:
-        description:
-        - The port of the host.
-        - If unset, port 443 will be used.
-        type: int
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    state:
-        choices:
-        - absent
-        - connect
-        - disconnect
-        - present
-        default: present
-        description: []
-        type: str
-    thumbprint:
-        description:
-        - 'The thumbprint of the SSL certificate, which the host is expected to have.
-            The thumbprint is always computed using the SHA1 hash and is the string
-            representation of that hash in the format: xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx:xx
-            where, ''x'' represents a hexadecimal digit.'
-        - This field is optional and it is only relevant when the value of I(thumbprint_verification)
-            is THUMBPRINT.
-        type: str
-    thumbprint_verification:
-        choices:
-        - NONE
-        - THUMBPRINT
-        description:
-        - The I(thumbprint_verification) enumerated type defines the thumbprint verification
-            schemes for a host's SSL certificate. Required with I(state=['present'])
-        type: str
-    user_name:
-        description:
-        - The administrator account on the host. Required with I(state=['present'])
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 0.1.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Connect the host(s)
-  vmware.vmware_rest.vcenter_host:
-    hostname: "{{ lookup('env', 'ESXI1_HOSTNAME') }}"
-    user_name: "{{ lookup('env', 'ESXI1_USERNAME') }}"
-    password: "{{ lookup('env', 'ESXI1_PASSWORD') }}"
-    thumbprint_verification: NONE
-    folder: '{{ my_host_folder.folder }}'
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Connect the host(s)
-value:
-  description: Connect the host(s)
-  returned: On success
-  sample: host-1013
-  type: str
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "disconnect": {"query": {}, "body": {}, "path": {"host": "host"}},
@@ -194,11 +44,14 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
     gen_args,
     get_device_info,
     get_subdevice_type,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -208,17 +61,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -228,6 +81,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -238,6 +107,22 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
     argument_spec["folder"] = {"type": "str"}
@@ -268,23 +153,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
@@ -7,275 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: vcenter_ovf_libraryitem
-short_description: Creates a library item in content library from a virtual machine
-    or virtual appliance
-description: Creates a library item in content library from a virtual machine or virtual
-    appliance. <p> This {@term operation} creates a library item in content library
-    whose content is an OVF package derived from a source virtual machine or virtual
-    appliance, using the supplied create specification. The OVF package may be stored
-    as in a newly created library item or in an in an existing library item. For an
-    existing library item whose content is updated by this {@term operation}, the
-    original content is overwritten. Meta data such as name and description is not
-    updated for the exisitng library item. </p>
-options:
-    client_token:
-        description:
-        - Client-generated token used to retry a request if the client fails to get
-            a response from the server. If the original request succeeded, the result
-            of that request will be returned, otherwise the operation will be retried.
-        type: str
-    create_spec:
-        description:
-        - Information used to create the OVF package from the source virtual machine
-            or virtual appliance. Required with I(state=['present'])
-        - 'Valid attributes are:'
-        - ' - C(name) (str): Name to use in the OVF descriptor stored in the library
-            item. ([''present''])'
-        - ' - C(description) (str): Description to use in the OVF descriptor stored
-            in the library item. ([''present''])'
-        - ' - C(flags) (list): Flags to use for OVF package creation. The supported
-            flags can be obtained using {@link ExportFlag#list}. ([''present''])'
-        type: dict
-    deployment_spec:
-        description:
-        - Specification of how the OVF package should be deployed to the target. Required
-            with I(state=['deploy'])
-        - 'Valid attributes are:'
-        - ' - C(name) (str): Name assigned to the deployed target virtual machine
-            or virtual appliance. ([''deploy''])'
-        - ' - C(annotation) (str): Annotation assigned to the deployed target virtual
-            machine or virtual appliance. ([''deploy''])'
-        - ' - C(accept_all_EULA) (bool): Whether to accept all End User License Agreements.
-            ([''deploy''])'
-        - '   This key is required with [''deploy''].'
-        - ' - C(network_mappings) (dict): Specification of the target network to use
-            for sections of type ovf:NetworkSection in the OVF descriptor. The key
-            in the {@term map} is the section identifier of the ovf:NetworkSection
-            section in the OVF descriptor and the value is the target network to be
-            used for deployment. ([''deploy''])'
-        - ' - C(storage_mappings) (dict): Specification of the target storage to use
-            for sections of type vmw:StorageGroupSection in the OVF descriptor. The
-            key in the {@term map} is the section identifier of the ovf:StorageGroupSection
-            section in the OVF descriptor and the value is the target storage specification
-            to be used for deployment. ([''deploy''])'
-        - ' - C(storage_provisioning) (str): The C(disk_provisioning_type) defines
-            the virtual disk provisioning types that can be set for a disk on the
-            target platform. ([''deploy''])'
-        - '   - Accepted values:'
-        - '     - eagerZeroedThick'
-        - '     - thick'
-        - '     - thin'
-        - ' - C(storage_profile_id) (str): Default storage profile to use for all
-            sections of type vmw:StorageSection in the OVF descriptor. ([''deploy''])'
-        - ' - C(locale) (str): The locale to use for parsing the OVF descriptor. ([''deploy''])'
-        - ' - C(flags) (list): Flags to be use for deployment. The supported flag
-            values can be obtained using {@link ImportFlag#list}. ([''deploy''])'
-        - ' - C(additional_parameters) (list): Additional OVF parameters that may
-            be needed for the deployment. Additional OVF parameters may be required
-            by the OVF descriptor of the OVF package in the library item. Examples
-            of OVF parameters that can be specified through this field include, but
-            are not limited to: <ul> <li>{@link DeploymentOptionParams}</li> <li>{@link
-            ExtraConfigParams}</li> <li>{@link IpAllocationParams}</li> <li>{@link
-            PropertyParams}</li> <li>{@link ScaleOutParams}</li> <li>{@link VcenterExtensionParams}</li>
-            </ul> ([''deploy''])'
-        - ' - C(default_datastore_id) (str): Default datastore to use for all sections
-            of type vmw:StorageSection in the OVF descriptor. ([''deploy''])'
-        type: dict
-    ovf_library_item_id:
-        description:
-        - Identifier of the content library item containing the OVF package to be
-            deployed. Required with I(state=['deploy', 'filter'])
-        type: str
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    source:
-        description:
-        - Identifier of the virtual machine or virtual appliance to use as the source.
-            Required with I(state=['present'])
-        - 'Valid attributes are:'
-        - ' - C(type) (str): Type of the deployable resource. ([''present''])'
-        - '   This key is required with [''present''].'
-        - ' - C(id) (str): Identifier of the deployable resource. ([''present''])'
-        - '   This key is required with [''present''].'
-        type: dict
-    state:
-        choices:
-        - deploy
-        - filter
-        - present
-        default: present
-        description: []
-        type: str
-    target:
-        description:
-        - Specification of the target content library and library item. This parameter
-            is mandatory.
-        - 'Valid attributes are:'
-        - ' - C(library_id) (str): Identifier of the library in which a new library
-            item should be created. This field is not used if the C(#library_item_id)
-            field is specified. ([''present''])'
-        - ' - C(library_item_id) (str): Identifier of the library item that should
-            be should be updated. ([''present''])'
-        - ' - C(resource_pool_id) (str): Identifier of the resource pool to which
-            the virtual machine or virtual appliance should be attached. ([''deploy'',
-            ''filter''])'
-        - '   This key is required with [''deploy'', ''filter''].'
-        - ' - C(host_id) (str): Identifier of the target host on which the virtual
-            machine or virtual appliance will run. The target host must be a member
-            of the cluster that contains the resource pool identified by {@link #resourcePoolId}.
-            ([''deploy'', ''filter''])'
-        - ' - C(folder_id) (str): Identifier of the vCenter folder that should contain
-            the virtual machine or virtual appliance. The folder must be virtual machine
-            folder. ([''deploy'', ''filter''])'
-        required: true
-        type: dict
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 2.0.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Create a VM
-  vmware.vmware_rest.vcenter_vm:
-    placement:
-      cluster: "{{ lookup('vmware.vmware_rest.cluster_moid', '/my_dc/host/my_cluster') }}"
-      datastore: "{{ lookup('vmware.vmware_rest.datastore_moid', '/my_dc/datastore/rw_datastore') }}"
-      folder: "{{ lookup('vmware.vmware_rest.folder_moid', '/my_dc/vm') }}"
-      resource_pool: "{{ lookup('vmware.vmware_rest.resource_pool_moid', '/my_dc/host/my_cluster/Resources') }}"
-    name: test_vm1
-    guest_OS: RHEL_7_64
-    hardware_version: VMX_11
-    memory:
-      hot_add_enabled: true
-      size_MiB: 1024
-  register: my_vm
-
-- name: Create a content library pointing on a NFS share
-  vmware.vmware_rest.content_locallibrary:
-    name: my_library_on_nfs
-    description: automated
-    publish_info:
-      published: true
-      authentication_method: NONE
-    storage_backings:
-    - storage_uri: nfs://datastore.test/srv/share/content-library
-      type: OTHER
-    state: present
-  register: nfs_lib
-
-- name: Export the VM as an OVF on the library
-  vmware.vmware_rest.vcenter_ovf_libraryitem:
-    session_timeout: 2900
-    source:
-      type: VirtualMachine
-      id: '{{ my_vm.id }}'
-    target:
-      library_id: '{{ nfs_lib.id }}'
-    create_spec:
-      name: golden_image
-      description: an OVF example
-      flags: []
-    state: present
-  register: ovf_item
-
-- name: Get the list of items of the NFS library
-  vmware.vmware_rest.content_library_item_info:
-    library_id: '{{ nfs_lib.id }}'
-  register: lib_items
-
-- name: Create a new VM from the OVF
-  vmware.vmware_rest.vcenter_ovf_libraryitem:
-    ovf_library_item_id: '{{ (lib_items.value|selectattr("name", "equalto", "golden_image")|first).id }}'
-    state: deploy
-    target:
-      resource_pool_id: "{{ lookup('vmware.vmware_rest.resource_pool_moid', '/my_dc/host/my_cluster/Resources') }}"
-    deployment_spec:
-      name: my_vm_from_ovf
-      accept_all_EULA: true
-      storage_provisioning: thin
-
-- name: Create a new VM from the OVF and specify the host and folder
-  vmware.vmware_rest.vcenter_ovf_libraryitem:
-    ovf_library_item_id: '{{ (lib_items.value|selectattr("name", "equalto", "golden_image")|first).id }}'
-    state: deploy
-    target:
-      resource_pool_id: "{{ lookup('vmware.vmware_rest.resource_pool_moid', '/my_dc/host/my_cluster/Resources') }}"
-      folder_id: "{{ lookup('vmware.vmware_rest.folder_moid', '/my_dc/vm') }}"
-      host_id: "{{ lookup('vmware.vmware_rest.host_moid', '/my_dc/host/my_cluster/esxi1.test/test_vm1') }}"
-    deployment_spec:
-      name: my_vm_from_ovf_on_a_host
-      accept_all_EULA: true
-      storage_provisioning: thin
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Create a new VM from the OVF and specify the host and folder
-value:
-  description: Create a new VM from the OVF and specify the host and folder
-  returned: On success
-  sample:
-    error:
-      errors: []
-      information: []
-      warnings: []
-    resource_id:
-      id: vm-1078
-      type: VirtualMachine
-    succeeded: 1
-  type: dict
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "filter": {
@@ -311,11 +42,15 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
+    gather_bounded,
     gen_args,
     get_device_info,
     get_subdevice_type,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -325,17 +60,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -345,6 +80,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -355,12 +106,39 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
     argument_spec["client_token"] = {"no_log": True, "type": "str"}
+    argument_spec["concurrency"] = {"type": "int", "default": 10}
     argument_spec["create_spec"] = {"type": "dict"}
     argument_spec["deployment_spec"] = {"type": "dict"}
+    argument_spec["deployments"] = {
+        "type": "list",
+        "elements": "dict",
+        "options": {
+            "deployment_spec": {"type": "dict"},
+            "name": {"required": True, "type": "str"},
+            "target": {"type": "dict"},
+        },
+    }
     argument_spec["ovf_library_item_id"] = {"type": "str"}
+    argument_spec["placements"] = {"type": "list", "elements": "dict"}
     argument_spec["source"] = {"type": "dict"}
     argument_spec["state"] = {
         "type": "str",
@@ -379,23 +157,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
@@ -484,7 +275,58 @@ async def _create(params, session):
         return await update_changed_flag(_json, resp.status, "create")
 
 
+async def _deploy_many(params, session):
+    if params["concurrency"] < 1:
+        return {
+            "failed": True,
+            "msg": "concurrency must be at least 1, got {0}".format(
+                params["concurrency"]
+            ),
+        }
+    if not params["target"]:
+        return {"failed": True, "msg": "target is required with deployments"}
+    ovf_summary = await _filter(params, session)
+    if ovf_summary.get("failed"):
+        return ovf_summary
+
+    base_spec = dict(params["deployment_spec"] or {})
+    if "additional_parameters" not in base_spec:
+        base_spec["additional_parameters"] = ovf_summary["value"].get(
+            "additional_params", []
+        )
+    placements = params["placements"] or [{}]
+
+    async def deploy_one(index, deployment):
+        _params = dict(params, deployments=None)
+        _params["target"] = {
+            **params["target"],
+            **placements[index % len(placements)],
+            **(deployment.get("target") or {}),
+        }
+        _params["deployment_spec"] = {
+            **base_spec,
+            "name": deployment["name"],
+            **(deployment.get("deployment_spec") or {}),
+        }
+        result = await _deploy(_params, session)
+        result["name"] = deployment["name"]
+        result["target"] = _params["target"]
+        return result
+
+    results = await gather_bounded(
+        [deploy_one(i, d) for i, d in enumerate(params["deployments"])],
+        params["concurrency"],
+    )
+    return {
+        "value": results,
+        "changed": any(i.get("changed") for i in results),
+        "failed": any(i.get("failed") for i in results),
+    }
+
+
 async def _deploy(params, session):
+    if params["deployments"]:
+        return await _deploy_many(params, session)
     _in_query_parameters = PAYLOAD_FORMAT["deploy"]["query"].keys()
     payload = prepare_payload(params, PAYLOAD_FORMAT["deploy"])
     subdevice_type = get_subdevice_type(
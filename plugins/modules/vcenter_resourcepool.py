@@ -7,248 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: vcenter_resourcepool
-short_description: Creates a resource pool.
-description: Creates a resource pool.
-options:
-    cpu_allocation:
-        description:
-        - Resource allocation for CPU.
-        - if unset or empty, the CPU allocation of the resource pool will not be changed.
-        - 'Valid attributes are:'
-        - ' - C(reservation) (int): Amount of resource that is guaranteed available
-            to a resource pool. Reserved resources are not wasted if they are not
-            used. If the utilization is less than the reservation, the resources can
-            be utilized by other running virtual machines. Units are MB fo memory,
-            and MHz for CPU.'
-        - If unset or empty, I(reservation) will be set to 0. (['present'])
-        - ' - C(expandable_reservation) (bool): In a resource pool with an expandable
-            reservation, the reservation can grow beyond the specified value, if the
-            parent resource pool has unreserved resources. A non-expandable reservation
-            is called a fixed reservation.'
-        - If unset or empty, I(expandable_reservation) will be set to true. (['present'])
-        - ' - C(limit) (int): The utilization of a resource pool will not exceed this
-            limit, even if there are available resources. This is typically used to
-            ensure a consistent performance of resource pools independent of available
-            resources. If set to -1, then there is no fixed limit on resource usage
-            (only bounded by available resources and shares). Units are MB for memory,
-            and MHz for CPU.'
-        - If unset or empty, I(limit) will be set to -1. (['present'])
-        - ' - C(shares) (dict): Shares are used in case of resource contention. ([''present''])'
-        - '   - Accepted keys:'
-        - '     - level (string): This option defines the possible values for the
-            allocation level.'
-        - 'Accepted value for this field:'
-        - '       - C(CUSTOM)'
-        - '       - C(HIGH)'
-        - '       - C(LOW)'
-        - '       - C(NORMAL)'
-        - '     - shares (integer): When I(level) is set to CUSTOM, it is the number
-            of shares allocated. Otherwise, this value is ignored. '
-        - ' There is no unit for this value. It is a relative measure based on the
-            settings for other resource pools.'
-        - ''
-        - This field is optional and it is only relevant when the value of I(level)
-            is CUSTOM.
-        type: dict
-    memory_allocation:
-        description:
-        - Resource allocation for CPU.
-        - if unset or empty, the CPU allocation of the resource pool will not be changed.
-        - 'Valid attributes are:'
-        - ' - C(reservation) (int): Amount of resource that is guaranteed available
-            to a resource pool. Reserved resources are not wasted if they are not
-            used. If the utilization is less than the reservation, the resources can
-            be utilized by other running virtual machines. Units are MB fo memory,
-            and MHz for CPU.'
-        - If unset or empty, I(reservation) will be set to 0. (['present'])
-        - ' - C(expandable_reservation) (bool): In a resource pool with an expandable
-            reservation, the reservation can grow beyond the specified value, if the
-            parent resource pool has unreserved resources. A non-expandable reservation
-            is called a fixed reservation.'
-        - If unset or empty, I(expandable_reservation) will be set to true. (['present'])
-        - ' - C(limit) (int): The utilization of a resource pool will not exceed this
-            limit, even if there are available resources. This is typically used to
-            ensure a consistent performance of resource pools independent of available
-            resources. If set to -1, then there is no fixed limit on resource usage
-            (only bounded by available resources and shares). Units are MB for memory,
-            and MHz for CPU.'
-        - If unset or empty, I(limit) will be set to -1. (['present'])
-        - ' - C(shares) (dict): Shares are used in case of resource contention. ([''present''])'
-        - '   - Accepted keys:'
-        - '     - level (string): This option defines the possible values for the
-            allocation level.'
-        - 'Accepted value for this field:'
-        - '       - C(CUSTOM)'
-        - '       - C(HIGH)'
-        - '       - C(LOW)'
-        - '       - C(NORMAL)'
-        - '     - shares (integer): When I(level) is set to CUSTOM, it is the number
-            of shares allocated. Otherwise, this value is ignored. '
-        - ' There is no unit for this value. It is a relative measure based on the
-            settings for other resource pools.'
-        - ''
-        - This field is optional and it is only relevant when the value of I(level)
-            is CUSTOM.
-        type: dict
-    name:
-        description:
-        - Name of the resource pool.
-        - if unset or empty, the name of the resource pool will not be changed. Required
-            with I(state=['present'])
-        type: str
-    parent:
-        description:
-        - Parent of the created resource pool.
-        - When clients pass a value of this structure as a parameter, the field must
-            be the id of a resource returned by M(vmware.vmware_rest.vcenter_resourcepool_info).
-            Required with I(state=['present'])
-        type: str
-    resource_pool:
-        description:
-        - Identifier of the resource pool to be deleted.
-        - The parameter must be the id of a resource returned by M(vmware.vmware_rest.vcenter_resourcepool_info).
-            Required with I(state=['absent', 'present'])
-        type: str
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    state:
-        choices:
-        - absent
-        - present
-        default: present
-        description: []
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 0.3.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Get the existing resource pools
-  vmware.vmware_rest.vcenter_resourcepool_info:
-  register: resource_pools
-- name: Create an Ad hoc resource pool
-  vmware.vmware_rest.vcenter_resourcepool:
-    name: my_resource_pool
-    parent: '{{ resource_pools.value[0].resource_pool }}'
-    cpu_allocation:
-      expandable_reservation: true
-      limit: 40
-      reservation: 0
-      shares:
-        level: NORMAL
-    memory_allocation:
-      expandable_reservation: false
-      limit: 2000
-      reservation: 0
-      shares:
-        level: NORMAL
-  register: my_resource_pool
-- name: Remove a resource pool
-  vmware.vmware_rest.vcenter_resourcepool:
-    resource_pool: '{{ my_resource_pool.id }}'
-    state: absent
-- name: Create a generic resource pool
-  vmware.vmware_rest.vcenter_resourcepool:
-    name: my_resource_pool
-    parent: '{{ resource_pools.value[0].resource_pool }}'
-  register: my_resource_pool
-- name: Modify a resource pool
-  vmware.vmware_rest.vcenter_resourcepool:
-    resource_pool: '{{ my_resource_pool.id }}'
-    cpu_allocation:
-      expandable_reservation: true
-      limit: -1
-      reservation: 0
-      shares:
-        level: NORMAL
-    memory_allocation:
-      expandable_reservation: false
-      limit: 1000
-      reservation: 0
-      shares:
-        level: NORMAL
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Create a generic resource pool
-id:
-  description: moid of the resource
-  returned: On success
-  sample: resgroup-1009
-  type: str
-value:
-  description: Create a generic resource pool
-  returned: On success
-  sample:
-    cpu_allocation:
-      expandable_reservation: 1
-      limit: -1
-      reservation: 0
-      shares:
-        level: NORMAL
-    memory_allocation:
-      expandable_reservation: 1
-      limit: -1
-      reservation: 0
-      shares:
-        level: NORMAL
-    name: my_resource_pool
-    resource_pools: []
-  type: dict
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "update": {
@@ -289,11 +47,14 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
     gen_args,
     get_device_info,
     get_subdevice_type,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -303,17 +64,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -323,6 +84,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -333,6 +110,22 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
     argument_spec["cpu_allocation"] = {"type": "dict"}
@@ -356,23 +149,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
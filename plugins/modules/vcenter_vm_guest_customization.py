@@ -7,253 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: vcenter_vm_guest_customization
-short_description: Applies a customization specification on the virtual machine
-description: Applies a customization specification on the virtual machine in {@param.name
-    vm}. The actual customization happens inside the guest when the virtual machine
-    is powered on. If there is a pending customization for the virtual machine and
-    a new one is set, then the existing customization setting will be overwritten
-    with the new settings.
-options:
-    configuration_spec:
-        description:
-        - Settings to be applied to the guest during the customization. This parameter
-            is mandatory.
-        - 'Valid attributes are:'
-        - ' - C(windows_config) (dict): Guest customization specification for a Windows
-            guest operating system'
-        - If unset, ConfigurationSpec.linux-config or ConfigurationSpec.cloud-config
-            must be set. Otherwise, an appropriate fault will be thrown. (['set'])
-        - '   - Accepted keys:'
-        - '     - reboot (string): This option specifies what should be done to the
-            guest after the customization.'
-        - 'Accepted value for this field:'
-        - '       - C(NO_REBOOT)'
-        - '       - C(REBOOT)'
-        - '       - C(SHUTDOWN)'
-        - '     - sysprep (object): Customization settings like user details, administrator
-            details, etc for the windows guest operating system. Exactly one of WindowsConfiguration.sysprep
-            or WindowsConfiguration.sysprep-xml must be specified.'
-        - If unset, sysprep settings will not be applied to the windows guest operating
-            system.
-        - '     - sysprep_xml (string): All settings specified in a XML format. This
-            is the content of a typical answer.xml file that is used by System administrators
-            during the Windows image customization. Check https://docs.microsoft.com/en-us/windows-hardware/manufacture/desktop/update-windows-settings-and-scripts-create-your-own-answer-file-sxs
-            Exactly one of WindowsConfiguration.sysprep or WindowsConfiguration.sysprep-xml
-            must be specified.'
-        - If unset, sysprep settings will not be applied to the windows guest operating
-            system.
-        - ' - C(linux_config) (dict): Guest customization specification for a linux
-            guest operating system'
-        - If unset, ConfigurationSpec.windows-config or ConfigurationSpec.cloud-config
-            must be set. Otherwise, an appropriate fault will be thrown. (['set'])
-        - '   - Accepted keys:'
-        - '     - hostname (object): The computer name of the (Windows) virtual machine.
-            A computer name may contain letters (A-Z), numbers(0-9) and hyphens (-)
-            but no spaces or periods (.). The name may not consist entirely of digits.
-            A computer name is restricted to 15 characters in length. If the computer
-            name is longer than 15 characters, it will be truncated to 15 characters.
-            Check HostnameGenerator for various options.'
-        - '     - domain (string): The fully qualified domain name.'
-        - '     - time_zone (string): The case-sensitive time zone, such as Europe/Sofia.
-            Valid time zone values are based on the tz (time zone) database used by
-            Linux. The values are strings (string) in the form "Area/Location," in
-            which Area is a continent or ocean name, and Location is the city, island,
-            or other regional designation. '
-        - ' See the https://kb.vmware.com/kb/2145518 for a list of supported time
-            zones for different versions in Linux.'
-        - ''
-        - If unset, time zone is not modified inside guest operating system.
-        - '     - script_text (string): The script to run before and after Linux guest
-            customization.'
-        - ' The max size of the script is 1500 bytes. As long as the script (shell,
-            perl, python...) has the right "#!" in the header, it is supported. The
-            caller should not assume any environment variables when the script is
-            run. '
-        - ' The script is invoked by the customization engine using the command line:
-            1) with argument "precustomization" before customization, 2) with argument
-            "postcustomization" after customization. The script should parse this
-            argument and implement pre-customization or post-customization task code
-            details in the corresponding block. '
-        - ''
-        - ' A Linux shell script example: '
-        - ''
-        - '  #!/bin/sh'
-        - ' if [ x$1 == x"precustomization" ]; then'
-        - ' echo "Do Precustomization tasks"'
-        - ' #code for pre-customization actions...'
-        - ' elif [ x$1 == x"postcustomization" ]; then'
-        - ' echo "Do Postcustomization tasks"'
-        - ' #code for post-customization actions...'
-        - ' fi'
-        - ' '
-        - ''
-        - If unset, no script will be executed.
-        - ' - C(cloud_config) (dict): Guest customization specification with cloud
-            configuration.'
-        - If unset, ConfigurationSpec.windows-config or ConfigurationSpec.linux-config
-            must be set. Otherwise, an appropriate fault will be thrown. (['set'])
-        - '   - Accepted keys:'
-        - '     - type (string): This option specifies different types of the cloud
-            configuration.'
-        - 'Accepted value for this field:'
-        - '       - C(CLOUDINIT)'
-        - '     - cloudinit (object): cloud-init configuration'
-        - This field is optional and it is only relevant when the value of CloudConfiguration.type
-            is CLOUDINIT.
-        required: true
-        type: dict
-    global_DNS_settings:
-        description:
-        - Global DNS settings constitute the DNS settings that are not specific to
-            a particular virtual network adapter. This parameter is mandatory.
-        - 'Valid attributes are:'
-        - ' - C(dns_suffix_list) (list): List of name resolution suffixes for the
-            virtual network adapter. This list applies to both Windows and Linux guest
-            customization. For Linux, this setting is global, whereas in Windows,
-            this setting is listed on a per-adapter basis.'
-        - If unset, no DNS suffixes are set. (['set'])
-        - ' - C(dns_servers) (list): List of DNS servers, for a virtual network adapter
-            with a static IP address. If this list is empty, then the guest operating
-            system is expected to use a DHCP server to get its DNS server settings.
-            These settings configure the virtual machine to use the specified DNS
-            servers. These DNS server settings are listed in the order of preference.'
-        - If unset, no DNS servers are set. (['set'])
-        required: true
-        type: dict
-    interfaces:
-        description:
-        - IP settings that are specific to a particular virtual network adapter. The
-            AdapterMapping structure maps a network adapter's MAC address to its IPSettings.
-            May be empty if there are no network adapters, else should match number
-            of network adapters configured for the VM. This parameter is mandatory.
-        - 'Valid attributes are:'
-        - ' - C(mac_address) (str): The MAC address of a network adapter being customized.'
-        - If unset, the customization process maps the the settings from the list
-            of I(i_p_settings) in the CustomizationSpec.interfaces to the virtual
-            machine's network adapters, in PCI slot order. The first virtual network
-            adapter on the PCI bus is assigned interfaces[0].IPSettings, the second
-            adapter is assigned interfaces[1].IPSettings, and so on. (['set'])
-        - ' - C(adapter) (dict): The IP settings for the associated virtual network
-            adapter. ([''set''])'
-        - '   This key is required with [''set''].'
-        - '   - Accepted keys:'
-        - '     - ipv4 (object): Specification to configure IPv4 address, subnet mask
-            and gateway info for this virtual network adapter.'
-        - If unset, no IPv4 addresses are set.
-        - '     - ipv6 (object): Specification to configure IPv6 address, subnet mask
-            and gateway info for this virtual network adapter.'
-        - If unset, no IPv6 addresses are set.
-        - '     - windows (object): Windows settings to be configured for this specific
-            virtual Network adapter. This is valid only for Windows guest operating
-            systems.'
-        - If unset, no specific Windows settings are set.
-        elements: dict
-        required: true
-        type: list
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    state:
-        choices:
-        - set
-        default: set
-        description: []
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-    vm:
-        description:
-        - The unique identifier of the virtual machine that needs to be customized.
-        - The parameter must be the id of a resource returned by M(vmware.vmware_rest.vcenter_vm_info).
-            This parameter is mandatory.
-        required: true
-        type: str
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 0.1.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Customize the VM
-  vmware.vmware_rest.vcenter_vm_guest_customization:
-    vm: "{{ lookup('vmware.vmware_rest.vm_moid', '/my_dc/vm/test_vm1') }}"
-    configuration_spec:
-      linux_config:
-        domain: mydomain
-        hostname:
-          fixed_name: foobar
-          type: FIXED
-    interfaces:
-    - adapter:
-        ipv4:
-          type: STATIC
-          gateways:
-          - 192.168.123.1
-          ip_address: 192.168.123.50
-          prefix: 24
-    global_DNS_settings:
-      dns_suffix_list: []
-      dns_servers:
-      - 1.1.1.1
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Customize the VM
-value:
-  description: Customize the VM
-  returned: On success
-  sample: {}
-  type: dict
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "set": {
@@ -267,6 +20,8 @@ PAYLOAD_FORMAT = {
     }
 }  # pylint: disable=line-too-long
 
+import asyncio
+
 from ansible.module_utils.basic import env_fallback
 
 try:
@@ -283,10 +38,16 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
+    gather_bounded_by_key,
     gen_args,
+    get_aiohttp,
     get_subdevice_type,
+    get_vm_hosts,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -296,17 +57,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -316,6 +77,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -326,13 +103,42 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
-    argument_spec["configuration_spec"] = {"required": True, "type": "dict"}
-    argument_spec["global_DNS_settings"] = {"required": True, "type": "dict"}
-    argument_spec["interfaces"] = {"required": True, "type": "list", "elements": "dict"}
+    argument_spec["concurrency"] = {"type": "int", "default": 10}
+    argument_spec["configuration_spec"] = {"type": "dict"}
+    argument_spec["global_DNS_settings"] = {"type": "dict"}
+    argument_spec["host_concurrency"] = {"type": "int"}
+    argument_spec["interfaces"] = {"type": "list", "elements": "dict"}
+    argument_spec["power_on"] = {"type": "bool", "default": False}
     argument_spec["state"] = {"type": "str", "choices": ["set"], "default": "set"}
-    argument_spec["vm"] = {"required": True, "type": "str"}
+    argument_spec["vm"] = {"type": "str"}
+    argument_spec["vms"] = {
+        "type": "list",
+        "elements": "dict",
+        "options": {
+            "configuration_spec": {"type": "dict"},
+            "global_DNS_settings": {"type": "dict"},
+            "interfaces": {"type": "list", "elements": "dict"},
+            "vm": {"required": True, "type": "str"},
+        },
+    }
 
     return argument_spec
 
@@ -344,23 +150,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
@@ -384,7 +203,94 @@ async def entry_point(module, session):
 
     func = globals()["_" + operation]
 
-    return await func(module.params, session)
+    if module.params["vms"]:
+        return await _batch(module.params, session, func)
+    if not module.params["vm"]:
+        return {"failed": True, "msg": "one of the following is required: vm, vms"}
+    return await _customize(module.params, session, func)
+
+
+SPEC_KEYS = ["configuration_spec", "global_DNS_settings", "interfaces"]
+
+
+def merge_spec(base, overrides):
+    """Return base updated with overrides, the dictionaries are merged recursively."""
+    if not isinstance(base, dict) or not isinstance(overrides, dict):
+        return overrides
+    merged = dict(base)
+    for k, v in overrides.items():
+        merged[k] = merge_spec(base.get(k), v) if v is not None else base.get(k)
+    return merged
+
+
+def render_params(params, entry):
+    rendered = dict(params, vm=entry["vm"])
+    for key in SPEC_KEYS:
+        if entry.get(key) is not None:
+            rendered[key] = merge_spec(params[key], entry[key])
+    return rendered
+
+
+async def _power_on(params, session):
+    _url = (
+        "https://{vcenter_hostname}" "/api/vcenter/vm/{vm}/power?action=start"
+    ).format(**params)
+    async with session.post(_url, **session_timeout(params)) as resp:
+        _json = {}
+        if resp.headers.get("Content-Type") == "application/json":
+            _json = await resp.json()
+        result = await update_changed_flag(_json, resp.status, "start")
+        if "changed" not in result:
+            result["failed"] = False
+            result["changed"] = True
+        return result
+
+
+async def _customize(params, session, func):
+    missing = [key for key in SPEC_KEYS if params[key] is None]
+    if missing:
+        return {
+            "failed": True,
+            "msg": "missing required arguments: {0}".format(", ".join(missing)),
+        }
+    result = await func(params, session)
+    if params["power_on"] and not result.get("failed"):
+        power = await _power_on(params, session)
+        result["power"] = power
+        result["changed"] = result.get("changed") or power.get("changed", False)
+        result["failed"] = power.get("failed", False)
+    return result
+
+
+async def _batch(params, session, func):
+    vms = [entry["vm"] for entry in params["vms"]]
+    aiohttp = get_aiohttp()
+
+    async def _run(entry):
+        try:
+            return await _customize(render_params(params, entry), session, func)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            # Not the deadline of the task nor an open circuit, they fail the task
+            return {"failed": True, "msg": f"{type(err).__name__}: {err}"}
+
+    vm_hosts = {}
+    if params["host_concurrency"]:
+        vm_hosts = await get_vm_hosts(params, session)
+    results = await gather_bounded_by_key(
+        [(vm_hosts.get(entry["vm"]), _run(entry)) for entry in params["vms"]],
+        params["concurrency"],
+        params["host_concurrency"],
+    )
+    value = dict(zip(vms, results))
+    failed = [vm for vm, result in value.items() if result.get("failed")]
+    result = {
+        "value": value,
+        "changed": any(r.get("changed") for r in results),
+        "failed": bool(failed),
+    }
+    if failed:
+        result["msg"] = "Failed on: {0}".format(", ".join(failed))
+    return result
 
 
 async def _set(params, session):
@@ -7,200 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: vcenter_vm_guest_filesystem_directories
-short_description: Creates a directory in the guest operating system
-description: 'Creates a directory in the guest operating system. '
-options:
-    create_parents:
-        description:
-        - Whether any parent directories should be created. If any failure occurs,
-            some parent directories could be left behind.
-        - If unset parent directories are not created.
-        type: bool
-    credentials:
-        description:
-        - The guest authentication data. This parameter is mandatory.
-        - 'Valid attributes are:'
-        - ' - C(interactive_session) (bool): If set, the operation will interact with
-            the logged-in desktop session in the guest. This requires that the logged-on
-            user matches the user specified by the Credentials. This is currently
-            only supported for USERNAME_PASSWORD. ([''absent'', ''create_temporary'',
-            ''move'', ''present''])'
-        - '   This key is required with [''absent'', ''create_temporary'', ''move'',
-            ''present''].'
-        - ' - C(type) (str): Types of guest credentials ([''absent'', ''create_temporary'',
-            ''move'', ''present''])'
-        - '   This key is required with [''absent'', ''create_temporary'', ''move'',
-            ''present''].'
-        - '   - Accepted values:'
-        - '     - SAML_BEARER_TOKEN'
-        - '     - USERNAME_PASSWORD'
-        - ' - C(user_name) (str): For SAML_BEARER_TOKEN, this is the guest user to
-            be associated with the credentials. For USERNAME_PASSWORD this is the
-            guest username.'
-        - If no user is specified for SAML_BEARER_TOKEN, a guest dependent mapping
-            will decide what guest user account is applied. (['absent', 'create_temporary',
-            'move', 'present'])
-        - ' - C(password) (str): password'
-        - This field is optional and it is only relevant when the value of Credentials.type
-            is USERNAME_PASSWORD. (['absent', 'create_temporary', 'move', 'present'])
-        - ' - C(saml_token) (str): SAML Bearer Token'
-        - This field is optional and it is only relevant when the value of Credentials.type
-            is SAML_BEARER_TOKEN. (['absent', 'create_temporary', 'move', 'present'])
-        required: true
-        type: dict
-    new_path:
-        description:
-        - The complete path to where the directory is moved or its new name. It cannot
-            be a path to an existing directory or an existing file. Required with
-            I(state=['move'])
-        type: str
-    parent_path:
-        description:
-        - The complete path to the directory in which to create the new directory.
-        - Directory If unset a guest-specific default will be used.
-        type: str
-    path:
-        description:
-        - The complete path to the directory to be created. Required with I(state=['absent',
-            'move', 'present'])
-        type: str
-    prefix:
-        description:
-        - The prefix to be given to the new temporary directory. Required with I(state=['create_temporary'])
-        type: str
-    recursive:
-        description:
-        - If true, all files and subdirectories are also deleted. If false, the directory
-            must be empty for the operation to succeed.
-        - If unset, any directory content is not deleted.
-        type: bool
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    state:
-        choices:
-        - absent
-        - create_temporary
-        - move
-        - present
-        default: present
-        description: []
-        type: str
-    suffix:
-        description:
-        - The suffix to be given to the new temporary directory. Required with I(state=['create_temporary'])
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-    vm:
-        description:
-        - Virtual Machine to perform the operation on.
-        - The parameter must be the id of a resource returned by M(vmware.vmware_rest.vcenter_vm_info).
-            This parameter is mandatory.
-        required: true
-        type: str
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 2.0.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Create a VM
-  vmware.vmware_rest.vcenter_vm:
-    placement:
-      cluster: "{{ lookup('vmware.vmware_rest.cluster_moid', '/my_dc/host/my_cluster') }}"
-      datastore: "{{ lookup('vmware.vmware_rest.datastore_moid', '/my_dc/datastore/local') }}"
-      folder: "{{ lookup('vmware.vmware_rest.folder_moid', '/my_dc/vm') }}"
-      resource_pool: "{{ lookup('vmware.vmware_rest.resource_pool_moid', '/my_dc/host/my_cluster/Resources') }}"
-    name: test_vm1
-    guest_OS: RHEL_7_64
-    hardware_version: VMX_11
-    memory:
-      hot_add_enabled: true
-      size_MiB: 1024
-    disks:
-    - type: SATA
-      backing:
-        type: VMDK_FILE
-        vmdk_file: '[local] test_vm1/{{ disk_name }}.vmdk'
-    - type: SATA
-      new_vmdk:
-        name: second_disk
-        capacity: 32000000000
-    cdroms:
-    - type: SATA
-      sata:
-        bus: 0
-        unit: 2
-    nics:
-    - backing:
-        type: STANDARD_PORTGROUP
-        network: "{{ lookup('vmware.vmware_rest.network_moid', '/my_dc/network/VM Network') }}"
-  register: my_vm
-
-- name: Create a directory in /tmp
-  vmware.vmware_rest.vcenter_vm_guest_filesystem_directories:
-    vm: '{{ my_vm.id }}'
-    path: /tmp/my/path
-    create_parents: true
-    credentials:
-      interactive_session: false
-      type: USERNAME_PASSWORD
-      user_name: root
-      password: root
-"""
-
-RETURN = r"""
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "create_temporary": {
@@ -238,6 +44,8 @@ PAYLOAD_FORMAT = {
     },
 }  # pylint: disable=line-too-long
 
+import asyncio
+
 from ansible.module_utils.basic import env_fallback
 
 try:
@@ -254,11 +62,17 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
+    gather_bounded_by_key,
     gen_args,
+    get_aiohttp,
     get_device_info,
     get_subdevice_type,
+    get_vm_hosts,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -268,17 +82,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -288,6 +102,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -298,13 +128,32 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
+    argument_spec["concurrency"] = {"type": "int", "default": 10}
     argument_spec["create_parents"] = {"type": "bool"}
     argument_spec["credentials"] = {"required": True, "type": "dict"}
+    argument_spec["host_concurrency"] = {"type": "int"}
     argument_spec["new_path"] = {"type": "str"}
     argument_spec["parent_path"] = {"type": "str"}
     argument_spec["path"] = {"type": "str"}
+    argument_spec["paths"] = {"type": "list", "elements": "str"}
     argument_spec["prefix"] = {"type": "str"}
     argument_spec["recursive"] = {"type": "bool"}
     argument_spec["state"] = {
@@ -313,7 +162,8 @@ def prepare_argument_spec():
         "default": "present",
     }
     argument_spec["suffix"] = {"type": "str"}
-    argument_spec["vm"] = {"required": True, "type": "str"}
+    argument_spec["vm"] = {"type": "str"}
+    argument_spec["vms"] = {"type": "list", "elements": "str"}
 
     return argument_spec
 
@@ -325,23 +175,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
@@ -366,9 +229,57 @@ async def entry_point(module, session):
 
     func = globals()["_" + operation]
 
+    if module.params["vms"] or module.params["paths"]:
+        return await _batch(module.params, session, func)
+    if not module.params["vm"]:
+        return {"failed": True, "msg": "one of the following is required: vm, vms"}
     return await func(module.params, session)
 
 
+async def _batch(params, session, func):
+    vms = params["vms"] or [params["vm"]]
+    paths = params["paths"] or [params["path"]]
+    if params["paths"] and params["state"] not in ["absent", "present"]:
+        return {
+            "failed": True,
+            "msg": "paths is only supported with state=absent or state=present",
+        }
+
+    aiohttp = get_aiohttp()
+
+    async def _run(vm):
+        results = []
+        for path in paths:
+            try:
+                result = await func(dict(params, vm=vm, path=path), session)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                # Not the deadline of the task nor an open circuit, they fail the task
+                result = {"failed": True, "msg": f"{type(err).__name__}: {err}"}
+            results.append(dict(result, path=path))
+        return results
+
+    vm_hosts = {}
+    if params["host_concurrency"]:
+        vm_hosts = await get_vm_hosts(params, session)
+    all_results = await gather_bounded_by_key(
+        [(vm_hosts.get(vm), _run(vm)) for vm in vms],
+        params["concurrency"],
+        params["host_concurrency"],
+    )
+    value = dict(zip(vms, all_results))
+    failed = [
+        vm for vm, results in value.items() if any(r.get("failed") for r in results)
+    ]
+    result = {
+        "value": value,
+        "changed": any(r.get("changed") for rs in all_results for r in rs),
+        "failed": bool(failed),
+    }
+    if failed:
+        result["msg"] = "Failed on: {0}".format(", ".join(failed))
+    return result
+
+
 async def _create(params, session):
     uniquity_keys = []
 
@@ -0,0 +1,410 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2021, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import asyncio
+import hashlib
+import os
+import urllib.parse
+
+from ansible.module_utils.basic import env_fallback
+
+try:
+    from ansible_collections.cloud.common.plugins.module_utils.turbo.exceptions import (
+        EmbeddedModuleFailure,
+    )
+    from ansible_collections.cloud.common.plugins.module_utils.turbo.module import (
+        AnsibleTurboModule as AnsibleModule,
+    )
+
+    AnsibleModule.collection_name = "vmware.vmware_rest"
+except ImportError:
+    from ansible.module_utils.basic import AnsibleModule
+
+from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
+    fan_out,
+    gather_bounded,
+    get_aiohttp,
+    get_ssl_context,
+    is_planning,
+    open_session,
+    plan,
+    run_with_deadline,
+    session_timeout,
+)
+
+
+def prepare_argument_spec():
+    argument_spec = {
+        "vcenter_hostname": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_HOST"]),
+        ),
+        "vcenter_username": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_USER"]),
+        ),
+        "vcenter_password": dict(
+            type="str",
+            required=False,
+            no_log=True,
+            fallback=(env_fallback, ["VMWARE_PASSWORD"]),
+        ),
+        "vcenter_validate_certs": dict(
+            type="bool",
+            required=False,
+            default=True,
+            fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
+        ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
+        "vcenter_rest_log_file": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_REST_LOG_FILE"]),
+        ),
+        "session_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
+        ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
+    }
+
+    argument_spec["checksum"] = {"type": "str"}
+    argument_spec["concurrency"] = {"type": "int", "default": 10}
+    argument_spec["credentials"] = {
+        "required": True,
+        "type": "dict",
+        "options": {
+            "interactive_session": {"type": "bool"},
+            "password": {"type": "str", "no_log": True},
+            "saml_token": {"type": "str", "no_log": True},
+            "type": {
+                "type": "str",
+                "choices": ["SAML_BEARER_TOKEN", "USERNAME_PASSWORD"],
+            },
+            "user_name": {"type": "str"},
+        },
+    }
+    argument_spec["guest_path"] = {"required": True, "type": "str"}
+    argument_spec["local_path"] = {"required": True, "type": "path"}
+    argument_spec["overwrite"] = {"type": "bool", "default": False}
+    argument_spec["state"] = {
+        "type": "str",
+        "choices": ["download", "upload"],
+        "default": "upload",
+    }
+    argument_spec["vm"] = {"type": "str"}
+    argument_spec["vms"] = {"type": "list", "elements": "str"}
+
+    return argument_spec
+
+
+async def main():
+    required_if = list([])
+
+    module_args = prepare_argument_spec()
+    module = AnsibleModule(
+        argument_spec=module_args, required_if=required_if, supports_check_mode=True
+    )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
+    if not module.params["vcenter_hostname"]:
+        module.fail_json("vcenter_hostname cannot be empty")
+    if not module.params["vcenter_username"]:
+        module.fail_json("vcenter_username cannot be empty")
+    if not module.params["vcenter_password"]:
+        module.fail_json("vcenter_password cannot be empty")
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
+    module.exit_json(**result)
+
+
+# Size of the blocks read from the files and from the ESXi hosts
+CHUNK_SIZE = 64 * 1024
+
+
+def hash_file(path):
+    checksum = hashlib.sha256()
+    with open(path, "rb") as fd:
+        for block in iter(lambda: fd.read(CHUNK_SIZE), b""):
+            checksum.update(block)
+    return checksum.hexdigest()
+
+
+async def get_checksum(path):
+    # Hashing a large file would block the other tasks of the turbo server
+    return await asyncio.get_event_loop().run_in_executor(None, hash_file, path)
+
+
+def normalize_checksum(checksum):
+    # Also accept the sha256:<digest> notation of get_url
+    return checksum.split(":")[-1].lower() if checksum else None
+
+
+def guest_credentials(params):
+    # The suboptions that are not set are None, they are not sent
+    return {k: v for k, v in params["credentials"].items() if v is not None}
+
+
+async def create_transfer(params, session, attributes=None):
+    spec = {"path": params["guest_path"]}
+    if attributes:
+        spec["attributes"] = attributes
+    _url = (
+        "https://{vcenter_hostname}/api/vcenter/vm/{vm}/guest/filesystem?action=create"
+    ).format(**params)
+    async with session.post(
+        _url,
+        json={"credentials": guest_credentials(params), "spec": spec},
+        **session_timeout(params),
+    ) as resp:
+        _json = None
+        if resp.headers.get("Content-Type") == "application/json":
+            _json = await resp.json()
+        return resp.status, _json
+
+
+async def get_guest_file_size(params, session):
+    _url = (
+        "https://{vcenter_hostname}/api/vcenter/vm/{vm}/guest/filesystem/files/"
+    ).format(**params) + urllib.parse.quote(params["guest_path"], safe="")
+    async with session.post(
+        _url + "?action=get",
+        json={"credentials": guest_credentials(params)},
+        **session_timeout(params),
+    ) as resp:
+        if resp.status != 200:
+            return None
+        return (await resp.json()).get("size")
+
+
+def open_transfer_session(params):
+    """Return a session for the transfer URLs, served by the ESXi hosts.
+
+    The session id, the circuit breaker and the rate limits of vCenter do not
+    apply to them. A transfer can last longer than session_timeout, only a
+    connection idle for that long times out.
+    """
+    aiohttp = get_aiohttp()
+    timeout = params["session_timeout"] or 300
+    ssl_context = get_ssl_context(
+        params["vcenter_hostname"],
+        params["vcenter_validate_certs"],
+        params["vcenter_ca_bundle"],
+    )
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(ssl=ssl_context),
+        timeout=aiohttp.ClientTimeout(
+            total=None, sock_connect=timeout, sock_read=timeout
+        ),
+    )
+
+
+def transfer_failure(status, _json):
+    return {"failed": True, "changed": False, "status": status, "value": _json}
+
+
+async def _upload(params, session, transfer_session, checksum, size):
+    attributes = {"overwrite": params["overwrite"], "size": size}
+    status, _json = await create_transfer(params, session, attributes)
+    if is_planning(session):
+        return {"changed": True}
+    if status != 200:
+        if isinstance(_json, dict) and _json.get("error_type") == "ALREADY_EXISTS":
+            return {"changed": False, "failed": False}
+        return transfer_failure(status, _json)
+    with open(params["local_path"], "rb") as fd:
+        async with transfer_session.put(
+            _json, data=fd, headers={"Content-Type": "application/octet-stream"}
+        ) as resp:
+            if resp.status != 200:
+                return transfer_failure(resp.status, await resp.text())
+    guest_size = await get_guest_file_size(params, session)
+    if guest_size is not None and guest_size != size:
+        return {
+            "failed": True,
+            "changed": True,
+            "msg": "The guest file has {0} bytes instead of {1}".format(
+                guest_size, size
+            ),
+        }
+    return {"changed": True, "failed": False, "checksum": checksum, "size": size}
+
+
+async def _download(params, session, transfer_session):
+    local_path = params["local_path"].replace("{vm}", params["vm"])
+    status, _json = await create_transfer(params, session)
+    if is_planning(session):
+        return {"changed": True, "local_path": local_path}
+    if status != 200:
+        return transfer_failure(status, _json)
+    checksum = hashlib.sha256()
+    size = 0
+    try:
+        with open(local_path + ".part", "wb") as fd:
+            async with transfer_session.get(_json) as resp:
+                if resp.status != 200:
+                    return transfer_failure(resp.status, await resp.text())
+                async for block in resp.content.iter_chunked(CHUNK_SIZE):
+                    checksum.update(block)
+                    fd.write(block)
+                    size += len(block)
+        expected = normalize_checksum(params["checksum"])
+        if expected and checksum.hexdigest() != expected:
+            return {
+                "failed": True,
+                "changed": False,
+                "msg": "The checksum of the file is {0}".format(checksum.hexdigest()),
+            }
+        changed = not (
+            os.path.exists(local_path)
+            and await get_checksum(local_path) == checksum.hexdigest()
+        )
+        if changed:
+            os.replace(local_path + ".part", local_path)
+    finally:
+        if os.path.exists(local_path + ".part"):
+            os.remove(local_path + ".part")
+    return {
+        "changed": changed,
+        "failed": False,
+        "checksum": checksum.hexdigest(),
+        "local_path": local_path,
+        "size": size,
+    }
+
+
+async def entry_point(module, session):
+    params = module.params
+    if not params["vm"] and not params["vms"]:
+        return {"failed": True, "msg": "one of the following is required: vm, vms"}
+    vms = params["vms"] or [params["vm"]]
+    if params["state"] == "download" and len(vms) > 1:
+        if "{vm}" not in params["local_path"]:
+            return {
+                "failed": True,
+                "msg": "local_path must contain {vm} to download the file of"
+                " several virtual machines, they would overwrite each other",
+            }
+
+    if params["state"] == "upload":
+        # The local file is read once for all the virtual machines
+        checksum = await get_checksum(params["local_path"])
+        expected = normalize_checksum(params["checksum"])
+        if expected and checksum != expected:
+            return {
+                "failed": True,
+                "msg": "The checksum of {0} is {1}".format(
+                    params["local_path"], checksum
+                ),
+            }
+        size = os.path.getsize(params["local_path"])
+
+    aiohttp = get_aiohttp()
+
+    async def _run(vm, transfer_session):
+        vm_params = dict(params, vm=vm)
+        try:
+            if params["state"] == "upload":
+                result = await _upload(
+                    vm_params, session, transfer_session, checksum, size
+                )
+            else:
+                result = await _download(vm_params, session, transfer_session)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            # Not the deadline of the task nor an open circuit, they fail the task
+            result = {
+                "failed": True,
+                "changed": False,
+                "msg": f"{type(err).__name__}: {err}",
+            }
+        result["guest_path"] = params["guest_path"]
+        result.setdefault("local_path", params["local_path"])
+        return result
+
+    async with open_transfer_session(params) as transfer_session:
+        results = await gather_bounded(
+            [_run(vm, transfer_session) for vm in vms], params["concurrency"]
+        )
+    if not params["vms"]:
+        value = results[0]
+        result = {
+            "value": value,
+            "changed": value.get("changed", False),
+            "failed": value.get("failed", False),
+        }
+        if "msg" in value:
+            result["msg"] = value["msg"]
+        return result
+    value = dict(zip(vms, results))
+    failed = [vm for vm, r in value.items() if r.get("failed")]
+    result = {
+        "value": value,
+        "changed": any(r.get("changed") for r in results),
+        "failed": bool(failed),
+    }
+    if failed:
+        result["msg"] = "Failed on: {0}".format(", ".join(failed))
+    return result
+
+
+if __name__ == "__main__":
+    import asyncio
+
+    current_loop = asyncio.get_event_loop_policy().get_event_loop()
+    current_loop.run_until_complete(main())
@@ -0,0 +1,332 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+# Copyright: (c) 2021, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+import asyncio
+
+from ansible.module_utils.basic import env_fallback
+
+try:
+    from ansible_collections.cloud.common.plugins.module_utils.turbo.exceptions import (
+        EmbeddedModuleFailure,
+    )
+    from ansible_collections.cloud.common.plugins.module_utils.turbo.module import (
+        AnsibleTurboModule as AnsibleModule,
+    )
+
+    AnsibleModule.collection_name = "vmware.vmware_rest"
+except ImportError:
+    from ansible.module_utils.basic import AnsibleModule
+
+from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
+    compact_result,
+    fan_out,
+    gather_bounded,
+    gen_args,
+    open_session,
+    run_with_deadline,
+    session_timeout,
+)
+
+
+def prepare_argument_spec():
+    argument_spec = {
+        "vcenter_hostname": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_HOST"]),
+        ),
+        "vcenter_username": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_USER"]),
+        ),
+        "vcenter_password": dict(
+            type="str",
+            required=False,
+            no_log=True,
+            fallback=(env_fallback, ["VMWARE_PASSWORD"]),
+        ),
+        "vcenter_validate_certs": dict(
+            type="bool",
+            required=False,
+            default=True,
+            fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
+        ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
+        "vcenter_rest_log_file": dict(
+            type="str",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_REST_LOG_FILE"]),
+        ),
+        "session_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
+        ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
+    }
+
+    argument_spec["clusters"] = {"type": "list", "elements": "str"}
+    argument_spec["compact"] = {"type": "bool", "default": False}
+    argument_spec["concurrency"] = {"type": "int", "default": 10}
+    argument_spec["datacenters"] = {"type": "list", "elements": "str"}
+    argument_spec["flatten_value"] = {"type": "bool", "default": False}
+    argument_spec["folders"] = {"type": "list", "elements": "str"}
+    argument_spec["hosts"] = {"type": "list", "elements": "str"}
+    argument_spec["include"] = {
+        "type": "list",
+        "elements": "str",
+        "choices": ["interfaces", "networking", "routes"],
+        "default": ["interfaces", "networking", "routes"],
+    }
+    argument_spec["names"] = {"type": "list", "elements": "str"}
+    argument_spec["output_format"] = {
+        "type": "str",
+        "choices": ["full", "table"],
+        "default": "table",
+    }
+    argument_spec["resource_pools"] = {"type": "list", "elements": "str"}
+    argument_spec["vms"] = {"type": "list", "elements": "str"}
+
+    return argument_spec
+
+
+async def main():
+    required_if = list([])
+
+    module_args = prepare_argument_spec()
+    module = AnsibleModule(
+        argument_spec=module_args, required_if=required_if, supports_check_mode=True
+    )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        if module.params["compact"]:
+            result = compact_result(result, module.params["flatten_value"])
+        module.exit_json(**result)
+    if not module.params["vcenter_hostname"]:
+        module.fail_json("vcenter_hostname cannot be empty")
+    if not module.params["vcenter_username"]:
+        module.fail_json("vcenter_username cannot be empty")
+    if not module.params["vcenter_password"]:
+        module.fail_json("vcenter_password cannot be empty")
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
+    if module.params["compact"]:
+        result = compact_result(result, module.params["flatten_value"])
+    module.exit_json(**result)
+
+
+FILTERS = ["clusters", "datacenters", "folders", "hosts", "names", "resource_pools"]
+
+# The virtual machines are listed by batches, to keep the URLs short
+LIST_BATCH_SIZE = 100
+
+COLUMNS = [
+    "vm",
+    "name",
+    "host_name",
+    "nic",
+    "mac_address",
+    "ip_address",
+    "prefix_length",
+    "state",
+]
+
+
+async def list_hosts(params, session):
+    if params["hosts"]:
+        return params["hosts"]
+    url = "https://{vcenter_hostname}/api/vcenter/host".format(**params)
+    url += gen_args(params, ["clusters", "datacenters"])
+    async with session.get(url, **session_timeout(params)) as resp:
+        _json = await resp.json()
+        if resp.status != 200:
+            raise EmbeddedModuleFailure(
+                f"Cannot list the ESXi hosts: status={resp.status}, {_json}"
+            )
+        return [h["host"] for h in _json]
+
+
+async def list_vms(params, session):
+    url = "https://{vcenter_hostname}/api/vcenter/vm".format(**params)
+    if not params["vms"]:
+        # vCenter does not list more than 4000 virtual machines at once,
+        # they are listed host by host
+        queries = [
+            gen_args(dict(params, hosts=[host]), FILTERS)
+            for host in await list_hosts(params, session)
+        ]
+    else:
+        vms = params["vms"]
+        queries = [
+            gen_args(dict(params, vms=vms[i : i + LIST_BATCH_SIZE]), FILTERS + ["vms"])
+            for i in range(0, len(vms), LIST_BATCH_SIZE)
+        ]
+
+    async def _list(query):
+        async with session.get(url + query, **session_timeout(params)) as resp:
+            _json = await resp.json()
+            if resp.status != 200:
+                raise EmbeddedModuleFailure(
+                    f"Cannot list the virtual machines: status={resp.status}, {_json}."
+                    " vCenter does not list more than 4000 virtual machines at"
+                    " once, use the filters or vms to list fewer of them."
+                )
+            return _json
+
+    listed = {}
+    for vms in await gather_bounded(
+        [_list(query) for query in queries], params["concurrency"]
+    ):
+        listed.update((vm["vm"], vm) for vm in vms)
+    return list(listed.values())
+
+
+async def get_guest(params, session, vm, path):
+    url = ("https://{vcenter_hostname}/api/vcenter/vm/{vm}/guest/networking").format(
+        vm=vm, **params
+    )
+    async with session.get(url + path, **session_timeout(params)) as resp:
+        _json = None
+        if resp.headers.get("Content-Type") == "application/json":
+            _json = await resp.json()
+        return resp.status, _json
+
+
+def get_error_type(status, _json):
+    if isinstance(_json, dict) and _json.get("error_type"):
+        return _json["error_type"]
+    return "HTTP_{0}".format(status)
+
+
+async def collect(params, session, vm):
+    """Return the guest information of the VM, or the reason to skip it."""
+    include = params["include"]
+    # The first request tells whether the VMware Tools are running
+    paths = [
+        p for p in ["", "/interfaces", "/routes"] if (p[1:] or "networking") in include
+    ]
+    status, _json = await get_guest(params, session, vm, paths[0])
+    if status != 200:
+        return None, get_error_type(status, _json)
+    answers = [_json]
+    for status, _json in await asyncio.gather(
+        *[get_guest(params, session, vm, p) for p in paths[1:]]
+    ):
+        if status != 200:
+            return None, get_error_type(status, _json)
+        answers.append(_json)
+    info = dict(zip([p[1:] or "networking" for p in paths], answers))
+    return info, None
+
+
+def to_table(vms):
+    rows = []
+    for vm, info in vms.items():
+        host_name = ((info.get("networking") or {}).get("dns_values") or {}).get(
+            "host_name"
+        )
+        for nic in info.get("interfaces") or []:
+            row = [vm, info["name"], host_name, nic.get("nic"), nic.get("mac_address")]
+            addresses = (nic.get("ip") or {}).get("ip_addresses") or [{}]
+            for address in addresses:
+                rows.append(
+                    row
+                    + [
+                        address.get("ip_address"),
+                        address.get("prefix_length"),
+                        address.get("state"),
+                    ]
+                )
+        if not info.get("interfaces"):
+            rows.append([vm, info["name"], host_name] + [None] * 5)
+    return {"columns": COLUMNS, "rows": rows}
+
+
+async def entry_point(module, session):
+    return await _info(module.params, session)
+
+
+async def _info(params, session):
+    if not params["include"]:
+        return {"failed": True, "msg": "include cannot be empty"}
+    listed = await list_vms(params, session)
+    names = {vm["vm"]: vm.get("name") for vm in listed}
+    skipped = {vm: "NOT_FOUND" for vm in params["vms"] or [] if vm not in names}
+    running = []
+    for vm in listed:
+        if vm.get("power_state", "POWERED_ON") == "POWERED_ON":
+            running.append(vm["vm"])
+        else:
+            skipped[vm["vm"]] = vm["power_state"]
+
+    results = await gather_bounded(
+        [collect(params, session, vm) for vm in running], params["concurrency"]
+    )
+    vms = {}
+    for vm, (info, reason) in zip(running, results):
+        if reason:
+            skipped[vm] = reason
+        else:
+            vms[vm] = dict(info, name=names[vm])
+
+    if params["output_format"] == "table":
+        value = to_table(vms)
+    else:
+        value = vms
+    return {"value": value, "skipped_vms": skipped, "changed": False, "failed": False}
+
+
+if __name__ == "__main__":
+    current_loop = asyncio.get_event_loop_policy().get_event_loop()
+    current_loop.run_until_complete(main())
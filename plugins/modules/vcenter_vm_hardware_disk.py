@@ -7,253 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: vcenter_vm_hardware_disk
-short_description: Adds a virtual disk to the virtual machine
-description: Adds a virtual disk to the virtual machine. While adding the virtual
-    disk, a new VMDK file may be created or an existing VMDK file may be used to back
-    the virtual disk.
-options:
-    backing:
-        description:
-        - Existing physical resource backing for the virtual disk. Exactly one of
-            I(backing) or I(new_vmdk) must be specified.
-        - If unset, the virtual disk will not be connected to an existing backing.
-            Required with I(state=['present'])
-        - 'Valid attributes are:'
-        - ' - C(type) (str): This option defines the valid backing types for a virtual
-            disk. ([''present''])'
-        - '   This key is required with [''present''].'
-        - '   - Accepted values:'
-        - '     - VMDK_FILE'
-        - ' - C(vmdk_file) (str): Path of the VMDK file backing the virtual disk.'
-        - This field is optional and it is only relevant when the value of I(type)
-            is VMDK_FILE. (['present'])
-        type: dict
-    disk:
-        description:
-        - Virtual disk identifier.
-        - The parameter must be the id of a resource returned by M(vmware.vmware_rest.vcenter_vm_hardware_disk).
-            Required with I(state=['absent', 'present'])
-        type: str
-    ide:
-        description:
-        - Address for attaching the device to a virtual IDE adapter.
-        - If unset, the server will choose an available address; if none is available,
-            the request will fail.
-        - 'Valid attributes are:'
-        - ' - C(primary) (bool): Flag specifying whether the device should be attached
-            to the primary or secondary IDE adapter of the virtual machine.'
-        - If unset, the server will choose a adapter with an available connection.
-            If no IDE connections are available, the request will be rejected. (['present'])
-        - ' - C(master) (bool): Flag specifying whether the device should be the master
-            or slave device on the IDE adapter.'
-        - If unset, the server will choose an available connection type. If no IDE
-            connections are available, the request will be rejected. (['present'])
-        type: dict
-    label:
-        description:
-        - The name of the item
-        type: str
-    new_vmdk:
-        description:
-        - Specification for creating a new VMDK backing for the virtual disk. Exactly
-            one of I(backing) or I(new_vmdk) must be specified.
-        - If unset, a new VMDK backing will not be created.
-        - 'Valid attributes are:'
-        - ' - C(name) (str): Base name of the VMDK file. The name should not include
-            the ''.vmdk'' file extension.'
-        - If unset, a name (derived from the name of the virtual machine) will be
-            chosen by the server. (['present'])
-        - ' - C(capacity) (int): Capacity of the virtual disk backing in bytes.'
-        - If unset, defaults to a guest-specific capacity. (['present'])
-        - ' - C(storage_policy) (dict): The I(storage_policy_spec) structure contains
-            information about the storage policy that is to be associated the with
-            VMDK file.'
-        - 'If unset the default storage policy of the target datastore (if applicable)
-            is applied. Currently a default storage policy is only supported by object
-            based datastores : VVol & vSAN. For non- object datastores, if unset then
-            no storage policy would be associated with the VMDK file. ([''present''])'
-        - '   - Accepted keys:'
-        - '     - policy (string): Identifier of the storage policy which should be
-            associated with the VMDK file.'
-        - 'When clients pass a value of this structure as a parameter, the field must
-            be the id of a resource returned by M(vmware.vmware_rest.vcenter_storage_policies). '
-        type: dict
-    nvme:
-        description:
-        - Address for attaching the device to a virtual NVMe adapter.
-        - If unset, the server will choose an available address; if none is available,
-            the request will fail. Required with I(state=['present'])
-        - 'Valid attributes are:'
-        - ' - C(bus) (int): Bus number of the adapter to which the device should be
-            attached. ([''present''])'
-        - '   This key is required with [''present''].'
-        - ' - C(unit) (int): Unit number of the device.'
-        - If unset, the server will choose an available unit number on the specified
-            adapter. If there are no available connections on the adapter, the request
-            will be rejected. (['present'])
-        type: dict
-    sata:
-        description:
-        - Address for attaching the device to a virtual SATA adapter.
-        - If unset, the server will choose an available address; if none is available,
-            the request will fail. Required with I(state=['present'])
-        - 'Valid attributes are:'
-        - ' - C(bus) (int): Bus number of the adapter to which the device should be
-            attached. ([''present''])'
-        - '   This key is required with [''present''].'
-        - ' - C(unit) (int): Unit number of the device.'
-        - If unset, the server will choose an available unit number on the specified
-            adapter. If there are no available connections on the adapter, the request
-            will be rejected. (['present'])
-        type: dict
-    scsi:
-        description:
-        - Address for attaching the device to a virtual SCSI adapter.
-        - If unset, the server will choose an available address; if none is available,
-            the request will fail. Required with I(state=['present'])
-        - 'Valid attributes are:'
-        - ' - C(bus) (int): Bus number of the adapter to which the device should be
-            attached. ([''present''])'
-        - '   This key is required with [''present''].'
-        - ' - C(unit) (int): Unit number of the device.'
-        - If unset, the server will choose an available unit number on the specified
-            adapter. If there are no available connections on the adapter, the request
-            will be rejected. (['present'])
-        type: dict
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    state:
-        choices:
-        - absent
-        - present
-        default: present
-        description: []
-        type: str
-    type:
-        choices:
-        - IDE
-        - NVME
-        - SATA
-        - SCSI
-        description:
-        - The I(host_bus_adapter_type) enumerated type defines the valid types of
-            host bus adapters that may be used for attaching a virtual storage device
-            to a virtual machine.
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-    vm:
-        description:
-        - Virtual machine identifier.
-        - The parameter must be the id of a resource returned by M(vmware.vmware_rest.vcenter_vm_info).
-            This parameter is mandatory.
-        required: true
-        type: str
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 0.1.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Look up the VM called test_vm1 in the inventory
-  register: search_result
-  vmware.vmware_rest.vcenter_vm_info:
-    filter_names:
-    - test_vm1
-
-- name: Collect information about a specific VM
-  vmware.vmware_rest.vcenter_vm_info:
-    vm: '{{ search_result.value[0].vm }}'
-  register: test_vm1_info
-
-- name: Create a new disk
-  vmware.vmware_rest.vcenter_vm_hardware_disk:
-    vm: '{{ test_vm1_info.id }}'
-    type: SATA
-    new_vmdk:
-      capacity: 320000
-  register: my_new_disk
-
-- name: Delete the disk
-  vmware.vmware_rest.vcenter_vm_hardware_disk:
-    vm: '{{ test_vm1_info.id }}'
-    disk: '{{ my_new_disk.id }}'
-    state: absent
-  register: _result
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Create a new disk
-id:
-  description: moid of the resource
-  returned: On success
-  sample: '16000'
-  type: str
-value:
-  description: Create a new disk
-  returned: On success
-  sample:
-    backing:
-      type: VMDK_FILE
-      vmdk_file: '[local] test_vm1/test_vm1_1.vmdk'
-    capacity: 320000
-    label: Hard disk 2
-    sata:
-      bus: 0
-      unit: 0
-    type: SATA
-  type: dict
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "update": {
@@ -293,11 +46,14 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
     gen_args,
     get_device_info,
     get_subdevice_type,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -307,17 +63,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -327,6 +83,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -337,6 +109,22 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
     argument_spec["backing"] = {"type": "dict"}
@@ -365,23 +153,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
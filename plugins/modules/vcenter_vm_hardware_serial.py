@@ -7,241 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: vcenter_vm_hardware_serial
-short_description: Adds a virtual serial port to the virtual machine.
-description: Adds a virtual serial port to the virtual machine.
-options:
-    allow_guest_control:
-        description:
-        - Flag indicating whether the guest can connect and disconnect the device.
-        - If unset, the value is unchanged.
-        type: bool
-    backing:
-        description:
-        - Physical resource backing for the virtual serial port.
-        - If unset, defaults to automatic detection of a suitable host device. Required
-            with I(state=['present'])
-        - 'Valid attributes are:'
-        - ' - C(type) (str): This option defines the valid backing types for a virtual
-            serial port. ([''present''])'
-        - '   This key is required with [''present''].'
-        - '   - Accepted values:'
-        - '     - FILE'
-        - '     - HOST_DEVICE'
-        - '     - NETWORK_CLIENT'
-        - '     - NETWORK_SERVER'
-        - '     - PIPE_CLIENT'
-        - '     - PIPE_SERVER'
-        - ' - C(file) (str): Path of the file backing the virtual serial port.'
-        - This field is optional and it is only relevant when the value of I(type)
-            is FILE. (['present'])
-        - ' - C(host_device) (str): Name of the device backing the virtual serial
-            port. '
-        - ''
-        - ''
-        - If unset, the virtual serial port will be configured to automatically detect
-            a suitable host device. (['present'])
-        - ' - C(pipe) (str): Name of the pipe backing the virtual serial port.'
-        - This field is optional and it is only relevant when the value of I(type)
-            is one of PIPE_SERVER or PIPE_CLIENT. (['present'])
-        - ' - C(no_rx_loss) (bool): Flag that enables optimized data transfer over
-            the pipe. When the value is true, the host buffers data to prevent data
-            overrun. This allows the virtual machine to read all of the data transferred
-            over the pipe with no data loss.'
-        - If unset, defaults to false. (['present'])
-        - ' - C(network_location) (str): URI specifying the location of the network
-            service backing the virtual serial port. '
-        - '   - If I(type) is NETWORK_SERVER, this field is the location used by clients
-            to connect to this server. The hostname part of the URI should either
-            be empty or should specify the address of the host on which the virtual
-            machine is running.'
-        - '   - If I(type) is NETWORK_CLIENT, this field is the location used by the
-            virtual machine to connect to the remote server.'
-        - ' '
-        - This field is optional and it is only relevant when the value of I(type)
-            is one of NETWORK_SERVER or NETWORK_CLIENT. (['present'])
-        - ' - C(proxy) (str): Proxy service that provides network access to the network
-            backing. If set, the virtual machine initiates a connection with the proxy
-            service and forwards the traffic to the proxy.'
-        - If unset, no proxy service should be used. (['present'])
-        type: dict
-    label:
-        description:
-        - The name of the item
-        type: str
-    port:
-        description:
-        - Virtual serial port identifier.
-        - The parameter must be the id of a resource returned by M(vmware.vmware_rest.vcenter_vm_hardware_serial).
-            Required with I(state=['absent', 'connect', 'disconnect', 'present'])
-        type: str
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    start_connected:
-        description:
-        - Flag indicating whether the virtual device should be connected whenever
-            the virtual machine is powered on.
-        - If unset, the value is unchanged.
-        type: bool
-    state:
-        choices:
-        - absent
-        - connect
-        - disconnect
-        - present
-        default: present
-        description: []
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-    vm:
-        description:
-        - Virtual machine identifier.
-        - The parameter must be the id of a resource returned by M(vmware.vmware_rest.vcenter_vm_info).
-            This parameter is mandatory.
-        required: true
-        type: str
-    yield_on_poll:
-        description:
-        - 'CPU yield behavior. If set to true, the virtual machine will periodically
-            relinquish the processor if its sole task is polling the virtual serial
-            port. The amount of time it takes to regain the processor will depend
-            on the degree of other virtual machine activity on the host. '
-        - ' This field may be modified at any time, and changes applied to a connected
-            virtual serial port take effect immediately.'
-        - ''
-        - If unset, the value is unchanged.
-        type: bool
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 0.1.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Look up the VM called test_vm1 in the inventory
-  register: search_result
-  vmware.vmware_rest.vcenter_vm_info:
-    filter_names:
-    - test_vm1
-
-- name: Collect information about a specific VM
-  vmware.vmware_rest.vcenter_vm_info:
-    vm: '{{ search_result.value[0].vm }}'
-  register: test_vm1_info
-
-- name: Create a new serial port
-  vmware.vmware_rest.vcenter_vm_hardware_serial:
-    vm: '{{ test_vm1_info.id }}'
-    label: Serial port 2
-    allow_guest_control: true
-  register: _result
-
-- name: Create another serial port with a label
-  vmware.vmware_rest.vcenter_vm_hardware_serial:
-    vm: '{{ test_vm1_info.id }}'
-    label: Serial port 2
-    allow_guest_control: true
-  register: _result
-
-- name: Create an existing serial port (label)
-  vmware.vmware_rest.vcenter_vm_hardware_serial:
-    vm: '{{ test_vm1_info.id }}'
-    label: Serial port 1
-    allow_guest_control: true
-  register: _result
-
-- name: Get an existing serial port (label)
-  vmware.vmware_rest.vcenter_vm_hardware_serial_info:
-    vm: '{{ test_vm1_info.id }}'
-    label: Serial port 1
-  register: serial_port_1
-
-- name: Delete an existing serial port (port id)
-  vmware.vmware_rest.vcenter_vm_hardware_serial:
-    vm: '{{ test_vm1_info.id }}'
-    port: '{{ serial_port_1.id }}'
-    state: absent
-  register: _result
-
-- name: Delete an existing serial port (label)
-  vmware.vmware_rest.vcenter_vm_hardware_serial:
-    vm: '{{ test_vm1_info.id }}'
-    label: Serial port 2
-    state: absent
-  register: _result
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Create an existing serial port (label)
-id:
-  description: moid of the resource
-  returned: On success
-  sample: '9000'
-  type: str
-value:
-  description: Create an existing serial port (label)
-  returned: On success
-  sample:
-    allow_guest_control: 1
-    backing:
-      auto_detect: 1
-      host_device: ''
-      type: HOST_DEVICE
-    label: Serial port 1
-    start_connected: 0
-    state: NOT_CONNECTED
-    yield_on_poll: 0
-  type: dict
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "delete": {"query": {}, "body": {}, "path": {"port": "port", "vm": "vm"}},
@@ -285,11 +50,14 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
     gen_args,
     get_device_info,
     get_subdevice_type,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -299,17 +67,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -319,6 +87,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -329,6 +113,22 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
     argument_spec["allow_guest_control"] = {"type": "bool"}
@@ -354,23 +154,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
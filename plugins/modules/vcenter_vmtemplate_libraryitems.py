@@ -7,306 +7,6 @@
 # See: https://github.com/ansible-community/ansible.content_builder
 
 
-DOCUMENTATION = r"""
-module: vcenter_vmtemplate_libraryitems
-short_description: Creates a library item in content library from a virtual machine
-description: Creates a library item in content library from a virtual machine. This
-    {@term operation} creates a library item in content library whose content is a
-    virtual machine template created from the source virtual machine, using the supplied
-    create specification. The virtual machine template is stored in a newly created
-    library item.
-options:
-    description:
-        description:
-        - Description of the deployed virtual machine.
-        type: str
-    disk_storage:
-        description:
-        - Storage specification for the virtual machine template's disks.
-        - 'Valid attributes are:'
-        - ' - C(datastore) (str): Identifier for the datastore associated the deployed
-            virtual machine''s disk. ([''deploy'', ''present''])'
-        - ' - C(storage_policy) (dict): Storage policy for the deployed virtual machine''s
-            disk. ([''deploy'', ''present''])'
-        - '   - Accepted keys:'
-        - '     - type (string): Policy type for a virtual machine template''s disk.'
-        - 'Accepted value for this field:'
-        - '       - C(USE_SPECIFIED_POLICY)'
-        - '     - policy (string): Identifier for the storage policy to use.'
-        type: dict
-    disk_storage_overrides:
-        description:
-        - Storage specification for individual disks in the deployed virtual machine.
-            This is specified as a mapping between disk identifiers in the source
-            virtual machine template contained in the library item and their storage
-            specifications.
-        type: dict
-    guest_customization:
-        description:
-        - Guest customization spec to apply to the deployed virtual machine.
-        - 'Valid attributes are:'
-        - ' - C(name) (str): Name of the customization specification. ([''deploy''])'
-        type: dict
-    hardware_customization:
-        description:
-        - Hardware customization spec which specifies updates to the deployed virtual
-            machine.
-        - 'Valid attributes are:'
-        - ' - C(nics) (dict): Map of Ethernet network adapters to update. ([''deploy''])'
-        - ' - C(disks_to_remove) (list): Idenfiers of disks to remove from the deployed
-            virtual machine. ([''deploy''])'
-        - ' - C(disks_to_update) (dict): Disk update specification for individual
-            disks in the deployed virtual machine. ([''deploy''])'
-        - ' - C(cpu_update) (dict): CPU update specification for the deployed virtual
-            machine. ([''deploy''])'
-        - '   - Accepted keys:'
-        - '     - num_cpus (integer): Number of virtual processors in the deployed
-            virtual machine.'
-        - '     - num_cores_per_socket (integer): Number of cores among which to distribute
-            CPUs in the deployed virtual machine.'
-        - ' - C(memory_update) (dict): Memory update specification for the deployed
-            virtual machine. ([''deploy''])'
-        - '   - Accepted keys:'
-        - '     - memory (integer): Size of a virtual machine''s memory in MB.'
-        type: dict
-    library:
-        description:
-        - Identifier of the library in which the new library item should be created.
-            Required with I(state=['present'])
-        type: str
-    name:
-        description:
-        - Name of the deployed virtual machine. This parameter is mandatory.
-        required: true
-        type: str
-    placement:
-        description:
-        - Information used to place the virtual machine template.
-        - 'Valid attributes are:'
-        - ' - C(folder) (str): Virtual machine folder into which the deployed virtual
-            machine should be placed. ([''deploy'', ''present''])'
-        - ' - C(resource_pool) (str): Resource pool into which the deployed virtual
-            machine should be placed. ([''deploy'', ''present''])'
-        - ' - C(host) (str): Host onto which the virtual machine should be placed.
-            If C(#host) and C(#resource_pool) are both specified, C(#resource_pool)
-            must belong to C(#host). If C(#host) and C(#cluster) are both specified,
-            C(#host) must be a member of C(#cluster). ([''deploy'', ''present''])'
-        - ' - C(cluster) (str): Cluster onto which the deployed virtual machine should
-            be placed. If C(#cluster) and C(#resource_pool) are both specified, C(#resource_pool)
-            must belong to C(#cluster). If C(#cluster) and C(#host) are both specified,
-            C(#host) must be a member of C(#cluster). ([''deploy'', ''present''])'
-        type: dict
-    powered_on:
-        description:
-        - Specifies whether the deployed virtual machine should be powered on after
-            deployment.
-        type: bool
-    session_timeout:
-        description:
-        - 'Timeout settings for client session. '
-        - 'The maximal number of seconds for the whole operation including connection
-            establishment, request sending and response. '
-        - The default value is 300s.
-        type: float
-        version_added: 2.1.0
-    source_vm:
-        description:
-        - Identifier of the source virtual machine to create the library item from.
-            Required with I(state=['present'])
-        type: str
-    state:
-        choices:
-        - deploy
-        - present
-        default: present
-        description: []
-        type: str
-    template_library_item:
-        description:
-        - identifier of the content library item containing the source virtual machine
-            template to be deployed. Required with I(state=['deploy'])
-        type: str
-    vcenter_hostname:
-        description:
-        - The hostname or IP address of the vSphere vCenter
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_HOST) will be used instead.
-        required: true
-        type: str
-    vcenter_password:
-        description:
-        - The vSphere vCenter password
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_PASSWORD) will be used instead.
-        required: true
-        type: str
-    vcenter_rest_log_file:
-        description:
-        - 'You can use this optional parameter to set the location of a log file. '
-        - 'This file will be used to record the HTTP REST interaction. '
-        - 'The file will be stored on the host that run the module. '
-        - 'If the value is not specified in the task, the value of '
-        - environment variable C(VMWARE_REST_LOG_FILE) will be used instead.
-        type: str
-    vcenter_username:
-        description:
-        - The vSphere vCenter username
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_USER) will be used instead.
-        required: true
-        type: str
-    vcenter_validate_certs:
-        default: true
-        description:
-        - Allows connection when SSL certificates are not valid. Set to C(false) when
-            certificates are not trusted.
-        - If the value is not specified in the task, the value of environment variable
-            C(VMWARE_VALIDATE_CERTS) will be used instead.
-        type: bool
-    vm_home_storage:
-        description:
-        - Storage location for the virtual machine template's configuration and log
-            files.
-        - 'Valid attributes are:'
-        - ' - C(datastore) (str): Identifier of the datastore for the deployed virtual
-            machine''s configuration and log files. ([''deploy'', ''present''])'
-        - ' - C(storage_policy) (dict): Storage policy for the deployed virtual machine''s
-            configuration and log files. ([''deploy'', ''present''])'
-        - '   - Accepted keys:'
-        - '     - type (string): Policy type for the virtual machine template''s configuration
-            and log files.'
-        - 'Accepted value for this field:'
-        - '       - C(USE_SPECIFIED_POLICY)'
-        - '     - policy (string): Identifier for the storage policy to use.'
-        type: dict
-author:
-- Ansible Cloud Team (@ansible-collections)
-version_added: 2.2.0
-requirements:
-- vSphere 7.0.3 or greater
-- python >= 3.6
-- aiohttp
-notes:
-- Tested on vSphere 7.0.3
-"""
-
-EXAMPLES = r"""
-- name: Create a VM
-  vmware.vmware_rest.vcenter_vm:
-    placement:
-      cluster: "{{ lookup('vmware.vmware_rest.cluster_moid', '/my_dc/host/my_cluster') }}"
-      datastore: "{{ lookup('vmware.vmware_rest.datastore_moid', '/my_dc/datastore/local') }}"
-      folder: "{{ lookup('vmware.vmware_rest.folder_moid', '/my_dc/vm') }}"
-      resource_pool: "{{ lookup('vmware.vmware_rest.resource_pool_moid', '/my_dc/host/my_cluster/Resources') }}"
-    name: test_vm1
-    guest_OS: RHEL_7_64
-    hardware_version: VMX_11
-    memory:
-      hot_add_enabled: true
-      size_MiB: 1024
-    disks:
-    - type: SATA
-      backing:
-        type: VMDK_FILE
-        vmdk_file: '[local] test_vm1/{{ disk_name }}.vmdk'
-    - type: SATA
-      new_vmdk:
-        name: second_disk
-        capacity: 32000000000
-    cdroms:
-    - type: SATA
-      sata:
-        bus: 0
-        unit: 2
-    nics:
-    - backing:
-        type: STANDARD_PORTGROUP
-        network: "{{ lookup('vmware.vmware_rest.network_moid', '/my_dc/network/VM Network') }}"
-  register: my_vm
-
-- name: Create a content library based on a DataStore
-  vmware.vmware_rest.content_locallibrary:
-    name: my_library_on_datastore
-    description: automated
-    publish_info:
-      published: true
-      authentication_method: NONE
-    storage_backings:
-    - datastore_id: "{{ lookup('vmware.vmware_rest.datastore_moid', '/my_dc/datastore/local') }}"
-      type: DATASTORE
-    state: present
-  register: nfs_lib
-
-- name: Create a VM template on the library
-  vmware.vmware_rest.vcenter_vmtemplate_libraryitems:
-    name: golden-template
-    library: '{{ nfs_lib.id }}'
-    source_vm: '{{ my_vm.id }}'
-    placement:
-      cluster: "{{ lookup('vmware.vmware_rest.cluster_moid', '/my_dc/host/my_cluster') }}"
-      folder: "{{ lookup('vmware.vmware_rest.folder_moid', '/my_dc/vm') }}"
-      resource_pool: "{{ lookup('vmware.vmware_rest.resource_pool_moid', '/my_dc/host/my_cluster/Resources') }}"
-  register: mylib_item
-
-- name: Get the list of items of the NFS library
-  vmware.vmware_rest.content_library_item_info:
-    library_id: '{{ nfs_lib.id }}'
-  register: lib_items
-
-- name: Use the name to identify the item
-  set_fact:
-    my_template_item: "{{ lib_items.value | selectattr('name', 'equalto', 'golden-template')|first }}"
-
-- name: Deploy a new VM based on the template
-  vmware.vmware_rest.vcenter_vmtemplate_libraryitems:
-    name: vm-from-template
-    library: '{{ nfs_lib.id }}'
-    template_library_item: '{{ my_template_item.id }}'
-    placement:
-      cluster: "{{ lookup('vmware.vmware_rest.cluster_moid', '/my_dc/host/my_cluster') }}"
-      folder: "{{ lookup('vmware.vmware_rest.folder_moid', '/my_dc/vm') }}"
-      resource_pool: "{{ lookup('vmware.vmware_rest.resource_pool_moid', '/my_dc/host/my_cluster/Resources') }}"
-    state: deploy
-  register: my_new_vm
-"""
-
-RETURN = r"""
-# content generated by the update_return_section callback# task: Create a VM template on the library
-id:
-  description: moid of the resource
-  returned: On success
-  sample: 9c6df1f5-faba-490c-a8e6-edb72f787ab8
-  type: str
-value:
-  description: Create a VM template on the library
-  returned: On success
-  sample:
-    cpu:
-      cores_per_socket: 1
-      count: 1
-    disks:
-      '16000':
-        capacity: 16106127360
-        disk_storage:
-          datastore: datastore-1122
-      '16001':
-        capacity: 32000000000
-        disk_storage:
-          datastore: datastore-1122
-    guest_OS: RHEL_7_64
-    memory:
-      size_MiB: 1024
-    nics:
-      '4000':
-        backing_type: STANDARD_PORTGROUP
-        mac_type: ASSIGNED
-        network: network-1123
-    vm_home_storage:
-      datastore: datastore-1122
-    vm_template: vm-1132
-  type: dict
-"""
-
 # This structure describes the format of the data expected by the end-points
 PAYLOAD_FORMAT = {
     "create": {
@@ -356,11 +56,14 @@ except ImportError:
 
 from ansible_collections.vmware.vmware_rest.plugins.module_utils.vmware_rest import (
     exists,
+    fan_out,
     gen_args,
     get_device_info,
     get_subdevice_type,
     open_session,
+    plan,
     prepare_payload,
+    run_with_deadline,
     session_timeout,
     update_changed_flag,
 )
@@ -370,17 +73,17 @@ def prepare_argument_spec():
     argument_spec = {
         "vcenter_hostname": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_HOST"]),
         ),
         "vcenter_username": dict(
             type="str",
-            required=True,
+            required=False,
             fallback=(env_fallback, ["VMWARE_USER"]),
         ),
         "vcenter_password": dict(
             type="str",
-            required=True,
+            required=False,
             no_log=True,
             fallback=(env_fallback, ["VMWARE_PASSWORD"]),
         ),
@@ -390,6 +93,22 @@ def prepare_argument_spec():
             default=True,
             fallback=(env_fallback, ["VMWARE_VALIDATE_CERTS"]),
         ),
+        "vcenter_ca_bundle": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CA_BUNDLE"]),
+        ),
+        "vcenter_client_cert": dict(
+            type="path",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_CERT"]),
+        ),
+        "vcenter_client_key": dict(
+            type="path",
+            required=False,
+            no_log=False,
+            fallback=(env_fallback, ["VMWARE_CLIENT_KEY"]),
+        ),
         "vcenter_rest_log_file": dict(
             type="str",
             required=False,
@@ -400,6 +119,22 @@ def prepare_argument_spec():
             required=False,
             fallback=(env_fallback, ["VMWARE_SESSION_TIMEOUT"]),
         ),
+        "task_timeout": dict(
+            type="float",
+            required=False,
+            fallback=(env_fallback, ["VMWARE_TASK_TIMEOUT"]),
+        ),
+        "vcenter_endpoints": dict(
+            type="list",
+            elements="dict",
+            required=False,
+            options=dict(
+                hostname=dict(type="str", required=True),
+                username=dict(type="str"),
+                password=dict(type="str", no_log=True),
+                validate_certs=dict(type="bool"),
+            ),
+        ),
     }
 
     argument_spec["description"] = {"type": "str"}
@@ -430,23 +165,36 @@ async def main():
     module = AnsibleModule(
         argument_spec=module_args, required_if=required_if, supports_check_mode=True
     )
+    if module.params["vcenter_endpoints"]:
+        result = await fan_out(entry_point, module)
+        module.exit_json(**result)
     if not module.params["vcenter_hostname"]:
         module.fail_json("vcenter_hostname cannot be empty")
     if not module.params["vcenter_username"]:
         module.fail_json("vcenter_username cannot be empty")
     if not module.params["vcenter_password"]:
         module.fail_json("vcenter_password cannot be empty")
-    try:
-        session = await open_session(
-            vcenter_hostname=module.params["vcenter_hostname"],
-            vcenter_username=module.params["vcenter_username"],
-            vcenter_password=module.params["vcenter_password"],
-            validate_certs=module.params["vcenter_validate_certs"],
-            log_file=module.params["vcenter_rest_log_file"],
-        )
-    except EmbeddedModuleFailure as err:
-        module.fail_json(err.get_message())
-    result = await entry_point(module, session)
+
+    # The login is part of the task, task_timeout bounds it too
+    async def _run():
+        try:
+            session = await open_session(
+                vcenter_hostname=module.params["vcenter_hostname"],
+                vcenter_username=module.params["vcenter_username"],
+                vcenter_password=module.params["vcenter_password"],
+                validate_certs=module.params["vcenter_validate_certs"],
+                log_file=module.params["vcenter_rest_log_file"],
+                ca_bundle=module.params["vcenter_ca_bundle"],
+                client_cert=module.params["vcenter_client_cert"],
+                client_key=module.params["vcenter_client_key"],
+            )
+        except EmbeddedModuleFailure as err:
+            module.fail_json(err.get_message())
+        if module.check_mode:
+            return await plan(entry_point, module, session)
+        return await entry_point(module, session)
+
+    result = await run_with_deadline(_run(), module.params["task_timeout"])
     module.exit_json(**result)
 
 
@@ -130,6 +130,15 @@ def get_credentials(**options):
     credentials["vcenter_rest_log_file"] = options.get(
         "vcenter_rest_log_file"
     ) or os.getenv("VMWARE_REST_LOG_FILE")
+    credentials["vcenter_ca_bundle"] = options.get("vcenter_ca_bundle") or os.getenv(
+        "VMWARE_CA_BUNDLE"
+    )
+    credentials["vcenter_client_cert"] = options.get(
+        "vcenter_client_cert"
+    ) or os.getenv("VMWARE_CLIENT_CERT")
+    credentials["vcenter_client_key"] = options.get("vcenter_client_key") or os.getenv(
+        "VMWARE_CLIENT_KEY"
+    )
     return credentials
 
 
@@ -155,6 +164,9 @@ class Lookup:
                 vcenter_password=options.get("vcenter_password"),
                 validate_certs=bool(options.get("vcenter_validate_certs")),
                 log_file=options.get("vcenter_rest_log_file"),
+                ca_bundle=options.get("vcenter_ca_bundle"),
+                client_cert=options.get("vcenter_client_cert"),
+                client_key=options.get("vcenter_client_key"),
             )
         except EmbeddedModuleFailure as e:
             raise AnsibleLookupError(
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""Measure the cold start of the modules, in a new Python process each time.
+
+Without turbo, each task starts a Python process and imports its module, and
+with turbo the first task of each module in the daemon pays for the import.
+For each module, the script reports:
+
+- import: the time to import the module in a new process,
+- first task: the import, the login and a first run against a mock vCenter,
+- warm task: a second run in the same process,
+- import_module: the importlib.import_module() calls made by the warm task,
+  the dependencies must be resolved once per process.
+
+The tasks are only run for the modules of the soak test workload, see
+soak.py. The collection and cloud.common must be importable, for instance:
+
+    ANSIBLE_COLLECTIONS_PATH=~/.ansible/collections python tests/performance/cold_start.py
+
+--save writes the measures as a baseline, and --baseline fails if a module
+is slower than its baseline by more than --tolerance. --max-import and
+--max-first-task are absolute budgets, in milliseconds, 0 disables them. The
+default budgets are about 3 times the measures on a laptop (110ms and 340ms).
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import pkgutil
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from soak import PREFIX, WORKLOAD, serve, wait_for_port  # noqa: E402
+
+# Run in the new process, with the module name, the port and the task
+CHILD = """
+import asyncio, importlib, json, sys, time
+
+start = time.perf_counter()
+module = importlib.import_module(sys.argv[1])
+result = {"import": time.perf_counter() - start}
+
+if sys.argv[3] != "null":
+    import soak
+
+    vmware_rest = importlib.import_module(soak.PREFIX + ".module_utils.vmware_rest")
+    spec = module.prepare_argument_spec()
+    params = {k: v.get("default") for k, v in spec.items()}
+    params.update(json.loads(sys.argv[3]))
+    params.update(
+        vcenter_hostname="127.0.0.1:" + sys.argv[2],
+        vcenter_username="cold",
+        vcenter_password="cold",
+        vcenter_validate_certs=False,
+        vcenter_rest_log_file=None,
+    )
+    check_mode = params.pop("_check_mode")
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(soak.run_task(vmware_rest, module, params, check_mode))
+    result["first_task"] = time.perf_counter() - start
+
+    calls = []
+    import_module = importlib.import_module
+    importlib.import_module = lambda name, *args: calls.append(name) or import_module(
+        name, *args
+    )
+    start = time.perf_counter()
+    loop.run_until_complete(soak.run_task(vmware_rest, module, params, check_mode))
+    result["warm_task"] = time.perf_counter() - start
+    importlib.import_module = import_module
+    result["import_module"] = calls
+print(json.dumps(result))
+"""
+
+
+def list_modules(names):
+    package = __import__(f"{PREFIX}.modules", fromlist=["__path__"])
+    found = sorted(m.name for m in pkgutil.iter_modules(package.__path__))
+    return [n for n in found if n in names] if names else found
+
+
+def measure(name, port, task, repeat):
+    """Return the fastest of the runs, the slowest ones are noise."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(sys.path)
+    best = {}
+    for _ in range(repeat):
+        out = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                CHILD,
+                f"{PREFIX}.modules.{name}",
+                str(port),
+                json.dumps(task),
+            ],
+            env=env,
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(out.splitlines()[-1])
+        for key, value in result.items():
+            if key == "import_module":
+                best[key] = value
+            else:
+                best[key] = min(best.get(key, value), value)
+    return best
+
+
+def check_budget(name, result, args, baseline):
+    errors = []
+    for key, limit in [
+        ("import", args.max_import),
+        ("first_task", args.max_first_task),
+    ]:
+        if key in result and limit and result[key] * 1000 > limit:
+            errors.append(f"{name}: {key} {result[key] * 1000:.0f}ms > {limit}ms")
+        reference = baseline.get(name, {}).get(key)
+        if key in result and reference:
+            if result[key] > reference * (1 + args.tolerance):
+                errors.append(
+                    f"{name}: {key} {result[key] * 1000:.0f}ms, the baseline is"
+                    f" {reference * 1000:.0f}ms"
+                )
+    if result.get("import_module"):
+        errors.append(f"{name}: the warm task imported {result['import_module']}")
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("modules", nargs="*", help="only these modules")
+    parser.add_argument("--repeat", type=int, default=3, help="processes per module")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--max-import", type=float, default=300, help="in ms")
+    parser.add_argument("--max-first-task", type=float, default=1000, help="in ms")
+    parser.add_argument("--baseline", help="JSON file written by --save")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.2, help="allowed slowdown, 0.2 is 20%%"
+    )
+    parser.add_argument("--save", help="write the measures in this JSON file")
+    args = parser.parse_args()
+
+    for path in os.environ.get("ANSIBLE_COLLECTIONS_PATH", "").split(os.pathsep):
+        if path:
+            sys.path.insert(0, os.path.expanduser(path))
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as fd:
+            baseline = json.load(fd)
+    tasks = {}
+    for name, params, check_mode in WORKLOAD:
+        tasks.setdefault(name, dict(params, _check_mode=check_mode))
+
+    server = multiprocessing.Process(target=serve, args=(args.port,), daemon=True)
+    server.start()
+    asyncio.run(wait_for_port(args.port))
+
+    results, errors = {}, []
+    print(f"{'module':55} {'import':>8} {'first task':>11} {'warm task':>10}")
+    try:
+        for name in list_modules(args.modules):
+            result = results[name] = measure(
+                name, args.port, tasks.get(name), args.repeat
+            )
+            columns = [
+                f"{result[k] * 1000:.1f}ms" if k in result else "-"
+                for k in ["import", "first_task", "warm_task"]
+            ]
+            print(f"{name:55} {columns[0]:>8} {columns[1]:>11} {columns[2]:>10}")
+            errors += check_budget(name, result, args, baseline)
+    finally:
+        server.terminate()
+        server.join()
+
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as fd:
+            json.dump(results, fd, indent=2, sort_keys=True)
+    for error in errors:
+        print(f"FAILED: {error}")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
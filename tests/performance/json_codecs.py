@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""Compare the JSON codecs supported by vmware_rest on vCenter payloads.
+
+The payloads are read from the log files written by the modules with
+vcenter_rest_log_file (or VMWARE_REST_LOG_FILE), in the text or the .jsonl
+format, or from plain JSON files.
+Without any file, synthetic answers shaped like the ones of
+/api/vcenter/vm, /api/content/library/item and
+/api/appliance/monitoring/query are used.
+
+    python tests/performance/json_codecs.py /tmp/vmware_rest.log
+"""
+
+import argparse
+import importlib
+import json
+import timeit
+
+# Same order of preference as plugins/module_utils/vmware_rest.py
+JSON_CODECS = ["orjson", "ujson", "json"]
+
+
+def load_codecs():
+    codecs = {}
+    for name in JSON_CODECS:
+        try:
+            lib = importlib.import_module(name)
+        except ImportError:
+            print(f"{name}: not installed")
+            continue
+        if name == "orjson":
+            codecs[name] = (lib.loads, lambda obj, lib=lib: lib.dumps(obj).decode())
+        else:
+            codecs[name] = (lib.loads, lib.dumps)
+    return codecs
+
+
+def read_payloads(path):
+    """Return the JSON answers recorded in a REST log file, or a JSON file."""
+    with open(path, encoding="utf-8") as fd:
+        content = fd.read()
+    try:
+        return [content] if json.loads(content) is not None else []
+    except ValueError:
+        pass
+    payloads = []
+    for line in content.splitlines():
+        if line.startswith("{"):  # a .jsonl REST log
+            response = json.loads(line)["response"]
+            if "json" in response:
+                payloads.append(json.dumps(response["json"]))
+            continue
+        if not line.startswith("  answer: "):
+            continue
+        answer = line[len("  answer: ") :]
+        try:
+            json.loads(answer)
+        except ValueError:
+            continue
+        payloads.append(answer)
+    return payloads
+
+
+def synthetic_payloads(size):
+    vms = [
+        {
+            "memory_size_MiB": 4096,
+            "vm": f"vm-{i}",
+            "name": f"test_vm_{i}",
+            "power_state": "POWERED_ON" if i % 3 else "POWERED_OFF",
+            "cpu_count": 2,
+        }
+        for i in range(size)
+    ]
+    items = [
+        {
+            "id": f"5d2b1c6e-{i:04x}-4b7a-9d55-2e1f6a3c8b90",
+            "name": f"golden-image-{i}",
+            "type": "ovf",
+            "library_id": "e6b6b1a6-6f0d-4e2b-8bd4-1c8e5a7c1b2d",
+            "size": 1024 * 1024 * i,
+            "cached": True,
+            "content_version": "2",
+            "metadata_version": "1",
+            "description": "Golden image édition",
+            "creation_time": "2026-01-01T12:00:00.000Z",
+            "last_modified_time": "2026-01-02T12:00:00.000Z",
+        }
+        for i in range(size // 4)
+    ]
+    monitoring = [
+        {
+            "name": f"cpu.util.cpu{cpu}",
+            "interval": "MINUTES5",
+            "function": "AVG",
+            "start_time": "2026-01-01T00:00:00.000Z",
+            "end_time": "2026-01-02T00:00:00.000Z",
+            "data": [str(round(i * 0.37 % 100, 2)) for i in range(288)],
+        }
+        for cpu in range(16)
+    ]
+    return {
+        "/api/vcenter/vm": json.dumps(vms),
+        "/api/content/library/item": json.dumps(items),
+        "/api/appliance/monitoring/query": json.dumps(monitoring),
+    }
+
+
+def bench(codecs, name, payload, number):
+    data = json.loads(payload)
+    print(f"{name} ({len(payload)} bytes)")
+    for codec, (loads, dumps) in codecs.items():
+        assert loads(payload) == data, codec
+        decode = min(timeit.repeat(lambda: loads(payload), number=number, repeat=5))
+        encode = min(timeit.repeat(lambda: dumps(data), number=number, repeat=5))
+        print(
+            f"  {codec:8} loads: {decode / number * 1e6:10.1f}us"
+            f"  dumps: {encode / number * 1e6:10.1f}us"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("files", nargs="*", help="REST log files or JSON files")
+    parser.add_argument(
+        "--size", type=int, default=4000, help="number of VMs of the synthetic data"
+    )
+    parser.add_argument("--number", type=int, default=20, help="runs per measure")
+    args = parser.parse_args()
+
+    codecs = load_codecs()
+    if args.files:
+        payloads = {}
+        for path in args.files:
+            for i, payload in enumerate(read_payloads(path)):
+                payloads[f"{path}#{i}"] = payload
+        # Only the large answers matter, the small ones are dominated by the I/O
+        payloads = dict(sorted(payloads.items(), key=lambda item: -len(item[1]))[:10])
+    else:
+        payloads = synthetic_payloads(args.size)
+    for name, payload in payloads.items():
+        bench(codecs, name, payload, args.number)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""Measure the payload of the modules, as AnsiballZ ships it on each task.
+
+Without turbo, the source of the module is deflated in the AnsiballZ zip
+file, sent to the target and compiled there, since the zip file has no
+bytecode. For each module, the script reports the size of the source, its
+deflated size and the time to compile it.
+
+    python tests/performance/payload.py
+    python tests/performance/payload.py plugins/modules/vcenter_vm.py
+"""
+
+import argparse
+import glob
+import os
+import timeit
+import zlib
+
+MODULES = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "plugins", "modules"
+)
+
+
+def measure(path, number):
+    with open(path, "rb") as fd:
+        source = fd.read()
+    # zipfile.ZIP_DEFLATED uses the default level of zlib
+    deflated = zlib.compressobj(-1, zlib.DEFLATED, -15)
+    size = len(deflated.compress(source) + deflated.flush())
+    compile_time = min(
+        timeit.repeat(lambda: compile(source, path, "exec"), number=number, repeat=5)
+    )
+    return len(source), size, compile_time / number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("files", nargs="*", help="by default, all the modules")
+    parser.add_argument("--number", type=int, default=20, help="runs per measure")
+    parser.add_argument("--top", type=int, default=10, help="largest modules to list")
+    args = parser.parse_args()
+
+    files = args.files or sorted(glob.glob(os.path.join(MODULES, "*.py")))
+    results = {path: measure(path, args.number) for path in files}
+    largest = sorted(results.items(), key=lambda item: -item[1][0])
+    print(f"{'module':50} {'source':>9} {'deflated':>9} {'compile':>9}")
+    for path, (size, deflated, compile_time) in largest[: args.top]:
+        name = os.path.basename(path)
+        print(f"{name:50} {size:9} {deflated:9} {compile_time * 1000:7.2f}ms")
+    sizes, deflated, compile_times = zip(*results.values())
+    print(
+        f"{f'total ({len(results)} modules)':50} {sum(sizes):9} {sum(deflated):9}"
+        f" {sum(compile_times) * 1000:7.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
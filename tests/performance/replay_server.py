@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""Serve the answers recorded in a .jsonl REST log, as a fake vCenter.
+
+Record a playbook run against a real vCenter with a REST log ending in .jsonl:
+
+    VMWARE_REST_LOG_FILE=/tmp/recording.jsonl ansible-playbook site.yml
+
+Then replay it offline:
+
+    python tests/performance/replay_server.py /tmp/recording.jsonl --port 8443
+    VMWARE_HOST=127.0.0.1:8443 VMWARE_VALIDATE_CERTS=no ansible-playbook site.yml
+
+A request is matched with the recorded ones on its method, path, query string
+and body, then on its method, path and query string only. When the same
+request has been recorded several times, the answers are served in order, and
+the last one is repeated. --latency replays the recorded durations, to profile
+a change with the timing of the production traffic.
+
+Only the JSON bodies are recorded, the other answers, e.g: a download, are
+replayed with as many zero bytes as they had.
+"""
+
+import argparse
+import asyncio
+import collections
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import urllib.parse
+
+from aiohttp import web
+
+LOGIN_PATH = "/rest/com/vmware/cis/session"
+
+
+def request_key(method, url, body):
+    parsed = urllib.parse.urlsplit(url)
+    query = urllib.parse.urlencode(sorted(urllib.parse.parse_qsl(parsed.query)))
+    return (method, parsed.path, query, body)
+
+
+def record_body(record):
+    if "json" in record:
+        return json.dumps(record["json"], sort_keys=True)
+    return None
+
+
+def check_record(record):
+    """Refuse an answer recorded without its JSON body, it cannot be replayed."""
+    response = record["response"]
+    headers = {k.lower(): v for k, v in response["headers"].items()}
+    if (
+        headers.get("content-type", "").startswith("application/json")
+        and headers.get("content-length") != "0"
+        and "json" not in response
+    ):
+        request = record["request"]
+        raise ValueError(
+            f"the JSON answer of {request['method']} {request['url']} was not recorded"
+        )
+
+
+def normalize_body(content):
+    if not content:
+        return None
+    try:
+        return json.dumps(json.loads(content), sort_keys=True)
+    except ValueError:
+        return content.decode("utf-8", errors="replace")
+
+
+class Recording:
+    def __init__(self, paths):
+        self.answers = collections.defaultdict(list)
+        self.served = collections.Counter()
+        self.missed = collections.Counter()
+        self.count = 0
+        for path in paths:
+            with open(path, encoding="utf-8") as fd:
+                for number, line in enumerate(fd, 1):
+                    if not line.strip():
+                        continue
+                    record = json.loads(line)
+                    try:
+                        check_record(record)
+                    except ValueError as e:
+                        raise ValueError(f"{path}:{number}: {e}") from None
+                    self.add(record)
+
+    def add(self, record):
+        request = record["request"]
+        body = record_body(request)
+        key = request_key(request["method"], request["url"], body)
+        self.answers[key].append(record)
+        self.answers[key[:3] + (None,)].append(record)
+        self.count += 1
+
+    def find(self, method, url, body):
+        key = request_key(method, url, body)
+        for k in [key, key[:3] + (None,)]:
+            if self.answers.get(k):
+                records = self.answers[k]
+                record = records[min(self.served[k], len(records) - 1)]
+                self.served[k] += 1
+                return record
+        self.missed[key[:3]] += 1
+        return None
+
+
+def build_response(record):
+    response = record["response"]
+    headers = {
+        k: v
+        for k, v in response["headers"].items()
+        if k.lower() not in ["content-length", "transfer-encoding", "content-encoding"]
+    }
+    body = record_body(response)
+    if body is None:
+        # Only the size of the other answers is recorded, e.g: a download
+        body = bytes(response.get("size", 0))
+    else:
+        body = body.encode()
+    return web.Response(status=response["status"], headers=headers, body=body)
+
+
+def make_app(recording, latency):
+    async def handler(request):
+        body = normalize_body(await request.read())
+        record = recording.find(request.method, str(request.rel_url), body)
+        if not record and request.path == LOGIN_PATH:
+            return web.json_response({"value": "replayed-session"})
+        if not record:
+            print(f"not recorded: {request.method} {request.rel_url}", file=sys.stderr)
+            return web.json_response(
+                {
+                    "error_type": "NOT_FOUND",
+                    "messages": [{"default_message": "not recorded"}],
+                },
+                status=404,
+            )
+        if latency:
+            await asyncio.sleep(record.get("duration", 0) * latency)
+        return build_response(record)
+
+    app = web.Application(client_max_size=1024**3)
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app
+
+
+def self_signed_context(directory):
+    cert = os.path.join(directory, "cert.pem")
+    key = os.path.join(directory, "key.pem")
+    subprocess.run(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+        ],
+        check=True,
+        capture_output=True,
+    )
+    return cert, key
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("recordings", nargs="+", help=".jsonl REST logs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--cert", help="TLS certificate, self-signed by default")
+    parser.add_argument("--key", help="key of the TLS certificate")
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0,
+        help="replay the recorded durations, multiplied by this factor",
+    )
+    args = parser.parse_args()
+
+    try:
+        recording = Recording(args.recordings)
+    except ValueError as e:
+        sys.exit(f"Cannot replay {e}")
+    print(f"{recording.count} answers loaded")
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = (args.cert, args.key) if args.cert else self_signed_context(tmp)
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert, key)
+        try:
+            web.run_app(
+                make_app(recording, args.latency),
+                host=args.host,
+                port=args.port,
+                ssl_context=context,
+            )
+        finally:
+            for (method, path, query), count in recording.missed.most_common():
+                print(f"missed {count}x: {method} {path}?{query}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""Soak test of the modules, the way the turbo daemon runs them.
+
+The modules are run again and again in a single process and event loop
+against a local mock vCenter, like the daemon does over a day of playbooks.
+After each phase, the RSS, the open file descriptors, the live ClientSession
+objects and the asyncio tasks are reported, and the tracemalloc snapshots of
+the phases are compared to find what keeps growing.
+
+The collection and cloud.common must be importable, for instance:
+
+    ANSIBLE_COLLECTIONS_PATH=~/.ansible/collections python tests/performance/soak.py
+
+The first phase is a warm-up, it fills the connection pools and the caches.
+The script fails if the RSS grows by more than --max-growth MiB between the
+end of the second phase and the end of the last one, or if the sessions or the
+tasks are not released. The RSS also counts the traces of tracemalloc, use
+--frames 0 to check the RSS alone, then a deeper --frames to find what grows.
+"""
+
+import argparse
+import asyncio
+import gc
+import importlib
+import json
+import multiprocessing
+import os
+import ssl
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from aiohttp import ClientSession, web
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from replay_server import self_signed_context  # noqa: E402
+
+PREFIX = "ansible_collections.vmware.vmware_rest.plugins"
+VMS = [f"vm-{i}" for i in range(200)]
+
+
+def json_response(data, status=200):
+    # vCenter does not add a charset, and the modules expect this exact value
+    return web.Response(
+        body=json.dumps(data), status=status, content_type="application/json"
+    )
+
+
+def mock_vcenter():
+    async def login(request):
+        return json_response({"value": "soak-session"})
+
+    async def vm_list(request):
+        return json_response(
+            [
+                {"vm": vm, "name": vm, "power_state": "POWERED_ON", "cpu_count": 2}
+                for vm in request.query.getall("vms", VMS)
+            ]
+        )
+
+    async def vm(request):
+        return json_response(
+            {"name": request.match_info["vm"], "cpu": {"count": 2}, "cdroms": {}}
+        )
+
+    async def power(request):
+        return json_response({"state": "POWERED_ON"})
+
+    async def ntp(request):
+        return json_response(["pool.ntp.org"])
+
+    async def networking(request):
+        return json_response({"dns_values": {"host_name": "guest"}})
+
+    async def interfaces(request):
+        return json_response(
+            [
+                {
+                    "nic": "4000",
+                    "mac_address": "00:50:56:00:00:01",
+                    "ip": {"ip_addresses": [{"ip_address": "10.0.0.1"}]},
+                }
+            ]
+        )
+
+    async def customization(request):
+        return json_response({})
+
+    async def no_content(request):
+        await request.read()
+        return web.Response(status=204)
+
+    app = web.Application()
+    app.router.add_post("/rest/com/vmware/cis/session", login)
+    app.router.add_get("/api/vcenter/vm", vm_list)
+    app.router.add_get("/api/vcenter/vm/{vm}", vm)
+    app.router.add_get("/api/vcenter/vm/{vm}/power", power)
+    app.router.add_get("/api/appliance/ntp", ntp)
+    app.router.add_put("/api/appliance/ntp", no_content)
+    app.router.add_get("/api/vcenter/vm/{vm}/guest/networking", networking)
+    app.router.add_get("/api/vcenter/vm/{vm}/guest/networking/interfaces", interfaces)
+    app.router.add_get("/api/vcenter/vm/{vm}/guest/networking/routes", interfaces)
+    app.router.add_get("/api/vcenter/vm/{vm}/guest/customization", customization)
+    app.router.add_put("/api/vcenter/vm/{vm}/guest/customization", no_content)
+    return app
+
+
+def serve(port):
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = self_signed_context(tmp)
+        context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        context.load_cert_chain(cert, key)
+    web.run_app(
+        mock_vcenter(),
+        host="127.0.0.1",
+        port=port,
+        ssl_context=context,
+        print=None,
+        access_log=None,
+    )
+
+
+async def wait_for_port(port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return
+
+
+class Module:
+    """What entry_point() uses of AnsibleModule."""
+
+    def __init__(self, params, check_mode=False):
+        self.params = params
+        self.check_mode = check_mode
+        self._diff = False
+
+
+# The module, its parameters and whether it runs in check mode
+WORKLOAD = [
+    ("vcenter_vm_info", {}, False),
+    ("vcenter_vm_info", {"vm": "vm-1"}, False),
+    ("vcenter_vm_power_info", {"vm": "vm-2"}, False),
+    ("vcenter_vm_power_info", {"vm": "vm-4", "task_timeout": 30}, False),
+    ("appliance_ntp_info", {}, False),
+    ("appliance_ntp", {"servers": ["pool.ntp.org"], "state": "set"}, False),
+    ("appliance_ntp", {"servers": ["time.example.com"], "state": "set"}, True),
+    ("vcenter_vm_guest_networking_inventory_info", {"vms": VMS[:20]}, False),
+    (
+        "vcenter_vm_guest_customization",
+        {
+            "vm": "vm-3",
+            "configuration_spec": {"linux_config": {"domain": "example.com"}},
+            "global_DNS_settings": {},
+            "interfaces": [],
+        },
+        True,
+    ),
+]
+
+
+def load_workload():
+    workload = []
+    for name, params, check_mode in WORKLOAD:
+        module = importlib.import_module(f"{PREFIX}.modules.{name}")
+        defaults = {
+            k: v.get("default") for k, v in module.prepare_argument_spec().items()
+        }
+        workload.append((module, dict(defaults, **params), check_mode))
+    return workload
+
+
+async def run_task(vmware_rest, module, params, check_mode):
+    """Like the main() of a module, without the argument parsing."""
+    session = await vmware_rest.open_session(
+        vcenter_hostname=params["vcenter_hostname"],
+        vcenter_username=params["vcenter_username"],
+        vcenter_password=params["vcenter_password"],
+        validate_certs=params["vcenter_validate_certs"],
+        log_file=params["vcenter_rest_log_file"],
+    )
+    fake = Module(dict(params), check_mode)
+    if check_mode:
+        task = vmware_rest.plan(module.entry_point, fake, session)
+    else:
+        task = module.entry_point(fake, session)
+    result = await vmware_rest.run_with_deadline(task, params["task_timeout"])
+    if result.get("failed"):
+        raise RuntimeError(f"{module.__name__} failed: {result}")
+
+
+def measure():
+    gc.collect()
+    with open("/proc/self/statm") as fd:
+        rss = int(fd.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    return {
+        "rss": rss / 1024 / 1024,
+        "fds": len(os.listdir("/proc/self/fd")),
+        "sessions": sum(
+            1 for o in gc.get_objects() if isinstance(o, ClientSession) and not o.closed
+        ),
+        "tasks": len(asyncio.all_tasks()),
+        "traced": tracemalloc.get_traced_memory()[0] / 1024 / 1024,
+    }
+
+
+def report_growth(before, after, limit):
+    print("  largest allocation growths:")
+    for stat in after.compare_to(before, "lineno")[:limit]:
+        if stat.size_diff > 0:
+            print(
+                f"    {stat.size_diff / 1024:9.1f} KiB {stat.count_diff:+7d} {stat.traceback}"
+            )
+
+
+async def soak(args):
+    vmware_rest = importlib.import_module(f"{PREFIX}.module_utils.vmware_rest")
+    workload = load_workload()
+
+    # The mock runs in its own process, so its memory, sockets and tasks
+    # are not counted with the ones of the modules
+    server = multiprocessing.Process(target=serve, args=(args.port,), daemon=True)
+    server.start()
+    await wait_for_port(args.port)
+
+    base = {
+        "vcenter_hostname": f"127.0.0.1:{args.port}",
+        "vcenter_password": "soak",
+        "vcenter_validate_certs": False,
+        "vcenter_rest_log_file": None,
+        "session_timeout": None,
+    }
+    semaphore = asyncio.Semaphore(args.concurrency)
+    counter = iter(range(sys.maxsize))
+
+    async def one():
+        i = next(counter)
+        module, params, check_mode = workload[i % len(workload)]
+        # Each user gets its own session in the pool
+        params = dict(params, **base, vcenter_username=f"user{i % args.users}")
+        async with semaphore:
+            await run_task(vmware_rest, module, params, check_mode)
+
+    if args.frames:
+        tracemalloc.start(args.frames)
+    print(
+        f"{'phase':>5} {'tasks/s':>8} {'RSS MiB':>8} {'traced':>8} {'fds':>5}"
+        f" {'sessions':>8} {'asyncio':>7}"
+    )
+    samples, snapshots = [], []
+    for phase in range(args.phases):
+        start = time.monotonic()
+        await asyncio.gather(*[one() for _ in range(args.tasks)])
+        rate = args.tasks / (time.monotonic() - start)
+        sample = measure()
+        samples.append(sample)
+        if args.frames:
+            snapshots.append(tracemalloc.take_snapshot())
+        print(
+            f"{phase:5} {rate:8.0f} {sample['rss']:8.1f} {sample['traced']:8.1f}"
+            f" {sample['fds']:5} {sample['sessions']:8} {sample['tasks']:7}"
+        )
+        if len(snapshots) > 1:
+            report_growth(snapshots[-2], snapshots[-1], args.top)
+
+    for session in vmware_rest.open_session._pool.values():
+        connector = session.connector  # not owned by the session
+        await session.close()
+        await connector.close()
+    server.terminate()
+    server.join()
+
+    # The first phase fills the connection pools and the caches
+    baseline = samples[1] if len(samples) > 2 else samples[0]
+    last = samples[-1]
+    errors = []
+    growth = last["rss"] - baseline["rss"]
+    if growth > args.max_growth:
+        errors.append(f"the RSS grew by {growth:.1f} MiB after the warm-up")
+    if last["sessions"] > args.users:
+        errors.append(f"{last['sessions']} sessions for {args.users} users")
+    if last["tasks"] > baseline["tasks"]:
+        errors.append(f"{last['tasks'] - baseline['tasks']} tasks leaked")
+    # A connection pool may still open a socket or two with a short phase
+    if last["fds"] > baseline["fds"] + args.users:
+        errors.append(f"{last['fds'] - baseline['fds']} file descriptors leaked")
+    for error in errors:
+        print(f"FAILED: {error}")
+    return not errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--phases", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=5000, help="tasks per phase")
+    parser.add_argument("--concurrency", type=int, default=50, help="tasks at once")
+    parser.add_argument("--users", type=int, default=4, help="distinct credentials")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument(
+        "--max-growth", type=float, default=50, help="maximum RSS growth, in MiB"
+    )
+    parser.add_argument(
+        "--frames", type=int, default=1, help="tracemalloc depth, 0 to disable it"
+    )
+    parser.add_argument("--top", type=int, default=5, help="growths to report")
+    args = parser.parse_args()
+
+    for path in os.environ.get("ANSIBLE_COLLECTIONS_PATH", "").split(os.pathsep):
+        if path:
+            sys.path.insert(0, os.path.expanduser(path))
+    sys.exit(0 if asyncio.run(soak(args)) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# Copyright: (c) 2026, Ansible Project
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+"""Move the documentation of the modules to adjacent YAML files.
+
+The DOCUMENTATION, EXAMPLES and RETURN strings are not used to run a module,
+but AnsiballZ ships them and the target compiles them on each task. They are
+moved to a <module>.yml file next to the module, where ansible-doc finds
+them. Run it after content_builder or inject_RETURN.py, which write them in
+the module:
+
+    python tests/performance/split_docs.py plugins/modules/*.py
+
+The YAML file is checked to load to the same documentation before the
+module is changed. payload.py measures the result.
+"""
+
+import argparse
+import ast
+
+import yaml
+
+KEYS = ["DOCUMENTATION", "EXAMPLES", "RETURN"]
+
+
+def indent(text):
+    return "\n".join(
+        f"  {line}" if line.strip() else "" for line in text.strip("\n").split("\n")
+    )
+
+
+def find_docs(tree):
+    """Return the first line, the last line and the value of each string."""
+    found = {}
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        name = getattr(node.targets[0], "id", None)
+        if name in KEYS:
+            found[name] = (node.lineno, node.end_lineno, node.value.value)
+    return found
+
+
+def build_sidecar(header, doc, examples, returns):
+    sidecar = "\n".join(header) + "\n\n"
+    sidecar += "DOCUMENTATION:\n" + indent(doc) + "\n\n"
+    sidecar += "EXAMPLES: |\n" + indent(examples) + "\n\n"
+    sidecar += "RETURN:\n" + (indent(returns) + "\n" if returns.strip() else "")
+
+    loaded = yaml.safe_load(sidecar)
+    if (
+        loaded["DOCUMENTATION"] != yaml.safe_load(doc)
+        or loaded["EXAMPLES"].strip() != examples.strip()
+        or loaded["RETURN"] != yaml.safe_load(returns)
+    ):
+        raise ValueError("the YAML file does not load to the same documentation")
+    return sidecar
+
+
+def split(path):
+    with open(path, encoding="utf-8") as fd:
+        source = fd.read()
+    found = find_docs(ast.parse(source))
+    if not found:
+        return False
+    if sorted(found) != sorted(KEYS):
+        raise ValueError(f"{path}: {sorted(found)} instead of {KEYS}")
+
+    lines = source.split("\n")
+    header = []
+    for line in lines:
+        if not line.startswith("#"):
+            break
+        if not line.startswith("#!") and "coding:" not in line:
+            header.append(line)
+    sidecar = build_sidecar(header, *(found[k][2] for k in KEYS))
+
+    # Remove the strings and the blank lines after them
+    removed = set()
+    for start, end, _value in found.values():
+        removed.update(range(start - 1, end))
+        while end < len(lines) and not lines[end].strip():
+            removed.add(end)
+            end += 1
+    with open(path[: -len(".py")] + ".yml", "w", encoding="utf-8") as fd:
+        fd.write(sidecar)
+    with open(path, "w", encoding="utf-8") as fd:
+        fd.write("\n".join(line for i, line in enumerate(lines) if i not in removed))
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("modules", nargs="+", help="the .py files of the modules")
+    args = parser.parse_args()
+
+    for path in args.modules:
+        if split(path):
+            print(f"{path}: moved to {path[: -len('.py')]}.yml")
+
+
+if __name__ == "__main__":
+    main()